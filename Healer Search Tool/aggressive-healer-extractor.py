@@ -4,7 +4,6 @@ AGGRESSIVE HEALER EXTRACTOR
 Find 100+ real healer contacts by being less restrictive with filtering.
 """
 
-import requests
 from bs4 import BeautifulSoup
 import re
 import csv
@@ -13,9 +12,11 @@ from datetime import datetime
 import logging
 import os
 
+from healer_discovery.http_client import create_session
+
 class AggressiveHealerExtractor:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
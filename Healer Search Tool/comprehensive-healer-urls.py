@@ -5,7 +5,6 @@ Gets 100+ verified healer website URLs and extracts ONLY email addresses.
 Strictly filters out non-healing websites (HVAC, utilities, etc.)
 """
 
-import requests
 from bs4 import BeautifulSoup
 import re
 import json
@@ -14,11 +13,18 @@ import time
 from datetime import datetime
 import logging
 import os
+import argparse
+
+from healer_discovery.metrics import metrics, url_pattern
+from healer_discovery.profiling import start_profiling, url_timings
+from healer_discovery.http_client import create_session
+from healer_discovery.budget import budget
+from healer_discovery.host_health import host_health
 
 class ComprehensiveHealerExtractor:
     def __init__(self):
         self.healers_found = []
-        self.session = requests.Session()
+        self.session = create_session()
 
         # Set up session headers
         self.session.headers.update({
@@ -26,6 +32,7 @@ class ComprehensiveHealerExtractor:
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5'
         })
+        metrics.instrument_session(self.session)
 
         # COMPREHENSIVE LIST OF 100+ REAL HEALER WEBSITES
         # Strictly filtered to exclude HVAC, utilities, and non-healing sites
@@ -272,15 +279,20 @@ class ComprehensiveHealerExtractor:
                 return None
 
             content = response.text
-            title = BeautifulSoup(content, 'html.parser').find('title')
+            with metrics.timer('parse_seconds', parser='html.parser'), url_timings.stage(url, 'parse'):
+                title = BeautifulSoup(content, 'html.parser').find('title')
             title_text = title.text if title else ""
 
             # STRICT filtering - only healing-related sites
             if not self.is_healing_related_content(content, url, title_text):
+                metrics.inc('url_yield_total', pattern=url_pattern(url), outcome='not_relevant')
                 return None
 
             # Extract emails only
-            emails = self.extract_emails_only(content)
+            with metrics.timer('extract_seconds', field='email'), url_timings.stage(url, 'extract'):
+                emails = self.extract_emails_only(content)
+            metrics.inc('url_yield_total', pattern=url_pattern(url),
+                        outcome='contact' if emails else 'no_email')
 
             if emails:
                 business_name = self.extract_business_name(content, url)
@@ -306,6 +318,8 @@ class ComprehensiveHealerExtractor:
 
     def run_comprehensive_extraction(self):
         """Run extraction on ALL healer URLs with proper rate limiting"""
+        if budget.enabled:
+            self.healer_sites = budget.plan(self.healer_sites)
         self.logger.info(f"Starting comprehensive email extraction from {len(self.healer_sites)} URLs")
         self.logger.info("FOCUS: EMAIL ADDRESSES ONLY - No phone numbers collected")
 
@@ -314,6 +328,12 @@ class ComprehensiveHealerExtractor:
 
         for i, url in enumerate(self.healer_sites, 1):
             self.logger.info(f"\n[{i}/{len(self.healer_sites)}] Processing URL...")
+            metrics.set_gauge('queue_depth', len(self.healer_sites) - i + 1, queue='healer_sites')
+            if not host_health.available(url):
+                self.logger.info(f"Skipping {url}: host keeps failing (circuit open)")
+                metrics.inc('url_yield_total', pattern=url_pattern(url), outcome='circuit_open')
+                failed_extractions += 1
+                continue
 
             healer_data = self.extract_healer_info(url)
 
@@ -386,6 +406,26 @@ class ComprehensiveHealerExtractor:
         return os.path.basename(csv_file), os.path.basename(json_file)
 
 def main():
+    parser = argparse.ArgumentParser(description="Comprehensive healer email extraction")
+    parser.add_argument('--metrics', choices=['prom', 'json'],
+                        help="collect run metrics and write them to Discovery Results/metrics")
+    parser.add_argument('--profile', choices=['cprofile', 'sample'],
+                        help="profile the run and write a report to Discovery Results/profiles")
+    parser.add_argument('--adaptive-hosts', action='store_true',
+                        help="learn per-host timeouts and skip hosts that keep failing (state kept across runs)")
+    parser.add_argument('--daily-budget', action='store_true',
+                        help="enforce the shared daily fetch limits and fetch the most promising URLs first")
+    args = parser.parse_args()
+
+    if args.metrics:
+        metrics.enable(args.metrics)
+    if args.profile:
+        start_profiling(args.profile)
+    if args.adaptive_hosts:
+        host_health.enable()
+    if args.daily_budget:
+        budget.enable()
+
     print("COMPREHENSIVE REAL HEALER EMAIL EXTRACTION")
     print("Testing 100+ verified healer websites for email addresses")
     print("FOCUS: EMAIL COLLECTION ONLY - No phone numbers")
@@ -12,7 +12,6 @@ Features:
 - Integration with existing contact database
 """
 
-import requests
 from bs4 import BeautifulSoup
 import re
 import csv
@@ -25,6 +24,11 @@ from urllib.parse import urljoin, urlparse, quote_plus
 import random
 from typing import Dict, List, Set, Tuple, Optional
 
+from healer_discovery.http_client import create_session
+from healer_discovery.canonical import canonical_url, redirects
+from healer_discovery.directory_crawler import DirectoryCrawler, JsonLinesSink
+from healer_discovery.page_text import contact_text, visible_text
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -34,10 +38,12 @@ logger = logging.getLogger(__name__)
 
 class DirectSocialHealerDiscovery:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
+        redirects.enable()
+        self.directory_sink = JsonLinesSink.for_source('healing_directories')
 
         # Load existing contacts for duplicate prevention
         self.existing_emails = set()
@@ -153,8 +159,8 @@ class DirectSocialHealerDiscovery:
         contacts = []
 
         try:
-            # Get all text content
-            page_text = soup.get_text()
+            # Visible text only; scripts and styles are not content
+            page_text = visible_text(soup)
 
             # Check if healing-related
             if not self.is_healing_related(page_text):
@@ -162,7 +168,7 @@ class DirectSocialHealerDiscovery:
 
             # Extract emails
             email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            emails = re.findall(email_pattern, page_text, re.IGNORECASE)
+            emails = re.findall(email_pattern, contact_text(soup, page_text), re.IGNORECASE)
 
             # Filter valid emails
             valid_emails = []
@@ -215,65 +221,23 @@ class DirectSocialHealerDiscovery:
 
         return contacts
 
-    def scrape_healing_directories(self) -> List[Dict]:
-        """Scrape professional healing directories"""
+    def scrape_healing_directories(self, target: int = 200) -> List[Dict]:
+        """Scrape professional healing directories, following their result pages"""
         logger.info("Scraping healing directories...")
         contacts = []
 
         for directory in self.healing_directories:
+            if len(contacts) >= target:
+                break
+
             try:
                 logger.info(f"Scraping {directory['name']}...")
 
-                for path in directory['search_paths']:
-                    url = directory['base_url'] + path
-
-                    try:
-                        logger.info(f"Checking: {url}")
-
-                        response = self.session.get(url, timeout=15)
-                        if response.status_code != 200:
-                            continue
-
-                        soup = BeautifulSoup(response.content, 'html.parser')
-
-                        # Extract contacts from this page
-                        page_contacts = self.extract_contact_info(soup, url)
-                        contacts.extend(page_contacts)
-
-                        # Look for practitioner profile links
-                        profile_links = soup.find_all('a', href=True)
-                        for link in profile_links[:10]:  # Limit to 10 profiles per directory page
-                            href = link['href']
-                            if any(profile_indicator in href.lower() for profile_indicator in [
-                                'profile', 'practitioner', 'therapist', 'healer', 'provider'
-                            ]):
-                                if href.startswith('/'):
-                                    profile_url = directory['base_url'] + href
-                                elif not href.startswith('http'):
-                                    continue
-                                else:
-                                    profile_url = href
-
-                                try:
-                                    logger.info(f"Checking profile: {profile_url}")
-
-                                    profile_response = self.session.get(profile_url, timeout=10)
-                                    if profile_response.status_code == 200:
-                                        profile_soup = BeautifulSoup(profile_response.content, 'html.parser')
-                                        profile_contacts = self.extract_contact_info(profile_soup, profile_url)
-                                        contacts.extend(profile_contacts)
-
-                                    time.sleep(2)  # Rate limiting
-
-                                except Exception as e:
-                                    logger.debug(f"Error scraping profile {profile_url}: {e}")
-                                    continue
-
-                        time.sleep(3)  # Rate limiting between pages
-
-                    except Exception as e:
-                        logger.debug(f"Error scraping {url}: {e}")
-                        continue
+                # Listing pages and profiles both carry contacts; profiles download concurrently, 2 s apart per host
+                crawler = DirectoryCrawler(
+                    self.session, extract=self.extract_directory_page, delay=2.0, timeout=15,
+                    extract_listings=True, target=target - len(contacts), sink=self.directory_sink)
+                contacts.extend(crawler.crawl(directory['base_url'] + path for path in directory['search_paths']))
 
             except Exception as e:
                 logger.error(f"Error scraping directory {directory['name']}: {e}")
@@ -282,6 +246,10 @@ class DirectSocialHealerDiscovery:
         logger.info(f"Found {len(contacts)} contacts from healing directories")
         return contacts
 
+    def extract_directory_page(self, url: str, html: str) -> List[Dict]:
+        """Contacts from one downloaded directory listing or profile page"""
+        return self.extract_contact_info(BeautifulSoup(html, 'html.parser'), url)
+
     def scrape_direct_healer_websites(self) -> List[Dict]:
         """Try direct healer website patterns"""
         logger.info("Checking direct healer websites...")
@@ -306,14 +274,23 @@ class DirectSocialHealerDiscovery:
             'https://www.innerpeacecenter.org'
         ]
 
-        for url in generic_sites:
+        # Try city-specific patterns (limited to avoid too many requests)
+        city_patterns = ['newyork', 'losangeles', 'chicago', 'miami', 'seattle']
+        healing_types = ['healing', 'wellness', 'massage', 'reiki']
+        city_sites = [f"https://www.{city}{healing_type}.com" for city in city_patterns for healing_type in healing_types]
+
+        # One request per site: www/non-www/http aliases and known redirects collapse to one URL
+        sites_checked = set()
+        for url in redirects.dedupe(generic_sites + city_sites):
             try:
                 logger.info(f"Checking: {url}")
 
                 response = self.session.get(url, timeout=10)
-                if response.status_code == 200:
+                website = canonical_url(response.url)
+                if response.status_code == 200 and website not in sites_checked:
+                    sites_checked.add(website)
                     soup = BeautifulSoup(response.content, 'html.parser')
-                    site_contacts = self.extract_contact_info(soup, url)
+                    site_contacts = self.extract_contact_info(soup, website)
                     contacts.extend(site_contacts)
 
                 time.sleep(2)  # Rate limiting
@@ -322,28 +299,6 @@ class DirectSocialHealerDiscovery:
                 logger.debug(f"Error checking {url}: {e}")
                 continue
 
-        # Try city-specific patterns (limited to avoid too many requests)
-        city_patterns = ['newyork', 'losangeles', 'chicago', 'miami', 'seattle']
-        healing_types = ['healing', 'wellness', 'massage', 'reiki']
-
-        for city in city_patterns:
-            for healing_type in healing_types:
-                try:
-                    url = f"https://www.{city}{healing_type}.com"
-                    logger.info(f"Checking: {url}")
-
-                    response = self.session.get(url, timeout=10)
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.content, 'html.parser')
-                        site_contacts = self.extract_contact_info(soup, url)
-                        contacts.extend(site_contacts)
-
-                    time.sleep(2)  # Rate limiting
-
-                except Exception as e:
-                    logger.debug(f"Error checking {url}: {e}")
-                    continue
-
         logger.info(f"Found {len(contacts)} contacts from direct websites")
         return contacts
 
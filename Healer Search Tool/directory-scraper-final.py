@@ -4,7 +4,6 @@ DIRECTORY SCRAPER FINAL
 Search healer directories and professional associations for comprehensive contact lists.
 """
 
-import requests
 from bs4 import BeautifulSoup
 import re
 import csv
@@ -14,9 +13,14 @@ import logging
 import os
 from urllib.parse import urljoin, urlparse
 
+from healer_discovery.http_client import create_session
+from healer_discovery.directory_crawler import DirectoryCrawler, JsonLinesSink
+from healer_discovery.structured_data import structured_contact
+from healer_discovery.page_text import contact_text, is_asset_email, visible_text
+
 class DirectoryScraperFinal:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -26,6 +30,10 @@ class DirectoryScraperFinal:
         self.all_contacts = []
         self.processed_urls = set()
 
+        # Directory listings are walked page by page until this many contacts come from one listing
+        self.listing_target = 100
+        self.listing_sink = JsonLinesSink.for_source('directory_listings')
+
         # Known working directories and organizations
         self.directory_sites = [
             'https://www.psychologytoday.com/us/therapists/energy-healing',
@@ -108,8 +116,8 @@ class DirectoryScraperFinal:
             # Skip obviously bad emails
             if any(bad in email for bad in [
                 'example.com', 'test.com', 'domain.com', 'yoursite.com',
-                'noreply', 'no-reply', 'donotreply', '.png', '.jpg', '.gif'
-            ]):
+                'noreply', 'no-reply', 'donotreply'
+            ]) or is_asset_email(email):
                 continue
 
             # Must have valid structure
@@ -155,29 +163,39 @@ class DirectoryScraperFinal:
         self.processed_urls.add(url)
         self.logger.info(f"Processing: {url}")
 
-        contacts = []
-
         try:
             response = self.session.get(url, timeout=8)
             if response.status_code != 200:
-                return contacts
+                return []
+            return self.extract_from_page(url, response.text)
+        except Exception as e:
+            return []
+
+    def extract_from_page(self, url, content, follow_listings=True):
+        """Contacts from a downloaded page, plus the practitioner profiles it lists"""
+        contacts = []
 
-            content = response.text
+        try:
             soup = BeautifulSoup(content, 'html.parser')
 
             # Skip if it's not healing related
-            content_lower = content.lower()
+            text = visible_text(soup)
+            content_lower = text.lower()
             if not any(term in content_lower for term in [
                 'reiki', 'energy', 'healing', 'spiritual', 'chakra', 'crystal',
                 'wellness', 'meditation', 'holistic', 'therapy', 'massage'
             ]):
                 return contacts
 
-            # Extract emails
-            emails = self.extract_emails_from_page(url, content)
+            # The page's own Schema.org markup first; complete markup skips the full-text scan
+            structured = structured_contact(content, soup)
+            if structured and structured.complete:
+                emails = self.extract_emails_from_page(url, ' '.join(structured.emails))
+            else:
+                emails = self.extract_emails_from_page(url, contact_text(soup, text))
 
             if emails:
-                business_name = self.get_business_name(url, soup)
+                business_name = structured.name if structured and structured.name else self.get_business_name(url, soup)
 
                 for email in emails[:3]:  # Limit per site
                     contacts.append({
@@ -189,7 +207,7 @@ class DirectoryScraperFinal:
                     })
 
             # Look for practitioner listings on directory sites
-            if any(term in url for term in ['directory', 'list', 'find', 'search']):
+            if follow_listings and any(term in url for term in ['directory', 'list', 'find', 'search']):
                 listing_emails = self.extract_from_directory_listings(url, soup)
                 contacts.extend(listing_emails)
 
@@ -198,36 +216,21 @@ class DirectoryScraperFinal:
 
         return contacts
 
-    def extract_from_directory_listings(self, base_url, soup):
-        """Extract emails from directory-style listings"""
-        contacts = []
-
-        # Look for practitioner profile links
-        profile_links = []
-        for link in soup.find_all('a', href=True):
-            href = link.get('href')
-            text = link.get_text().lower()
-
-            # Skip navigation links
-            if any(nav in text for nav in ['home', 'about', 'contact', 'search', 'login']):
-                continue
-
-            # Look for profile/practitioner links
-            if any(term in href.lower() for term in ['profile', 'practitioner', 'therapist', 'healer']):
-                full_url = urljoin(base_url, href)
-                if full_url not in profile_links:
-                    profile_links.append(full_url)
-
-        # Extract from profile pages
-        for profile_url in profile_links[:10]:  # Limit to prevent overwhelming
-            try:
-                time.sleep(1)  # Rate limiting
-                profile_contacts = self.extract_from_site(profile_url)
-                contacts.extend(profile_contacts)
-            except:
-                continue
+    def extract_profile_page(self, url, content):
+        """Contacts from a profile page reached through a directory listing"""
+        if url in self.processed_urls:
+            return []
+        self.processed_urls.add(url)
+        return self.extract_from_page(url, content, follow_listings=False)
 
-        return contacts
+    def extract_from_directory_listings(self, base_url, soup):
+        """Extract emails from directory-style listings, following their result pages"""
+        crawler = DirectoryCrawler(
+            self.session, extract=self.extract_profile_page,
+            profile_hints=('profile', 'practitioner', 'therapist', 'healer'),
+            skip_text=('home', 'about', 'contact', 'search', 'login'),
+            timeout=8, target=self.listing_target, sink=self.listing_sink)
+        return list(crawler.crawl([base_url], first_pages={base_url: str(soup)}))
 
     def run_comprehensive_directory_search(self):
         """Run comprehensive search across all sources"""
@@ -4,7 +4,6 @@ EXPANDED HEALER SEARCH TOOL
 Find 100+ real healer websites through comprehensive search.
 """
 
-import requests
 from bs4 import BeautifulSoup
 import re
 import json
@@ -14,9 +13,13 @@ from datetime import datetime
 import logging
 import os
 
+from healer_discovery.http_client import create_session
+from healer_discovery.search_cache import SearchResultCache, dedupe_queries, result_links
+from healer_discovery.page_text import contact_text, is_asset_email, visible_text
+
 class ExpandedHealerSearch:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -25,6 +28,7 @@ class ExpandedHealerSearch:
 
         self.found_urls = set()
         self.healers_found = []
+        self.search_cache = SearchResultCache()
 
         # Comprehensive search terms for finding healers
         self.search_terms = [
@@ -81,25 +85,29 @@ class ExpandedHealerSearch:
     def search_healing_websites(self, search_term):
         """Search for healing websites using DuckDuckGo"""
         try:
-            search_url = f"https://duckduckgo.com/html/?q={search_term.replace(' ', '+')}"
-            response = self.session.get(search_url, timeout=10)
+            # The cache holds the unfiltered result links (shared with other scripts); filtering happens here
+            links = self.search_cache.get('duckduckgo_links', search_term)
+            if links is None:
+                search_url = f"https://duckduckgo.com/html/?q={search_term.replace(' ', '+')}"
+                response = self.session.get(search_url, timeout=10)
+
+                links = []
+                if response.status_code == 200:
+                    links = result_links(BeautifulSoup(response.text, 'html.parser'))
+                    self.search_cache.put('duckduckgo_links', search_term, links)
 
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                links = soup.find_all('a', href=True)
+                time.sleep(3)  # Rate limiting
 
-                urls_found = 0
-                for link in links:
-                    href = link.get('href')
-                    if href and href.startswith('http') and self.is_healing_website(href):
-                        if href not in self.found_urls:
-                            self.found_urls.add(href)
-                            urls_found += 1
+            result_urls = [href for href in links if href.startswith('http') and self.is_healing_website(href)]
 
-                        if urls_found >= 10:  # Limit per search
-                            break
+            urls_found = 0
+            for href in result_urls:
+                if href not in self.found_urls:
+                    self.found_urls.add(href)
+                    urls_found += 1
 
-            time.sleep(3)  # Rate limiting
+                if urls_found >= 10:  # Limit per search
+                    break
 
         except Exception as e:
             self.logger.error(f"Search failed for {search_term}: {str(e)}")
@@ -140,13 +148,14 @@ class ExpandedHealerSearch:
             content = response.text
             soup = BeautifulSoup(content, 'html.parser')
 
-            # Check if it's actually a healing-related site
-            if not self.is_healing_related_content(content.lower()):
+            # Check if it's actually a healing-related site (visible text only)
+            text = visible_text(content)
+            if not self.is_healing_related_content(text.lower()):
                 return None
 
             # Extract emails only (as requested)
             email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            emails = re.findall(email_pattern, content, re.IGNORECASE)
+            emails = re.findall(email_pattern, contact_text(content, text), re.IGNORECASE)
 
             # Clean and filter emails
             clean_emails = []
@@ -156,8 +165,9 @@ class ExpandedHealerSearch:
                     '@' in email and
                     not any(bad in email for bad in [
                         'noreply', 'example.', 'test@', 'admin@', 'info@godaddy',
-                        'support@', 'no-reply', 'donotreply', '@sentry', '@wixpress'
-                    ])):
+                        'support@', 'no-reply', 'donotreply'
+                    ]) and
+                    not is_asset_email(email)):
                     clean_emails.append(email)
                     if len(clean_emails) >= 2:  # Limit to 2 emails per site
                         break
@@ -214,7 +224,7 @@ class ExpandedHealerSearch:
         self.logger.info("Starting comprehensive healer search...")
 
         # Phase 1: Search engine discovery
-        for term in self.search_terms:
+        for term in dedupe_queries(self.search_terms):
             self.logger.info(f"Searching for: {term}")
             self.search_healing_websites(term)
 
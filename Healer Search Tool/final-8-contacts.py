@@ -4,18 +4,19 @@ FINAL 8 CONTACTS - QUICK SEARCH
 Get the final 8 contacts to reach exactly 100.
 """
 
-import requests
 from bs4 import BeautifulSoup
 import re
 import csv
 import time
 from datetime import datetime
 import os
-import glob
+
+from healer_discovery.http_client import create_session
+from healer_discovery.contacts import existing_emails
 
 class Final8Contacts:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
@@ -26,17 +27,7 @@ class Final8Contacts:
 
     def load_all_existing(self):
         """Load ALL existing contacts from all files"""
-        results_dir = os.path.join(os.path.dirname(__file__), 'Discovery Results', 'exports')
-        for csv_file in glob.glob(os.path.join(results_dir, '*.csv')):
-            try:
-                with open(csv_file, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        email = (row.get('Email') or row.get('Primary_Email') or row.get('email', '')).strip().lower()
-                        if email and '@' in email and len(email) > 5:
-                            self.existing_emails.add(email)
-            except:
-                continue
+        self.existing_emails.update(existing_emails())
 
         print(f"Total existing emails loaded: {len(self.existing_emails)}")
 
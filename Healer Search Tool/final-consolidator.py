@@ -119,9 +119,10 @@ class FinalConsolidator:
 
         return contacts
 
-    def consolidate_all_results(self):
+    def consolidate_all_results(self, results_dir=None):
         """Find and consolidate all CSV results files"""
-        results_dir = os.path.join(os.path.dirname(__file__), 'Discovery Results', 'exports')
+        if results_dir is None:
+            results_dir = os.path.join(os.path.dirname(__file__), 'Discovery Results', 'exports')
 
         # Find all CSV files
         csv_files = glob.glob(os.path.join(results_dir, '*.csv'))
@@ -144,12 +145,12 @@ class FinalConsolidator:
         print(f"\nTotal unique contacts after consolidation: {len(self.all_contacts)}")
         return self.all_contacts
 
-    def save_final_consolidated_results(self):
+    def save_final_consolidated_results(self, exports_dir=None):
         """Save the final consolidated results"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-        results_dir = os.path.join(os.path.dirname(__file__), 'Discovery Results')
-        exports_dir = os.path.join(results_dir, 'exports')
+        if exports_dir is None:
+            exports_dir = os.path.join(os.path.dirname(__file__), 'Discovery Results', 'exports')
         os.makedirs(exports_dir, exist_ok=True)
 
         # Final consolidated contact list
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+HEALER DISCOVERY
+Unified command line for the discovery scripts: crawl, enrich, consolidate,
+review, count, export and bench. See healer_discovery/cli.py for examples.
+"""
+
+import sys
+
+from healer_discovery.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
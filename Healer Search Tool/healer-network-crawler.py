@@ -4,7 +4,6 @@ HEALER NETWORK CRAWLER
 Expand from known healers to find their networks and associations.
 """
 
-import requests
 from bs4 import BeautifulSoup
 import re
 import json
@@ -13,18 +12,32 @@ import time
 from datetime import datetime
 import logging
 import os
+import argparse
+
+from healer_discovery.metrics import metrics, url_pattern
+from healer_discovery.profiling import start_profiling, url_timings
+from healer_discovery.http_client import create_session
+from healer_discovery.budget import budget
+from healer_discovery.host_health import host_health
+from healer_discovery.fingerprints import FingerprintIndex
+from healer_discovery.canonical import canonical_url, redirects
+from healer_discovery.structured_data import structured_contact
+from healer_discovery.page_text import contact_text, is_asset_email, visible_text
 
 class HealerNetworkCrawler:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5'
         })
+        metrics.instrument_session(self.session)
 
         self.processed_urls = set()
         self.healers_found = []
+        self.fingerprints = FingerprintIndex()
+        redirects.enable()
 
         # Start with verified working sites and expand
         self.seed_urls = [
@@ -154,10 +167,10 @@ class HealerNetworkCrawler:
 
     def extract_contact_info(self, url):
         """Extract contact information from healer website"""
-        if url in self.processed_urls:
+        if canonical_url(url) in self.processed_urls:
             return None
 
-        self.processed_urls.add(url)
+        self.processed_urls.add(canonical_url(url))
         self.logger.info(f"Processing: {url}")
 
         try:
@@ -165,55 +178,95 @@ class HealerNetworkCrawler:
             if response.status_code != 200:
                 return None
 
+            # Results belong to the site the URL ends up on; aliases of a site already done are skipped
+            website = canonical_url(response.url)
+            if website != canonical_url(url):
+                if website in self.processed_urls:
+                    return None
+                self.processed_urls.add(website)
+
             content = response.text
-            soup = BeautifulSoup(content, 'html.parser')
 
-            # Check if it's healing-related
-            if not self.is_healing_related_content(content.lower()):
+            # Parked/template pages and pages extracted before skip parsing
+            match = self.fingerprints.check(url, content)
+            if match.template:
+                metrics.inc('url_yield_total', pattern=url_pattern(url), outcome='template')
+                return None
+            if match.duplicate:
+                metrics.inc('url_yield_total', pattern=url_pattern(url), outcome='duplicate')
+                return dict(match.result, website=website, found_at=datetime.now().isoformat()) if match.result else None
+
+            # Check if it's healing-related (visible text only; script and CSS words would skew it)
+            text = visible_text(content)
+            if not self.is_healing_related_content(text.lower()):
+                metrics.inc('url_yield_total', pattern=url_pattern(url), outcome='not_relevant')
+                self.fingerprints.record(match, url, None)
                 return None
 
-            # Extract emails
-            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            emails = re.findall(email_pattern, content, re.IGNORECASE)
-
-            # Clean emails
-            clean_emails = []
-            for email in emails:
-                email = email.lower()
-                if (email not in clean_emails and
-                    '@' in email and
-                    not any(bad in email for bad in [
-                        'noreply', 'example.', 'test@', 'admin@', 'info@godaddy',
-                        'support@', 'no-reply', 'donotreply', '@sentry', '@wixpress',
-                        '@2x.', '.png', '.jpg', '.gif', '@sentry.io'
-                    ]) and
-                    '.' in email.split('@')[1]):
-                    clean_emails.append(email)
-                    if len(clean_emails) >= 2:
-                        break
+            # The site's own Schema.org markup first; complete markup needs no parse or full-text scan
+            structured = structured_contact(content)
+            clean_emails = self.clean_emails(structured.emails) if structured and structured.complete else []
+            if not clean_emails:
+                with metrics.timer('extract_seconds', field='email'), url_timings.stage(url, 'extract'):
+                    clean_emails = self.extract_emails(contact_text(content, text))
+            metrics.inc('url_yield_total', pattern=url_pattern(url),
+                        outcome='contact' if clean_emails else 'no_email')
 
             # Extract business name
-            title_tag = soup.find('title')
-            if title_tag:
-                business_name = title_tag.get_text().strip()
-                business_name = re.sub(r'\s*[-|]\s*.+$', '', business_name)
-                business_name = business_name[:100]  # Limit length
+            if structured and structured.name:
+                business_name = structured.name
             else:
-                business_name = url.split('//')[1].split('/')[0].replace('www.', '')
-
-            if clean_emails:
-                return {
+                with metrics.timer('parse_seconds', parser='html.parser'), url_timings.stage(url, 'parse'):
+                    soup = BeautifulSoup(content, 'html.parser')
+                title_tag = soup.find('title')
+                if title_tag:
+                    business_name = title_tag.get_text().strip()
+                    business_name = re.sub(r'\s*[-|]\s*.+$', '', business_name)
+                    business_name = business_name[:100]  # Limit length
+                else:
+                    business_name = url.split('//')[1].split('/')[0].replace('www.', '')
+
+            if not clean_emails:
+                self.fingerprints.record(match, url, None)
+            else:
+                healer_data = {
                     'name': business_name,
-                    'website': url,
+                    'website': website,
                     'emails': clean_emails,
                     'found_at': datetime.now().isoformat()
                 }
+                self.fingerprints.record(match, url, healer_data)
+                return healer_data
 
         except Exception as e:
             pass  # Continue processing other URLs
 
         return None
 
+    def extract_emails(self, content):
+        """Extract up to 2 clean email addresses from page text (see page_text.contact_text)"""
+        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+        return self.clean_emails(re.findall(email_pattern, content, re.IGNORECASE))
+
+    def clean_emails(self, emails):
+        """Up to 2 addresses that pass the junk filter"""
+        clean_emails = []
+        for email in emails:
+            email = email.lower()
+            if (email not in clean_emails and
+                '@' in email and
+                not any(bad in email for bad in [
+                    'noreply', 'example.', 'test@', 'admin@', 'info@godaddy',
+                    'support@', 'no-reply', 'donotreply'
+                ]) and
+                not is_asset_email(email) and
+                '.' in email.split('@')[1]):
+                clean_emails.append(email)
+                if len(clean_emails) >= 2:
+                    break
+
+        return clean_emails
+
     def is_healing_related_content(self, content):
         """Check if website content is healing-related"""
         exclude_terms = [
@@ -245,10 +298,17 @@ class HealerNetworkCrawler:
         self.logger.info("Starting comprehensive healer contact extraction...")
 
         # Combine all URLs
-        all_urls = list(set(self.seed_urls + self.comprehensive_urls))
+        all_urls = redirects.dedupe(self.seed_urls + self.comprehensive_urls)
+        if budget.enabled:
+            all_urls = budget.plan(all_urls)
         self.logger.info(f"Processing {len(all_urls)} potential healer websites...")
 
-        for url in all_urls:
+        for i, url in enumerate(all_urls):
+            metrics.set_gauge('queue_depth', len(all_urls) - i, queue='crawl_urls')
+            if not host_health.available(url):
+                metrics.inc('url_yield_total', pattern=url_pattern(url), outcome='circuit_open')
+                continue
+
             try:
                 healer_data = self.extract_contact_info(url)
                 if healer_data:
@@ -262,12 +322,12 @@ class HealerNetworkCrawler:
 
         return self.healers_found
 
-    def save_results(self):
+    def save_results(self, exports_dir=None):
         """Save results to CSV"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-        results_dir = os.path.join(os.path.dirname(__file__), 'Discovery Results')
-        exports_dir = os.path.join(results_dir, 'exports')
+        if exports_dir is None:
+            exports_dir = os.path.join(os.path.dirname(__file__), 'Discovery Results', 'exports')
         os.makedirs(exports_dir, exist_ok=True)
 
         csv_file = os.path.join(exports_dir, f"network_healer_contacts_{timestamp}.csv")
@@ -287,6 +347,26 @@ class HealerNetworkCrawler:
         return os.path.basename(csv_file)
 
 def main():
+    parser = argparse.ArgumentParser(description="Healer network crawler")
+    parser.add_argument('--metrics', choices=['prom', 'json'],
+                        help="collect run metrics and write them to Discovery Results/metrics")
+    parser.add_argument('--profile', choices=['cprofile', 'sample'],
+                        help="profile the run and write a report to Discovery Results/profiles")
+    parser.add_argument('--adaptive-hosts', action='store_true',
+                        help="learn per-host timeouts and skip hosts that keep failing (state kept across runs)")
+    parser.add_argument('--daily-budget', action='store_true',
+                        help="enforce the shared daily fetch limits and fetch the most promising URLs first")
+    args = parser.parse_args()
+
+    if args.metrics:
+        metrics.enable(args.metrics)
+    if args.profile:
+        start_profiling(args.profile)
+    if args.adaptive_hosts:
+        host_health.enable()
+    if args.daily_budget:
+        budget.enable()
+
     print("HEALER NETWORK CRAWLER - Comprehensive Contact Extraction")
     print("=" * 65)
 
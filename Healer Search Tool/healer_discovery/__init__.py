@@ -0,0 +1,4 @@
+"""
+HEALER DISCOVERY SHARED MODULES
+Common building blocks used by the standalone discovery scripts in this folder.
+"""
@@ -0,0 +1,467 @@
+"""
+DISCOVERY PIPELINE BENCHMARK
+Run the discovery scripts over a fixed offline corpus of saved pages and report
+throughput and p50/p95/p99 latency for every stage: fetch, parse, relevance
+check, email/phone extraction, dedupe, scoring, review and export.
+
+Covered scripts: healer-network-crawler.py, comprehensive-healer-urls.py,
+final-consolidator.py and quality-review-social-contacts.py (plus the phone
+extractor from real-data-scraper.py).
+
+Usage:
+    python -m healer_discovery.bench
+    python -m healer_discovery.bench --compare benchmarks/results/<previous>.json
+    python -m healer_discovery.bench --corpus fixtures/linkedin   # recorded replay fixtures
+
+Pages are served through the replay adapter, so "fetch" measures the requests
+stack without the network. The default corpus is generated deterministically
+(fixed seed) the first time it is needed. Results are written as JSON.
+
+Every run starts from empty caches (page fingerprints, redirects, search
+results, robots/sitemaps) in a temporary folder, so results do not depend on
+earlier runs and fixture pages never reach Discovery Results/cache.
+"""
+
+import argparse
+import atexit
+import contextlib
+import csv
+import hashlib
+import io
+import json
+import logging
+import math
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime
+
+from bs4 import BeautifulSoup
+
+from . import paths
+from .canonical import redirects
+from .paths import TOOL_DIR
+from .replay import FixtureStore, ReplayAdapter
+from .scripts import load_script
+
+BENCH_DIR = os.path.join(TOOL_DIR, 'benchmarks')
+DEFAULT_CORPUS = os.path.join(BENCH_DIR, 'corpus')
+BENCH_RESULTS_DIR = os.path.join(BENCH_DIR, 'results')
+
+SYNTHETIC_GENERATOR = 'synthetic-v1'
+
+
+class StageTimer:
+    """Collect per-sample durations for named pipeline stages"""
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.items = defaultdict(int)
+
+    @contextlib.contextmanager
+    def measure(self, stage, items=1):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.samples[stage].append(time.perf_counter() - start)
+            self.items[stage] += items
+
+    def summary(self):
+        result = {}
+        for stage, samples in self.samples.items():
+            ordered = sorted(samples)
+            total = sum(ordered)
+            result[stage] = {
+                'samples': len(ordered),
+                'items': self.items[stage],
+                'total_s': round(total, 6),
+                'items_per_sec': round(self.items[stage] / total, 2) if total else None,
+                'p50_ms': percentile_ms(ordered, 50),
+                'p95_ms': percentile_ms(ordered, 95),
+                'p99_ms': percentile_ms(ordered, 99),
+                'max_ms': round(ordered[-1] * 1000, 4)
+            }
+        return result
+
+
+def percentile_ms(ordered, pct):
+    """Nearest-rank percentile of sorted durations, in milliseconds"""
+    if not ordered:
+        return None
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return round(ordered[index] * 1000, 4)
+
+
+# ---------------------------------------------------------------------------
+# Corpus
+# ---------------------------------------------------------------------------
+
+def build_synthetic_corpus(directory, pages=300, seed=7):
+    """Write a deterministic corpus of healer-like, parked and off-topic pages"""
+    rng = random.Random(seed)
+    store = FixtureStore(directory)
+
+    bases = ['soul', 'spirit', 'divine', 'sacred', 'inner', 'light', 'zen', 'harmony',
+             'peace', 'flow', 'radiant', 'cosmic', 'mystic', 'gentle', 'earth', 'moon']
+    healing = ['reiki', 'energy', 'healing', 'chakra', 'crystal', 'sound', 'wellness', 'holistic']
+    suffixes = ['', 'center', 'studio', 'arts', 'practice', 'sanctuary']
+    paragraphs = [
+        'Reiki and energy healing sessions to restore balance and calm.',
+        'Our holistic wellness practice blends meditation, sound healing and chakra work.',
+        'Book a spiritual guidance session with a certified practitioner.',
+        'Crystal healing and intuitive readings for body, mind and spirit.',
+        'Gentle therapeutic touch for stress relief and deep relaxation.'
+    ]
+
+    urls = []
+    shared_emails = []
+
+    for i in range(pages):
+        name = f"{rng.choice(bases)}{rng.choice(healing)}{rng.choice(suffixes)}{i}"
+        url = f"https://www.{name}.com"
+        kind = rng.choices(['healer', 'parked', 'hvac', 'no_email'], weights=[70, 12, 8, 10])[0]
+
+        script_blob = ''.join(
+            f'var s{j}="{rng.getrandbits(64):x}@sentry.wixpress.com";img{j}="logo@2x.png";'
+            for j in range(rng.randint(50, 1500))
+        )
+        style_blob = ''.join(f'.c{j}{{margin:{j % 9}px;color:#{j:06x}}}' for j in range(rng.randint(50, 600)))
+
+        if kind == 'parked':
+            title = f"{name}.com - This domain is for sale"
+            body = '<p>This domain is for sale. Parked domain courtesy of a registrar.</p>'
+        elif kind == 'hvac':
+            title = f"{name.title()} Heating & Air Conditioning"
+            body = '<p>Furnace repair, HVAC installation and plumbing contractor.</p>'
+        else:
+            title = f"{name.title()} | Home"
+            body = ''.join(f'<p>{rng.choice(paragraphs)}</p>' for _ in range(rng.randint(5, 40)))
+
+        footer = ''
+        if kind == 'healer':
+            if shared_emails and rng.random() < 0.15:
+                email = rng.choice(shared_emails)
+            else:
+                email = f"{rng.choice(['info', 'hello', 'contact', 'book'])}@{name}.com"
+                shared_emails.append(email)
+            phone = f"({rng.randint(200, 989)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}"
+            footer = (f'<footer><a href="mailto:{email}">{email}</a> '
+                      f'<a href="tel:{phone}">{phone}</a></footer>')
+
+        html = (f'<!DOCTYPE html><html><head><title>{title}</title><style>{style_blob}</style>'
+                f'<script>{script_blob}</script></head><body><nav><a href="/">Home</a>'
+                f'<a href="/about">About</a><a href="/contact">Contact</a></nav>'
+                f'<main>{body}</main>{footer}</body></html>')
+
+        store.save(store.key('GET', url), {
+            'method': 'GET',
+            'url': url,
+            'status': 200,
+            'reason': 'OK',
+            'headers': {'Content-Type': 'text/html; charset=utf-8'}
+        }, html.encode('utf-8'))
+        urls.append(url)
+
+    with open(os.path.join(directory, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump({'generator': SYNTHETIC_GENERATOR, 'seed': seed, 'urls': urls}, f, indent=2)
+
+    return urls
+
+
+def load_corpus(directory):
+    """Return the page URLs of a corpus folder, building the default corpus if missing"""
+    manifest_path = os.path.join(directory, 'manifest.json')
+
+    if not os.path.exists(manifest_path) and os.path.abspath(directory) == DEFAULT_CORPUS:
+        return build_synthetic_corpus(directory)
+
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)['urls']
+
+    # Recorded replay fixtures: every successful HTML GET is a page
+    urls = []
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith('.json'):
+            continue
+        with open(os.path.join(directory, filename), 'r', encoding='utf-8') as f:
+            exchange = json.load(f)
+        content_type = {k.lower(): v for k, v in exchange.get('headers', {}).items()}.get('content-type', '')
+        if exchange.get('method') == 'GET' and exchange.get('status') == 200 and 'html' in content_type:
+            urls.append(exchange['url'])
+    return urls
+
+
+@contextlib.contextmanager
+def isolated_caches():
+    """Point every persistent cache at a fresh temporary folder for the duration of the run"""
+    cache_dir = tempfile.mkdtemp(prefix='healer_bench_cache_')
+    # Registered before the scripts register their own save hooks, so it runs after them at exit
+    atexit.register(shutil.rmtree, cache_dir, True)
+    original = paths.CACHE_DIR
+    paths.CACHE_DIR = cache_dir
+    redirects.enabled, redirects.cache = False, None
+    try:
+        yield cache_dir
+    finally:
+        paths.CACHE_DIR = original
+        redirects.enabled, redirects.cache = False, None
+
+
+def corpus_digest(store, urls):
+    digest = hashlib.sha1()
+    for url in urls:
+        exchange = store.load(store.key('GET', url))
+        digest.update(url.encode('utf-8'))
+        digest.update(exchange['body'] if exchange else b'')
+    return digest.hexdigest()
+
+
+def mount(session, adapter):
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+
+# ---------------------------------------------------------------------------
+# Per-script benchmarks
+# ---------------------------------------------------------------------------
+
+def bench_network_crawler(urls, adapter, exports_dir):
+    timer = StageTimer()
+    crawler = load_script('healer-network-crawler.py').HealerNetworkCrawler()
+    mount(crawler.session, adapter)
+
+    for url in urls:
+        with timer.measure('fetch'):
+            content = crawler.session.get(url, timeout=15).text
+        with timer.measure('parse'):
+            BeautifulSoup(content, 'html.parser')
+        with timer.measure('relevance'):
+            crawler.is_healing_related_content(content.lower())
+        with timer.measure('email_extraction'):
+            crawler.extract_emails(content)
+
+        crawler.processed_urls.discard(url)
+        with timer.measure('extract_contact_info'):
+            healer = crawler.extract_contact_info(url)
+        if healer:
+            crawler.healers_found.append(healer)
+
+    with timer.measure('export', items=len(crawler.healers_found)):
+        crawler.save_results(exports_dir)
+
+    return timer.summary()
+
+
+def bench_comprehensive_extractor(urls, adapter):
+    timer = StageTimer()
+    extractor = load_script('comprehensive-healer-urls.py').ComprehensiveHealerExtractor()
+    mount(extractor.session, adapter)
+
+    for url in urls:
+        with timer.measure('fetch'):
+            content = extractor.session.get(url, timeout=15).text
+        with timer.measure('parse'):
+            title = BeautifulSoup(content, 'html.parser').find('title')
+        with timer.measure('relevance'):
+            extractor.is_healing_related_content(content, url, title.text if title else "")
+        with timer.measure('email_extraction'):
+            extractor.extract_emails_only(content)
+        with timer.measure('name_extraction'):
+            extractor.extract_business_name(content, url)
+        with timer.measure('extract_healer_info'):
+            extractor.extract_healer_info(url)
+
+    return timer.summary()
+
+
+def bench_phone_extraction(urls, adapter):
+    timer = StageTimer()
+    scraper = load_script('real-data-scraper.py').RealDataHealerScraper()
+    mount(scraper.session, adapter)
+
+    for url in urls:
+        content = scraper.session.get(url, timeout=15).text
+        with timer.measure('phone_extraction'):
+            scraper.extract_real_phones(content)
+
+    return timer.summary()
+
+
+def bench_consolidator(exports_dir, output_dir, repeat):
+    timer = StageTimer()
+    module = load_script('final-consolidator.py')
+    contacts = []
+
+    # Rows that survive cleaning; consolidate_all_results then dedupes them
+    loaded_rows = sum(len(module.FinalConsolidator().load_csv_results(os.path.join(exports_dir, name)))
+                      for name in os.listdir(exports_dir) if name.endswith('.csv'))
+
+    for _ in range(repeat):
+        consolidator = module.FinalConsolidator()
+        with contextlib.redirect_stdout(io.StringIO()):
+            with timer.measure('consolidate_dedupe', items=loaded_rows):
+                contacts = consolidator.consolidate_all_results(exports_dir)
+
+        for contact in contacts:
+            with timer.measure('scoring'):
+                consolidator.calculate_quality_score(contact)
+
+        with timer.measure('export', items=len(contacts)):
+            consolidator.save_final_consolidated_results(output_dir)
+
+    return timer.summary(), contacts
+
+
+def bench_quality_review(contacts, work_dir, repeat):
+    timer = StageTimer()
+    module = load_script('quality-review-social-contacts.py')
+
+    input_file = os.path.join(work_dir, 'review_input.csv')
+    with open(input_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=['ID', 'Business_Name', 'Email', 'Website', 'Platform'])
+        writer.writeheader()
+        for i, contact in enumerate(contacts, 1):
+            writer.writerow({
+                'ID': f"PD_{i:03d}",
+                'Business_Name': contact['business_name'],
+                'Email': contact['email'],
+                'Website': contact['website'],
+                'Platform': 'Direct Web'
+            })
+
+    for _ in range(repeat):
+        with timer.measure('review', items=len(contacts)):
+            module.quality_review_contacts(input_file, work_dir)
+
+    return timer.summary()
+
+
+# ---------------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------------
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=TOOL_DIR,
+                              capture_output=True, text=True, timeout=10).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def compare_results(current, baseline, threshold):
+    """Print per-stage p50/throughput changes; return the stages slower than threshold"""
+    regressions = []
+
+    if current['corpus']['digest'] != baseline.get('corpus', {}).get('digest'):
+        print("WARNING: corpus differs from baseline - numbers are not directly comparable")
+
+    print(f"\nCOMPARISON vs {baseline.get('git_commit') or 'baseline'} (threshold {threshold:.0%}):")
+    for script, stages in current['scripts'].items():
+        for stage, stats in stages.items():
+            base = baseline.get('scripts', {}).get(script, {}).get(stage)
+            if not base or not base.get('p50_ms'):
+                continue
+
+            change = (stats['p50_ms'] - base['p50_ms']) / base['p50_ms']
+            marker = 'REGRESSION' if change > threshold else ''
+            print(f"  {script:38} {stage:22} p50 {base['p50_ms']:>10.3f} -> {stats['p50_ms']:>10.3f} ms "
+                  f"({change:+.1%}) {marker}")
+            if change > threshold:
+                regressions.append((script, stage, change))
+
+    return regressions
+
+
+def run_benchmarks(corpus_dir, repeat):
+    urls = load_corpus(corpus_dir)
+    store = FixtureStore(corpus_dir)
+    adapter = ReplayAdapter(store)
+
+    results = {
+        'benchmark': 'discovery_pipeline',
+        'timestamp': datetime.now().isoformat(),
+        'git_commit': git_commit(),
+        'python': platform.python_version(),
+        'corpus': {
+            'path': os.path.relpath(corpus_dir, TOOL_DIR),
+            'pages': len(urls),
+            'digest': corpus_digest(store, urls)
+        },
+        'repeat': repeat,
+        'scripts': {}
+    }
+
+    # Scripts log every page at INFO; keep terminal I/O out of the measurements
+    logging.disable(logging.WARNING)
+    try:
+        with isolated_caches(), tempfile.TemporaryDirectory() as work_dir:
+            exports_dir = os.path.join(work_dir, 'exports')
+            output_dir = os.path.join(work_dir, 'consolidated')
+
+            results['scripts']['healer-network-crawler.py'] = bench_network_crawler(urls, adapter, exports_dir)
+            results['scripts']['comprehensive-healer-urls.py'] = bench_comprehensive_extractor(urls, adapter)
+            results['scripts']['real-data-scraper.py'] = bench_phone_extraction(urls, adapter)
+
+            consolidator_stats, contacts = bench_consolidator(exports_dir, output_dir, repeat)
+            results['scripts']['final-consolidator.py'] = consolidator_stats
+            results['scripts']['quality-review-social-contacts.py'] = bench_quality_review(contacts, work_dir, repeat)
+    finally:
+        logging.disable(logging.NOTSET)
+
+    return results
+
+
+def print_results(results):
+    print(f"Corpus: {results['corpus']['path']} ({results['corpus']['pages']} pages)")
+    for script, stages in results['scripts'].items():
+        print(f"\n{script}")
+        for stage, stats in stages.items():
+            print(f"  {stage:22} {stats['items_per_sec'] or 0:>12.1f}/s   p50 {stats['p50_ms']:>9.3f} ms   "
+                  f"p95 {stats['p95_ms']:>9.3f} ms   p99 {stats['p99_ms']:>9.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the healer discovery pipeline offline")
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS,
+                        help="corpus folder (replay fixtures, optionally with manifest.json)")
+    parser.add_argument('--repeat', type=int, default=20,
+                        help="repetitions of the batch stages (consolidate, scoring, review, export)")
+    parser.add_argument('--output', help="result JSON path (default: benchmarks/results/)")
+    parser.add_argument('--compare', help="previous result JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="p50 slowdown counted as a regression (default 0.10 = 10%%)")
+    args = parser.parse_args()
+
+    print("DISCOVERY PIPELINE BENCHMARK")
+    print("=" * 60)
+
+    results = run_benchmarks(os.path.abspath(args.corpus), args.repeat)
+    print_results(results)
+
+    output = args.output
+    if not output:
+        os.makedirs(BENCH_RESULTS_DIR, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = os.path.join(BENCH_RESULTS_DIR, f"bench_{stamp}_{results['git_commit'] or 'nogit'}.json")
+
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults saved: {output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if compare_results(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+"""
+DAILY FETCH BUDGET LEDGER
+Keep every script, run and worker inside the per-day limits from
+SAFE_LIMITS_ANALYSIS.md (about 200 Instagram calls, 500 website fetches and
+100 directory searches a day), counted in the rate_limits table of
+healers_discovery.db (platform, action_type, action_count, date) that the
+Node tool already uses.
+
+Sessions from create_session() consult the ledger once it is enabled:
+
+    budget.enable()                                   # usually from a --daily-budget flag
+    urls = budget.plan(urls)                          # best URLs first, cut to what today allows
+
+A request to a platform whose budget is spent fails at once with
+BudgetExceededError. Candidate probes (HEAD requests and ranged GETs from
+probe.py) are counted under their own 'probe' action_type, which has no daily
+limit: they cost the host a fraction of a page, and only the full fetches they
+promote are charged against the extraction budget. To avoid a database write per request, the ledger
+reserves units from SQLite in blocks (one IMMEDIATE transaction each) and
+hands them out from memory; unused units are given back at exit. A crashed
+process simply leaves its unused block counted, which errs on the safe side.
+"""
+
+import atexit
+import logging
+import re
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+
+import requests
+
+from .paths import DISCOVERY_DB
+
+logger = logging.getLogger(__name__)
+
+# Daily limits per (platform, action_type), from SAFE_LIMITS_ANALYSIS.md
+DAILY_LIMITS = {
+    ('instagram', 'discovery'): 200,
+    ('website', 'extraction'): 500,
+    ('directory', 'discovery'): 100
+}
+
+# Host suffix -> (platform, action_type); anything else is a website fetch
+PLATFORM_HOSTS = {
+    'instagram.com': ('instagram', 'discovery'),
+    'psychologytoday.com': ('directory', 'discovery'),
+    'yelp.com': ('directory', 'discovery'),
+    'thumbtack.com': ('directory', 'discovery'),
+    'wellness.com': ('directory', 'discovery'),
+    'yogaalliance.org': ('directory', 'discovery'),
+    'linkedin.com': ('linkedin', 'discovery'),
+    'facebook.com': ('facebook', 'discovery'),
+    'google.com': ('search', 'discovery'),
+    'bing.com': ('search', 'discovery'),
+    'duckduckgo.com': ('search', 'discovery'),
+    'github.com': ('github', 'discovery'),
+    'api.github.com': ('github', 'discovery')
+}
+
+PROBE_ACTION = 'probe'           # HEAD / ranged GET; tracked per platform, not limited
+
+DEFAULT_RESERVE_BLOCK = 20
+
+# Same table as src/utils/database.js, for databases the Node tool has not created yet
+RATE_LIMITS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_limits (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    platform TEXT,
+    action_type TEXT, -- discovery, outreach, extraction
+    action_count INTEGER DEFAULT 0,
+    date TEXT, -- YYYY-MM-DD format
+    last_action DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+# Words in a host name that make a site more likely to be a practising healer
+VALUE_TERMS = {
+    'reiki': 4, 'healing': 3, 'healer': 4, 'energy': 2, 'chakra': 3, 'shaman': 3, 'sound': 1,
+    'crystal': 2, 'holistic': 2, 'acupuncture': 2, 'massage': 1, 'therapy': 1, 'wellness': 1,
+    'spirit': 1, 'soul': 1, 'meditation': 1, 'hypno': 2
+}
+
+
+class BudgetExceededError(requests.exceptions.RequestException):
+    """Raised instead of sending a request once today's budget for its platform is spent
+
+    Not a ConnectionError: the host did nothing wrong, so host_health must not count it as a failure.
+    """
+
+
+def today():
+    """UTC date in the rate_limits format (matches the Node tool's toISOString() dates)"""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d')
+
+
+def used_today(conn, platform, action_type, date=None):
+    row = conn.execute(
+        'SELECT SUM(action_count) FROM rate_limits WHERE platform = ? AND action_type = ? AND date = ?',
+        (platform, action_type, date or today())).fetchone()
+    return row[0] or 0
+
+
+def charge(conn, platform, action_type, count, date=None):
+    """Add to today's rate_limits row (created if missing); call inside a write transaction"""
+    date = date or today()
+    updated = conn.execute(
+        'UPDATE rate_limits SET action_count = action_count + ?, last_action = CURRENT_TIMESTAMP '
+        'WHERE id = (SELECT MIN(id) FROM rate_limits WHERE platform = ? AND action_type = ? AND date = ?)',
+        (count, platform, action_type, date)).rowcount
+    if not updated:
+        conn.execute('INSERT INTO rate_limits (platform, action_type, action_count, date) VALUES (?, ?, ?, ?)',
+                     (platform, action_type, count, date))
+
+
+def classify(url):
+    """(platform, action_type) a request to this URL is counted under"""
+    host = urlparse(url).netloc.lower().split(':')[0]
+    parts = host.split('.')
+    for i in range(len(parts) - 1):
+        match = PLATFORM_HOSTS.get('.'.join(parts[i:]))
+        if match:
+            return match
+    return ('website', 'extraction')
+
+
+def classify_request(request):
+    """(platform, action_type) for a prepared request; probes get the probe action_type"""
+    platform, action_type = classify(request.url)
+    if request.method == 'HEAD' or 'Range' in request.headers:
+        return platform, PROBE_ACTION
+    return platform, action_type
+
+
+def url_value(url, known_hosts=()):
+    """Rough worth of fetching a URL: healing words in the host name, short plain names, unseen sites"""
+    parsed = urlparse(url)
+    host = parsed.netloc.lower().replace('www.', '', 1)
+    name = host.rsplit('.', 1)[0]
+    if host in known_hosts:
+        return -10  # Contacts from this site are already exported
+
+    score = sum(weight for term, weight in VALUE_TERMS.items() if term in name)
+    score -= len(re.findall(r'[-\d]', name))  # Generated combinations tend to be hyphenated
+    score -= max(0, len(name) - 20) / 5
+    if host.endswith(('.com', '.org')):
+        score += 0.5
+    if parsed.path.strip('/'):
+        score -= 0.5  # Subpages after home pages
+    return score
+
+
+class BudgetLedger:
+    """Process-wide daily budget; lets everything through until enable() is called"""
+
+    def __init__(self):
+        self.enabled = False
+        self.lock = threading.Lock()
+        self.path = None
+        self.limits = DAILY_LIMITS
+        self.reserve_block = DEFAULT_RESERVE_BLOCK
+        self.reserved = {}      # (platform, action_type, date) -> units held in memory
+        self.spent = {}         # (platform, action_type) -> units used by this process today
+        self.exhausted = set()
+
+    def enable(self, path=None, limits=None, reserve_block=DEFAULT_RESERVE_BLOCK):
+        self.path = path or DISCOVERY_DB
+        self.limits = DAILY_LIMITS if limits is None else limits
+        self.reserve_block = reserve_block
+        conn = self.connect()
+        try:
+            conn.executescript(RATE_LIMITS_SCHEMA)
+        finally:
+            conn.close()
+        if not self.enabled:
+            atexit.register(self.release)
+        self.enabled = True
+        for key in sorted(self.limits):
+            logger.info(f"Daily budget {key[0]}/{key[1]}: {self.remaining(*key)} of {self.limits[key]} left")
+        return self
+
+    def connect(self):
+        return sqlite3.connect(self.path, timeout=60, isolation_level=None)
+
+    # -- reservations ---------------------------------------------------------
+
+    def reserve(self, platform, action_type, date):
+        """Move up to one block of today's remaining budget into memory; returns the units reserved"""
+        limit = self.limits[(platform, action_type)]
+        conn = self.connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            units = min(self.reserve_block, limit - used_today(conn, platform, action_type, date))
+            if units > 0:
+                charge(conn, platform, action_type, units, date)
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
+        return max(0, units)
+
+    def try_spend(self, platform, action_type, units=1):
+        """Take units from today's budget; False once it is spent (unlimited platforms always pass)"""
+        if not self.enabled or (platform, action_type) not in self.limits:
+            return True
+
+        date = today()
+        key = (platform, action_type, date)
+        with self.lock:
+            if self.reserved.get(key, 0) < units:
+                self.reserved[key] = self.reserved.get(key, 0) + self.reserve(platform, action_type, date)
+            if self.reserved.get(key, 0) < units:
+                if (platform, action_type) not in self.exhausted:
+                    self.exhausted.add((platform, action_type))
+                    logger.warning(f"Daily budget for {platform}/{action_type} is used up")
+                return False
+            self.reserved[key] -= units
+            self.spent[(platform, action_type)] = self.spent.get((platform, action_type), 0) + units
+            return True
+
+    def remaining(self, platform, action_type='extraction'):
+        """Units still available today, counting this process's unused reservation"""
+        limit = self.limits.get((platform, action_type))
+        if limit is None or not self.enabled:
+            return None
+        date = today()
+        conn = self.connect()
+        try:
+            used = used_today(conn, platform, action_type, date)
+        finally:
+            conn.close()
+        with self.lock:
+            return max(0, limit - used) + self.reserved.get((platform, action_type, date), 0)
+
+    def release(self):
+        """Give unused reservations back to the shared counter"""
+        with self.lock:
+            held = {key: units for key, units in self.reserved.items() if units > 0}
+            self.reserved.clear()
+        if not held or not self.path:
+            return
+        conn = self.connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            for (platform, action_type, date), units in held.items():
+                charge(conn, platform, action_type, -units, date)
+            conn.execute('COMMIT')
+        finally:
+            conn.close()
+
+    # -- scheduling -----------------------------------------------------------
+
+    def plan(self, urls, known_hosts=(), value=url_value):
+        """Order URLs by value and keep only as many per budgeted platform as today's budget allows
+
+        value=None keeps the caller's order (already ranked, e.g. by hosting cluster) and only cuts.
+        """
+        ranked = list(urls) if value is None else sorted(urls, key=lambda url: value(url, known_hosts), reverse=True)
+        if not self.enabled:
+            return ranked
+
+        allowance = {}
+        planned = []
+        for url in ranked:
+            key = classify(url)
+            if key in self.limits:
+                if key not in allowance:
+                    allowance[key] = self.remaining(*key)
+                if allowance[key] <= 0:
+                    continue
+                allowance[key] -= 1
+            planned.append(url)
+
+        if len(planned) < len(ranked):
+            logger.info(f"Daily budget: keeping the {len(planned)} most promising of {len(ranked)} URLs")
+        return planned
+
+    # -- session hook ---------------------------------------------------------
+
+    def instrument_session(self, session):
+        """Charge every request the session sends to its platform's daily budget"""
+        if getattr(session, '_healer_budget', False):
+            return session
+
+        original_send = session.send
+        ledger = self
+
+        def send(request, **kwargs):
+            if ledger.enabled:
+                platform, action_type = classify_request(request)
+                if not ledger.try_spend(platform, action_type):
+                    raise BudgetExceededError(f"Daily {platform}/{action_type} budget used up", request=request)
+            return original_send(request, **kwargs)
+
+        session.send = send
+        session._healer_budget = True
+        return session
+
+
+budget = BudgetLedger()
@@ -0,0 +1,157 @@
+"""
+CANONICAL URLS & REDIRECT CACHE
+The URL generators emit https://www.X.com, https://X.com and http://X.com as
+separate candidates; each one is fetched, follows the same redirects and
+yields the same emails. canonical_url() gives every variant of a site one
+form, and the redirect cache remembers where each URL was sent last time:
+
+    redirects.enable()                        # loads Discovery Results/cache/redirects.json
+    urls = redirects.dedupe(urls)             # one URL per site, already pointing at its final target
+    ...
+    website = canonical_url(response.url)     # attribute results to one canonical site
+
+Sessions from create_session() record every redirect they follow. Once the
+cache is enabled, a request for a URL whose redirect is known goes straight to
+the target, skipping the hops. Only redirects that will hold are kept:
+permanent ones (301/308), and ones that only change the scheme, www. or a
+trailing slash.
+"""
+
+import atexit
+import threading
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
+
+from .metrics import metrics
+from .paths import cache_file
+from .sitemaps import JsonCache
+
+REDIRECT_TTL_HOURS = 14 * 24
+MAX_HOPS = 10
+PERMANENT_STATUSES = (301, 308)
+TRACKING_PARAMS = {'fbclid', 'gclid', 'mc_cid', 'mc_eid', 'ref'}
+
+
+def canonical_url(url):
+    """https, lower-case host without www. or default port, no fragment, trailing slash or tracking parameters"""
+    parsed = urlparse(url.strip() if '://' in url else f"https://{url.strip()}")
+    host = (parsed.hostname or '').rstrip('.')
+    if host.startswith('www.'):
+        host = host[4:]
+    if parsed.port and parsed.port not in (80, 443):
+        host = f"{host}:{parsed.port}"
+
+    path = parsed.path.rstrip('/')
+    for index_page in ('/index.html', '/index.htm', '/index.php'):
+        if path.lower().endswith(index_page):
+            path = path[:-len(index_page)]
+    query = urlencode(sorted((key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+                             if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS))
+    return urlunparse(('https', host, path, '', query, ''))
+
+
+def hop_key(url):
+    """Exact redirect source: scheme and host kept (http:// and www. redirect on their own), fragment dropped"""
+    parsed = urlparse(url)
+    return urlunparse((parsed.scheme.lower(), parsed.netloc.lower(), parsed.path.rstrip('/'), '', parsed.query, ''))
+
+
+def canonical_site(url):
+    """Host part of the canonical URL; one key per site for de-duplicating results"""
+    return urlparse(canonical_url(url)).netloc
+
+
+class RedirectCache:
+    """Process-wide redirect memory; a pass-through until enable() is called"""
+
+    def __init__(self):
+        self.enabled = False
+        self.cache = None
+        self.lock = threading.Lock()
+
+    def enable(self, path=None, ttl_hours=REDIRECT_TTL_HOURS):
+        if not self.enabled:
+            self.cache = JsonCache(path or cache_file('redirects.json'), ttl_hours)
+            atexit.register(self.save)
+        self.enabled = True
+        return self
+
+    def save(self):
+        if self.cache:
+            with self.lock:
+                self.cache.save()
+
+    # -- chains ---------------------------------------------------------------
+
+    def record(self, url, location, status):
+        """Remember one hop if it is permanent or only switches between aliases of the same URL"""
+        if not self.enabled or not location:
+            return
+        target = urljoin(url, location)
+        if status not in PERMANENT_STATUSES and canonical_url(url) != canonical_url(target):
+            return
+        with self.lock:
+            key = hop_key(url)
+            entry = self.cache.entries.get(key)
+            if not entry or entry.get('to') != target:
+                self.cache.put(key, {'to': target, 'status': status})
+
+    def target(self, url):
+        """Final URL a known redirect chain leads to, or the URL itself"""
+        if not self.enabled:
+            return url
+        seen = set()
+        current = url
+        with self.lock:
+            for _ in range(MAX_HOPS):
+                key = hop_key(current)
+                entry = self.cache.entries.get(key)
+                if not entry or key in seen:
+                    break
+                seen.add(key)
+                current = entry['to']
+        return current
+
+    def dedupe(self, urls):
+        """One URL per canonical final target, first occurrence wins, already pointing at the target"""
+        unique = []
+        seen = set()
+        for url in urls:
+            target = self.target(url)
+            key = canonical_url(target)
+            if key not in seen:
+                seen.add(key)
+                unique.append(target)
+        if len(unique) < len(urls):
+            metrics.inc('url_aliases_dropped_total', len(urls) - len(unique))
+        return unique
+
+    # -- session hook ---------------------------------------------------------
+
+    def instrument_session(self, session):
+        """Send requests for known aliases straight to their target, and record the redirects followed"""
+        if getattr(session, '_healer_redirects', False):
+            return session
+
+        original_send = session.send
+        cache = self
+
+        def send(request, **kwargs):
+            if cache.enabled and request.method in ('GET', 'HEAD'):
+                target = cache.target(request.url)
+                if target != request.url:
+                    metrics.inc('redirects_skipped_total')
+                    request.prepare_url(target, None)
+
+            response = original_send(request, **kwargs)
+            if cache.enabled:
+                for hop in list(response.history) + [response]:
+                    if hop.is_redirect:
+                        cache.record(hop.url, hop.headers.get('Location'), hop.status_code)
+            return response
+
+        session.send = send
+        session._healer_redirects = True
+        return session
+
+
+redirects = RedirectCache()
@@ -0,0 +1,243 @@
+"""
+HEALER DISCOVERY CLI
+One entry point for the discovery scripts, sharing the Discovery Results
+folders and run options instead of per-script setup.
+
+    python healer-discovery.py count
+    python healer-discovery.py export --format json
+    python healer-discovery.py crawl network --metrics prom
+    python healer-discovery.py --adaptive-hosts crawl reach-100
+    python healer-discovery.py consolidate
+    python healer-discovery.py review path/to/contacts.csv
+    python healer-discovery.py bench --compare benchmarks/results/<previous>.json
+    python healer-discovery.py distributed run network --workers 4
+
+(`python -m healer_discovery ...` works the same from this folder.)
+
+Nothing heavy is imported up front: count and export only need the standard
+library, and crawl/enrich/consolidate/review load the chosen script (and with
+it requests/bs4) only when it runs. Arguments after the script name are passed
+through to the script unchanged.
+"""
+
+import argparse
+import os
+import sys
+
+from .paths import EXPORTS_DIR, TOOL_DIR
+
+CRAWLERS = {
+    'network': 'healer-network-crawler.py',
+    'comprehensive': 'comprehensive-healer-urls.py',
+    'reach-100': 'reach-100-simple.py',
+    'reach-100-contacts': 'reach-100-contacts.py',
+    'targeted': 'targeted-100-search.py',
+    'expanded': 'expanded-healer-search.py',
+    'directories': 'directory-scraper-final.py',
+    'direct-social': 'direct-social-healer-discovery.py',
+    'social': 'social-media-healer-discovery.py',
+    'instagram': 'instagram-healer-scraper.py',
+    'linkedin': 'linkedin-healer-scraper.py',
+    'github': 'real-github-healer-discovery.py',
+    'real-data': 'real-data-scraper.py',
+    'proven-direct': 'proven-direct-healer-scraper.py',
+    'last-chance': 'last-chance-100.py',
+    'final-5': 'final-5-push.py',
+    'final-8': 'final-8-contacts.py'
+}
+
+ENRICHERS = {
+    'verified': 'verified-healer-final.py',
+    'contacts': 'real-contact-extractor.py',
+    'priority': 'priority-healer-extractor.py',
+    'aggressive': 'aggressive-healer-extractor.py'
+}
+
+CONSOLIDATORS = {
+    'final': 'final-consolidator.py',
+    'one-file': 'consolidate-final.py',
+    'social': 'consolidate-social-healers.py'
+}
+
+REVIEW_SCRIPT = 'quality-review-social-contacts.py'
+
+
+def run_script(filename, args):
+    """Run a discovery script as __main__ with the given command-line arguments"""
+    import runpy
+
+    path = os.path.join(TOOL_DIR, filename)
+    if TOOL_DIR not in sys.path:
+        sys.path.insert(0, TOOL_DIR)
+
+    saved_argv = sys.argv
+    sys.argv = [path] + list(args)
+    try:
+        runpy.run_path(path, run_name='__main__')
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    finally:
+        sys.argv = saved_argv
+    return 0
+
+
+# -- commands -------------------------------------------------------------------
+
+def cmd_count(args):
+    from .contacts import export_files, load_contacts
+
+    csv_files = export_files(args.exports_dir)
+    contacts = load_contacts(csv_files=csv_files)
+
+    print("HEALER CONTACT COUNT")
+    print("=" * 40)
+    if args.by_file:
+        per_file = {}
+        for contact in contacts:
+            per_file[contact['source_file']] = per_file.get(contact['source_file'], 0) + 1
+        for csv_file in csv_files:
+            name = os.path.basename(csv_file)
+            print(f"  {per_file.get(name, 0):>5}  {name}")
+        print()
+
+    print(f"Unique healer email contacts: {len(contacts)} (from {len(csv_files)} files)")
+    if args.target:
+        if len(contacts) >= args.target:
+            print(f"✅ Target of {args.target} reached")
+        else:
+            print(f"❌ Need {args.target - len(contacts)} more to reach {args.target}")
+    return 0
+
+
+def cmd_export(args):
+    from datetime import datetime
+
+    from .contacts import load_contacts
+
+    contacts = load_contacts(args.exports_dir)
+    output = args.output
+    if output is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = os.path.join(args.exports_dir or EXPORTS_DIR, 'merged', f"healer_contacts_{timestamp}.{args.format}")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+
+    if args.format == 'json':
+        import json
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump({'total_contacts': len(contacts), 'contacts': contacts}, f, indent=2)
+    else:
+        import csv
+        with open(output, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=['Contact_ID', 'Email', 'Business_Name', 'Website', 'Source_File'])
+            writer.writeheader()
+            for i, contact in enumerate(contacts, 1):
+                writer.writerow({
+                    'Contact_ID': f"HD_{i:04d}",
+                    'Email': contact['email'],
+                    'Business_Name': contact['business_name'],
+                    'Website': contact['website'],
+                    'Source_File': contact['source_file']
+                })
+
+    print(f"Exported {len(contacts)} unique contacts to {output}")
+    return 0
+
+
+def cmd_script(table):
+    def run(args):
+        return run_script(table[args.name], args.script_args)
+    return run
+
+
+def cmd_review(args):
+    return run_script(REVIEW_SCRIPT, args.script_args)
+
+
+def run_module_main(main_func, prog, args):
+    saved_argv = sys.argv
+    sys.argv = [prog] + list(args)
+    try:
+        main_func()
+    finally:
+        sys.argv = saved_argv
+    return 0
+
+
+def cmd_bench(args):
+    from . import bench
+    return run_module_main(bench.main, 'healer-discovery bench', args.script_args)
+
+
+def cmd_distributed(args):
+    from . import distributed
+    return run_module_main(distributed.main, 'healer-discovery distributed', args.script_args)
+
+
+# -- entry point ----------------------------------------------------------------
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='healer-discovery', description="Healer discovery tool")
+    parser.add_argument('--metrics', choices=['prom', 'json'],
+                        help="collect run metrics and write them to Discovery Results/metrics")
+    parser.add_argument('--adaptive-hosts', action='store_true',
+                        help="learn per-host timeouts and skip hosts that keep failing (state kept across runs)")
+    parser.add_argument('--daily-budget', action='store_true',
+                        help="enforce the shared daily fetch limits and fetch the most promising URLs first")
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+
+    for name, table, help_text in [
+        ('crawl', CRAWLERS, "run a discovery crawler"),
+        ('enrich', ENRICHERS, "extract contacts from known healer websites"),
+        ('consolidate', CONSOLIDATORS, "merge the exports into the final contact list")
+    ]:
+        command = commands.add_parser(name, help=help_text)
+        if name == 'consolidate':
+            command.add_argument('name', nargs='?', default='final', choices=sorted(table))
+        else:
+            command.add_argument('name', choices=sorted(table))
+        command.add_argument('script_args', nargs=argparse.REMAINDER, help="arguments passed to the script")
+        command.set_defaults(func=cmd_script(table))
+
+    review = commands.add_parser('review', help="quality-review the social media contacts")
+    review.add_argument('script_args', nargs=argparse.REMAINDER, help="arguments passed to the review script")
+    review.set_defaults(func=cmd_review)
+
+    count = commands.add_parser('count', help="count unique contacts across the exports")
+    count.add_argument('--exports-dir', help="folder of contact CSVs (default: Discovery Results/exports)")
+    count.add_argument('--by-file', action='store_true', help="show how many unique contacts each file adds")
+    count.add_argument('--target', type=int, default=100, help="contact goal to report against (0 to skip)")
+    count.set_defaults(func=cmd_count)
+
+    export = commands.add_parser('export', help="write all unique contacts to one CSV or JSON file")
+    export.add_argument('--exports-dir', help="folder of contact CSVs (default: Discovery Results/exports)")
+    export.add_argument('--format', choices=['csv', 'json'], default='csv')
+    export.add_argument('--output', help="output file (default: Discovery Results/exports/merged/...)")
+    export.set_defaults(func=cmd_export)
+
+    bench = commands.add_parser('bench', help="benchmark the pipeline offline")
+    bench.add_argument('script_args', nargs=argparse.REMAINDER, help="arguments passed to the benchmark")
+    bench.set_defaults(func=cmd_bench)
+
+    distributed = commands.add_parser('distributed', help="crawl with several workers sharing one work queue")
+    distributed.add_argument('script_args', nargs=argparse.REMAINDER,
+                             help="seed|worker|run|status|merge JOB [options]")
+    distributed.set_defaults(func=cmd_distributed)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.metrics:
+        from .metrics import metrics
+        metrics.enable(args.metrics)
+    if args.adaptive_hosts:
+        from .host_health import host_health
+        host_health.enable()
+    if args.daily_budget:
+        from .budget import budget
+        budget.enable()
+
+    return args.func(args)
@@ -0,0 +1,75 @@
+"""
+SHARED CONTACT STORAGE
+Read the contact CSVs in Discovery Results/exports the same way everywhere:
+one set of column aliases, one junk-email filter and one dedupe by email.
+Standard library only, so commands that just count or export stay fast.
+"""
+
+import csv
+import glob
+import os
+
+from .paths import EXPORTS_DIR
+
+# The curated list the social scrapers and last-chance-100 check new finds against
+FINAL_CONTACTS_CSV = os.path.join(EXPORTS_DIR, 'HEALER_CONTACTS_FINAL_100.csv')
+
+EMAIL_COLUMNS = ['Email', 'Primary_Email', 'email']
+NAME_COLUMNS = ['Business_Name', 'Name', 'business_name', 'Contact_Name']
+WEBSITE_COLUMNS = ['Website', 'website']
+
+JUNK_EMAIL_PATTERNS = [
+    'noreply', 'no-reply', 'example.com', 'test.com', '.png', '.jpg',
+    'sentry.io', 'godaddy.com', 'user@domain.com', 'yourname@'
+]
+
+
+def first_value(row, columns):
+    for column in columns:
+        value = (row.get(column) or '').strip()
+        if value:
+            return value
+    return ''
+
+
+def is_valid_email(email):
+    return bool(email) and '@' in email and len(email) > 5 and \
+        not any(bad in email for bad in JUNK_EMAIL_PATTERNS)
+
+
+def export_files(exports_dir=None):
+    """Contact CSVs in the exports folder, oldest first so earlier sources win the dedupe"""
+    return sorted(glob.glob(os.path.join(exports_dir or EXPORTS_DIR, '*.csv')), key=os.path.getmtime)
+
+
+def iter_rows(csv_files):
+    """Yield (filename, row) for every row of the given CSVs, skipping unreadable files"""
+    for csv_file in csv_files:
+        filename = os.path.basename(csv_file)
+        try:
+            with open(csv_file, 'r', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    yield filename, row
+        except (OSError, UnicodeDecodeError, csv.Error):
+            continue
+
+
+def load_contacts(exports_dir=None, csv_files=None):
+    """Unique contacts across the export CSVs as dicts (email, business_name, website, source_file)"""
+    contacts = {}
+    for filename, row in iter_rows(csv_files or export_files(exports_dir)):
+        email = first_value(row, EMAIL_COLUMNS).lower()
+        if not is_valid_email(email) or email in contacts:
+            continue
+        contacts[email] = {
+            'email': email,
+            'business_name': first_value(row, NAME_COLUMNS) or 'Unknown',
+            'website': first_value(row, WEBSITE_COLUMNS) or 'Unknown',
+            'source_file': filename
+        }
+    return list(contacts.values())
+
+
+def existing_emails(exports_dir=None, csv_files=None):
+    """Every email already exported, for scripts that must not rediscover known contacts"""
+    return {contact['email'] for contact in load_contacts(exports_dir, csv_files)}
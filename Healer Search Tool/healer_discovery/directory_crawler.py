@@ -0,0 +1,240 @@
+"""
+DIRECTORY CRAWLER
+Walk a directory's paginated listings (Psychology Today, Thumbtack,
+Wellness.com, association member lists) and fetch the practitioner profiles
+they link to concurrently, instead of one listing page and ten profiles per
+path fetched one after another.
+
+    crawler = DirectoryCrawler(self.session, extract=self.extract_profile,
+                               profile_pattern=r'/us/therapists/[^/?#]+/\\d+',
+                               target=100, sink=JsonLinesSink.for_source('psychology_today'))
+    for record in crawler.crawl(listing_urls):
+        healers.append(record)
+
+Listing pages are followed through rel="next" links, "Next" anchors, or by
+counting up a page= parameter while pages keep producing new profiles.
+Profile pages are downloaded by a small thread pool, at most `per_host`
+requests at a time per host and `delay` seconds apart. Parsing and
+extraction stay on the calling thread, so extract callbacks can keep using
+the scraper's own sets and lists. Each record is written to the sink as soon
+as it is extracted, and the crawl stops once `target` records are found.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
+
+from bs4 import BeautifulSoup
+
+from .canonical import canonical_url
+from .metrics import metrics
+from .paths import EXPORTS_DIR
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 6
+DEFAULT_PER_HOST = 2
+DEFAULT_DELAY = 1.0
+DEFAULT_MAX_PAGES = 10
+PROFILE_HINTS = ('profile', 'practitioner', 'therapist', 'healer', 'provider')
+NEXT_TEXT = re.compile(r'^\s*(next|next page|more results|›|»|>)\s*$', re.IGNORECASE)
+
+
+def next_page_url(soup, url, found_profiles):
+    """URL of the following listing page, or None on the last page"""
+    link = soup.find(['a', 'link'], rel='next', href=True)
+    if link is None:
+        link = soup.find('a', href=True, string=NEXT_TEXT)
+    if link is not None:
+        return urljoin(url, link['href'])
+
+    if not found_profiles:
+        return None
+    parsed = urlparse(url)
+    params = dict(parse_qsl(parsed.query))
+    if not params.get('page', '1').isdigit():
+        return None
+    params['page'] = str(int(params.get('page', '1')) + 1)
+    return urlunparse(parsed._replace(query=urlencode(params)))
+
+
+class HostLimiter:
+    """At most `per_host` requests in flight per host, started at least `delay` seconds apart"""
+
+    def __init__(self, per_host=DEFAULT_PER_HOST, delay=DEFAULT_DELAY):
+        self.per_host = per_host
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.slots = {}
+        self.next_start = {}
+
+    def __call__(self, url):
+        return _HostSlot(self, urlparse(url).netloc.lower())
+
+
+class _HostSlot:
+    def __init__(self, limiter, host):
+        self.limiter = limiter
+        self.host = host
+
+    def __enter__(self):
+        limiter = self.limiter
+        with limiter.lock:
+            slot = limiter.slots.setdefault(self.host, threading.Semaphore(limiter.per_host))
+        slot.acquire()
+        with limiter.lock:
+            start = max(time.time(), limiter.next_start.get(self.host, 0))
+            limiter.next_start[self.host] = start + limiter.delay
+        time.sleep(max(0, start - time.time()))
+
+    def __exit__(self, *exc):
+        self.limiter.slots[self.host].release()
+        return False
+
+
+class JsonLinesSink:
+    """Append each record to a .jsonl file as it arrives, so an interrupted crawl keeps what it found"""
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    @classmethod
+    def for_source(cls, source):
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return cls(os.path.join(EXPORTS_DIR, f"directory_{source}_{timestamp}.jsonl"))
+
+    def __call__(self, record):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, default=str) + '\n')
+        self.count += 1
+
+
+class DirectoryCrawler:
+    """Paginated listing walk plus concurrent, per-host limited profile fetches"""
+
+    def __init__(self, session, extract, profile_pattern=None, profile_hints=PROFILE_HINTS, fetch=None,
+                 max_pages=DEFAULT_MAX_PAGES, workers=DEFAULT_WORKERS, per_host=DEFAULT_PER_HOST,
+                 delay=DEFAULT_DELAY, timeout=10, target=None, sink=None, extract_listings=False, skip_text=()):
+        self.session = session
+        self.extract = extract                  # (url, html) -> record, list of records or None
+        self.profile_pattern = re.compile(profile_pattern) if profile_pattern else None
+        self.profile_hints = profile_hints
+        self.fetch_page = fetch                 # url -> html or None; defaults to a session GET
+        self.max_pages = max_pages
+        self.workers = workers
+        self.limiter = HostLimiter(per_host, delay)
+        self.timeout = timeout
+        self.target = target
+        self.sink = sink
+        self.extract_listings = extract_listings
+        self.skip_text = skip_text              # link texts that mark navigation rather than profiles
+        self.seen = set()
+        self.found = 0
+
+    # -- fetching -------------------------------------------------------------
+
+    def fetch(self, url):
+        with self.limiter(url):
+            try:
+                if self.fetch_page:
+                    return self.fetch_page(url)
+                response = self.session.get(url, timeout=self.timeout)
+            except Exception as e:
+                logger.debug(f"Directory fetch failed for {url}: {e}")
+                return None
+            return response.text if response.status_code == 200 else None
+
+    # -- listings -------------------------------------------------------------
+
+    def is_profile_link(self, href):
+        if self.profile_pattern is not None:
+            return bool(self.profile_pattern.search(href))
+        return any(hint in href.lower() for hint in self.profile_hints)
+
+    def profile_links(self, soup, url):
+        """New profile URLs on a listing page, on the directory's own host"""
+        host = urlparse(url).netloc.lower()
+        links = []
+        for link in soup.find_all('a', href=True):
+            href = link['href']
+            if not self.is_profile_link(href):
+                continue
+            if self.skip_text and any(text in link.get_text().lower() for text in self.skip_text):
+                continue
+            profile_url = urljoin(url, href).split('#')[0]
+            key = canonical_url(profile_url)
+            if urlparse(profile_url).netloc.lower() == host and key not in self.seen:
+                self.seen.add(key)
+                links.append(profile_url)
+        return links
+
+    # -- crawl ----------------------------------------------------------------
+
+    def emit(self, url, html):
+        """Extract records from a downloaded page and hand them to the sink"""
+        if not html:
+            return []
+        try:
+            records = self.extract(url, html)
+        except Exception as e:
+            logger.debug(f"Extraction failed for {url}: {e}")
+            return []
+        if not records:
+            return []
+        records = records if isinstance(records, list) else [records]
+        for record in records:
+            if self.sink:
+                self.sink(record)
+        self.found += len(records)
+        metrics.inc('directory_records_total', len(records))
+        return records
+
+    def crawl(self, start_urls, first_pages=None):
+        """Yield extracted records as they arrive; first_pages maps listing URLs already downloaded to their HTML"""
+        first_pages = first_pages or {}
+        listings = deque((url, 1) for url in start_urls)
+        pool = ThreadPoolExecutor(max_workers=self.workers)
+        pending = {}
+
+        try:
+            while listings or pending:
+                if self.target and self.found >= self.target:
+                    return
+
+                # Keep the pool busy: read the next listing page while profiles download
+                if listings and len(pending) < self.workers * 3:
+                    url, page = listings.popleft()
+                    html = first_pages.pop(url, None) or self.fetch(url)
+                    metrics.inc('directory_pages_total', kind='listing')
+                    if html:
+                        soup = BeautifulSoup(html, 'html.parser')
+                        links = self.profile_links(soup, url)
+                        logger.info(f"Listing page {page} of {urlparse(url).netloc}: {len(links)} new profiles")
+                        for profile_url in links:
+                            pending[pool.submit(self.fetch, profile_url)] = profile_url
+                        if self.extract_listings:
+                            yield from self.emit(url, html)
+                        next_url = next_page_url(soup, url, bool(links))
+                        if next_url and page < self.max_pages and canonical_url(next_url) not in self.seen:
+                            self.seen.add(canonical_url(next_url))
+                            listings.appendleft((next_url, page + 1))
+
+                if not pending:
+                    continue
+                can_read_listing = listings and len(pending) < self.workers * 3
+                done, _ = wait(pending, timeout=0 if can_read_listing else None, return_when=FIRST_COMPLETED)
+                for future in done:
+                    profile_url = pending.pop(future)
+                    metrics.inc('directory_pages_total', kind='profile')
+                    yield from self.emit(profile_url, future.result())
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
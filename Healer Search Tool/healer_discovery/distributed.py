@@ -0,0 +1,220 @@
+"""
+DISTRIBUTED CRAWL WORKERS
+Spread one discovery crawl over several worker processes, on one machine or on
+several machines that mount this folder, through the shared work queue in
+healers_discovery.db (see work_queue.py).
+
+    python -m healer_discovery.distributed seed network
+    python -m healer_discovery.distributed worker network            # on each machine, as often as wanted
+    python -m healer_discovery.distributed run network --workers 4   # seed + local workers + merge
+    python -m healer_discovery.distributed status network
+    python -m healer_discovery.distributed merge network --metrics prom
+
+Workers lease batches of URLs, renew their leases from a heartbeat thread and
+store each URL's result once. The merge step writes every result to one
+export and sums the metrics snapshots the workers reported with their
+heartbeats into a single metrics file. All workers share the per-platform
+daily limits in the rate_limits table.
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+
+from .metrics import MetricsRegistry, metrics
+from .paths import EXPORTS_DIR, RESULTS_DIR, TOOL_DIR
+from .scripts import load_script
+from .work_queue import WorkQueue, new_worker_id
+
+logger = logging.getLogger(__name__)
+
+# job -> (script, class, per-URL method, attribute(s)/method giving the seed URLs, platform, action_type)
+JOBS = {
+    'network': ('healer-network-crawler.py', 'HealerNetworkCrawler', 'extract_contact_info',
+                ['seed_urls', 'comprehensive_urls'], 'website', 'extraction'),
+    'comprehensive': ('comprehensive-healer-urls.py', 'ComprehensiveHealerExtractor', 'extract_healer_info',
+                      ['healer_sites'], 'website', 'extraction'),
+    'reach-100': ('reach-100-simple.py', 'SimpleHundredSearch', 'extract_emails_from_site',
+                  'generate_massive_url_list', 'website', 'extraction')
+}
+
+
+def build_scraper(job):
+    script, class_name = JOBS[job][:2]
+    return getattr(load_script(script), class_name)()
+
+
+def seed_urls(scraper, job):
+    source = JOBS[job][3]
+    if isinstance(source, str):
+        return getattr(scraper, source)()
+    urls = []
+    for attribute in source:
+        urls.extend(url for url in getattr(scraper, attribute, []) if url not in urls)
+    return urls
+
+
+def seed(job, db_path=None):
+    """Queue the job's URL list; earlier URLs get higher priority so the scripts' ordering is kept"""
+    scraper = build_scraper(job)
+    urls = seed_urls(scraper, job)
+    platform, action_type = JOBS[job][4:6]
+    queue = WorkQueue(job, db_path)
+    added = queue.enqueue([(url, len(urls) - i) for i, url in enumerate(urls)], platform, action_type)
+    queue.close()
+    logger.info(f"Seeded {added} new URLs for '{job}' ({len(urls) - added} already queued)")
+    return added
+
+
+class CrawlWorker:
+    """Lease URLs from the shared queue and run the job's per-URL extraction on them"""
+
+    def __init__(self, job, db_path=None, batch_size=10, heartbeat_seconds=30, delay=1.0, worker_id=None):
+        self.job = job
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.heartbeat_seconds = heartbeat_seconds
+        self.delay = delay
+        self.worker_id = worker_id or new_worker_id()
+        self.queue = WorkQueue(job, db_path)
+        self.processed = 0
+        self.stopping = threading.Event()
+
+    def heartbeat_loop(self):
+        # sqlite3 connections are per-thread, so the heartbeat has its own
+        queue = WorkQueue(self.job, self.db_path)
+        try:
+            while not self.stopping.wait(self.heartbeat_seconds):
+                queue.heartbeat(self.worker_id, self.processed, metrics.snapshot())
+        finally:
+            queue.close()
+
+    def run(self):
+        metrics.enable(export=None)
+        scraper = build_scraper(self.job)
+        extract = getattr(scraper, JOBS[self.job][2])
+
+        self.queue.register_worker(self.worker_id)
+        heartbeat = threading.Thread(target=self.heartbeat_loop, daemon=True)
+        heartbeat.start()
+        logger.info(f"Worker {self.worker_id} started on '{self.job}'")
+
+        status = 'crashed'
+        try:
+            while True:
+                batch = self.queue.claim(self.worker_id, self.batch_size)
+                if not batch:
+                    if self.queue.counts().get('leased'):
+                        time.sleep(self.heartbeat_seconds / 2)  # Other workers' leases may come back
+                        continue
+                    break  # Queue drained, or today's platform limits are used up
+
+                for url in batch:
+                    try:
+                        result = extract(url)
+                    except Exception as e:
+                        self.queue.fail(url, self.worker_id, e)
+                        metrics.inc('worker_urls_total', outcome='error')
+                    else:
+                        self.queue.complete(url, self.worker_id, result)
+                        metrics.inc('worker_urls_total', outcome='found' if result else 'empty')
+                    self.processed += 1
+                    time.sleep(self.delay)
+            status = 'finished'
+        finally:
+            self.stopping.set()
+            heartbeat.join()
+            self.queue.release(self.worker_id)
+            self.queue.heartbeat(self.worker_id, self.processed, metrics.snapshot(), status=status)
+            self.queue.close()
+
+        logger.info(f"Worker {self.worker_id} {status} after {self.processed} URLs")
+        return self.processed
+
+
+def merge(job, db_path=None, export='json'):
+    """Write every stored result to one JSON export and the summed worker metrics to one file"""
+    queue = WorkQueue(job, db_path)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    results = [{'url': url, 'worker_id': worker_id, 'result': result}
+               for url, worker_id, result in queue.results() if result]
+    os.makedirs(EXPORTS_DIR, exist_ok=True)
+    results_file = os.path.join(EXPORTS_DIR, f"distributed_{job}_results_{timestamp}.json")
+    with open(results_file, 'w', encoding='utf-8') as f:
+        json.dump({'job': job, 'counts': queue.counts(), 'results': results}, f, indent=2)
+
+    merged = MetricsRegistry()
+    workers = queue.workers()
+    for worker in workers:
+        if worker['metrics']:
+            merged.merge(json.loads(worker['metrics']))
+    metrics_dir = os.path.join(RESULTS_DIR, 'metrics')
+    os.makedirs(metrics_dir, exist_ok=True)
+    metrics_file = merged.write(os.path.join(metrics_dir, f"distributed_{job}_{timestamp}.{export}"), export)
+
+    queue.close()
+    return results_file, metrics_file, len(results), len(workers)
+
+
+def print_status(job, db_path=None):
+    queue = WorkQueue(job, db_path)
+    counts = queue.counts()
+    print(f"JOB '{job}': " + ', '.join(f"{status} {n}" for status, n in sorted(counts.items())))
+    now = time.time()
+    for worker in queue.workers():
+        age = now - (worker['heartbeat_at'] or now)
+        print(f"  {worker['worker_id']:<40} {worker['status']:<9} {worker['processed']:>5} URLs  "
+              f"heartbeat {age:.0f}s ago")
+    queue.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Distributed discovery crawl over a shared SQLite work queue")
+    parser.add_argument('action', choices=['seed', 'worker', 'run', 'status', 'merge'])
+    parser.add_argument('job', choices=sorted(JOBS))
+    parser.add_argument('--db', help="discovery database (default: Discovery Results/databases/healers_discovery.db)")
+    parser.add_argument('--workers', type=int, default=4, help="local worker processes for 'run'")
+    parser.add_argument('--batch', type=int, default=10, help="URLs leased per claim")
+    parser.add_argument('--delay', type=float, default=1.0, help="seconds between URLs in each worker")
+    parser.add_argument('--heartbeat', type=float, default=30, help="seconds between worker heartbeats")
+    parser.add_argument('--metrics', choices=['prom', 'json'], default='prom', help="merged metrics format")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if args.action in ('seed', 'run'):
+        seed(args.job, args.db)
+
+    if args.action == 'worker':
+        CrawlWorker(args.job, args.db, args.batch, args.heartbeat, args.delay).run()
+
+    elif args.action == 'run':
+        print(f"DISTRIBUTED CRAWL - {args.job} with {args.workers} workers")
+        print("=" * 60)
+        command = [sys.executable, '-m', 'healer_discovery.distributed', 'worker', args.job,
+                   '--batch', str(args.batch), '--delay', str(args.delay), '--heartbeat', str(args.heartbeat)]
+        if args.db:
+            command += ['--db', args.db]
+        processes = [subprocess.Popen(command, cwd=TOOL_DIR) for _ in range(args.workers)]
+        for process in processes:
+            process.wait()
+
+    if args.action in ('run', 'merge'):
+        results_file, metrics_file, found, workers = merge(args.job, args.db, args.metrics)
+        print(f"\nMerged {found} results from {workers} workers")
+        print(f"Results: {results_file}")
+        print(f"Metrics: {metrics_file}")
+
+    if args.action in ('run', 'status'):
+        print_status(args.job, args.db)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+SITE EXTRACTION TEMPLATES
+Per-site CSS selectors for the profile fields the scrapers read (the name,
+plus LinkedIn's headline and location), declared once here instead of as
+selector lists and hand-written loops in every scraper:
+
+    template = template_for(profile_url)          # compiled on first use, then cached
+    fields = template.extract(soup)               # {'name': ..., 'headline': ..., 'location': ...}
+
+Every selector of a template is compiled once (soupsieve, which BeautifulSoup
+already uses for select()). A page is then read in a single pass over its
+tags that notes the first element each selector matches, and each field takes
+the value of its highest-priority selector with a usable match. That gives
+the same result as trying select_one() per selector, in one traversal instead
+of one per selector.
+
+Values of MAX_FIELD_LENGTH characters or more are skipped as paragraphs
+rather than fields, unless the template sets its own max_length. Only fields
+some caller reads are declared: each one costs a selector check on every tag.
+"""
+
+import re
+
+import soupsieve
+
+# name -> hosts it applies to and, per field, selectors in priority order
+TEMPLATES = {
+    'linkedin': {
+        'hosts': ['linkedin.com'],
+        'max_length': None,     # headlines run to 220 characters
+        'fields': {
+            'name': ['h1.text-heading-xlarge', 'h1.pv-text-details__left-panel__headline',
+                     '.pv-text-details__left-panel h1', 'h1', '.artdeco-entity-lockup__title'],
+            'headline': ['.text-body-medium.break-words', '.pv-text-details__left-panel__headline',
+                         '.artdeco-entity-lockup__subtitle'],
+            'location': ['.text-body-small.inline.t-black--light.break-words',
+                         '.pv-text-details__left-panel .text-body-small']
+        }
+    },
+    'psychologytoday': {
+        'hosts': ['psychologytoday.com'],
+        'fields': {
+            'name': ['h1.profile-title', 'h1', '[itemprop="name"]']
+        }
+    },
+    'directory_profile': {
+        'hosts': [],
+        'fields': {
+            'name': ['h1', '.name', '.practitioner-name', '.provider-name', '.business-name', '.title',
+                     '[itemprop="name"]']
+        }
+    }
+}
+
+DEFAULT_TEMPLATE = 'directory_profile'
+MAX_FIELD_LENGTH = 100
+
+SIMPLE_PART = re.compile(r'^([a-zA-Z][\w-]*)?((?:\.[\w-]+)*)$')
+SPACES = re.compile(r'\s+')
+
+
+class _Selector:
+    """One compiled selector plus cheap tag/class pre-checks taken from its last compound part"""
+
+    def __init__(self, selector):
+        self.text = selector
+        self.compiled = soupsieve.compile(selector)
+
+        last = selector.split()[-1]
+        simple = SIMPLE_PART.match(last)
+        self.tag = simple.group(1).lower() if simple and simple.group(1) else None
+        self.classes = set(simple.group(2).split('.')[1:]) if simple else set()
+
+    def matches(self, tag):
+        if self.tag and tag.name != self.tag:
+            return False
+        if self.classes and not self.classes.issubset(tag.get('class') or ()):
+            return False
+        return self.compiled.match(tag)
+
+    def value(self, tag):
+        # Text nodes joined as they appear (inline markup keeps its spacing), runs of whitespace collapsed
+        return SPACES.sub(' ', tag.get_text()).strip()
+
+
+class CompiledTemplate:
+    """A site template with every selector compiled, evaluated in one document pass"""
+
+    def __init__(self, name, fields, max_length=MAX_FIELD_LENGTH):
+        self.name = name
+        self.max_length = max_length
+        self.fields = {field: [_Selector(selector) for selector in selectors] for field, selectors in fields.items()}
+        self.selectors = [selector for selectors in self.fields.values() for selector in selectors]
+
+    def extract(self, soup):
+        """{field: value or None} for every field of the template"""
+        first = {}
+        pending = list(self.selectors)
+        for tag in soup.find_all(True):
+            still_pending = []
+            for selector in pending:
+                if selector.matches(tag):
+                    first[selector] = tag
+                else:
+                    still_pending.append(selector)
+            pending = still_pending
+            if not pending:
+                break
+
+        values = {}
+        for field, selectors in self.fields.items():
+            values[field] = None
+            for selector in selectors:
+                tag = first.get(selector)
+                value = selector.value(tag) if tag is not None else ''
+                if value and (not self.max_length or len(value) < self.max_length):
+                    values[field] = value
+                    break
+        return values
+
+
+_compiled = {}
+
+
+def get_template(name):
+    """Compiled template by name (compiled on first use)"""
+    if name not in _compiled:
+        template = TEMPLATES[name]
+        _compiled[name] = CompiledTemplate(name, template['fields'], template.get('max_length', MAX_FIELD_LENGTH))
+    return _compiled[name]
+
+
+def template_for(url):
+    """Compiled template for the site a URL belongs to, or the generic directory profile template"""
+    host = re.sub(r'^https?://', '', url.lower()).split('/')[0].split(':')[0]
+    for name, template in TEMPLATES.items():
+        if any(host == site or host.endswith('.' + site) for site in template['hosts']):
+            return get_template(name)
+    return get_template(DEFAULT_TEMPLATE)
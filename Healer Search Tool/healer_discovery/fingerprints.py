@@ -0,0 +1,189 @@
+"""
+PAGE FINGERPRINTS
+Recognise parked-domain and hosting-template pages, and pages already
+extracted, from the downloaded HTML before it is parsed.
+
+Guessed domains (generate_massive_url_list, comprehensive_urls) mostly land on
+a handful of parking and "coming soon" templates that differ only by the domain
+name. Each page gets two fingerprints of its visible text, with the host name
+taken out:
+
+  * an exact hash, so a page seen before on the same site reuses its earlier
+    extraction result (two sites on one template share the hash but not their
+    results: each has its own contact address)
+  * a 64-bit SimHash over word shingles, so pages within a few bits of a known
+    template are rejected even when prices, dates or wording vary a little
+
+    fingerprints = FingerprintIndex()
+    match = fingerprints.check(url, response.text)
+    if match.template:
+        return []                                 # parked / hosting template
+    if match.duplicate:
+        return match.result                       # same page extracted before
+    ...parse and extract...
+    fingerprints.record(match, url, result)
+
+Templates are learned from pages that read as parked (domain for sale, ...)
+and from empty pages seen identically on several hosts. The index is kept in
+Discovery Results/cache/page_fingerprints.json across runs.
+"""
+
+import atexit
+import hashlib
+import re
+import threading
+import time
+from urllib.parse import urlparse
+
+from .metrics import metrics
+from .page_text import HIDDEN_BLOCKS, TAGS
+from .paths import cache_file
+from .sitemaps import JsonCache
+
+SHINGLE_WORDS = 3
+MAX_SHINGLES = 2000             # enough for a stable SimHash, keeps long pages cheap
+NEAR_DUPLICATE_BITS = 3         # SimHash distance still treated as the same template
+MIN_TEMPLATE_HOSTS = 3          # distinct hosts serving the same empty page before it counts as a template
+MIN_TEMPLATE_WORDS = 8          # near-empty pages are not fingerprinted at all
+INDEX_TTL_HOURS = 30 * 24
+
+PARKED_PHRASES = [
+    'domain for sale', 'this domain is for sale', 'buy this domain', 'parked domain', 'domain parking',
+    'parked free', 'this domain may be for sale', 'domain name is for sale', 'make an offer on this domain',
+    'future home of', 'account suspended', 'default web site page',
+    'welcome to nginx', 'apache2 ubuntu default page'
+]
+
+ENTITIES = re.compile(r'&#?\w+;')
+WORDS = re.compile(r'[a-z0-9]+')
+
+
+def page_words(html, url=None):
+    """Lower-case words of the page's visible text, without the site's own host name"""
+    text = ENTITIES.sub(' ', TAGS.sub(' ', HIDDEN_BLOCKS.sub(' ', html))).lower()
+    if url:
+        host = urlparse(url).netloc.lower().split(':')[0].replace('www.', '', 1)
+        name = host.rsplit('.', 1)[0]
+        if host:
+            text = text.replace(host, ' ')
+        if len(name) >= 6:  # Short names would cut ordinary words apart
+            text = text.replace(name, ' ')
+    return WORDS.findall(text)
+
+
+def site_of(url):
+    return urlparse(url).netloc.lower().split(':')[0].replace('www.', '', 1)
+
+
+def _hash64(text):
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def simhash(words):
+    """64-bit SimHash of the page's word shingles"""
+    shingles = {' '.join(words[i:i + SHINGLE_WORDS]) for i in range(max(1, len(words) - SHINGLE_WORDS + 1))}
+    weights = [0] * 64
+    for shingle in list(shingles)[:MAX_SHINGLES]:
+        value = _hash64(shingle)
+        for bit in range(64):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+
+def hamming(a, b):
+    return bin(a ^ b).count('1')
+
+
+class PageMatch:
+    """Fingerprints of one page and what the index already knows about them"""
+
+    def __init__(self, exact=None, simhash=None, parked=False, template=None, duplicate=False, result=None):
+        self.exact = exact
+        self.simhash = simhash
+        self.parked = parked
+        self.template = template        # label of the matching template, or None
+        self.duplicate = duplicate      # exact page extracted before
+        self.result = result
+
+    @property
+    def fingerprinted(self):
+        return self.exact is not None
+
+
+class FingerprintIndex:
+    """Known template fingerprints and per-page extraction results, saved at exit"""
+
+    def __init__(self, path=None, ttl_hours=INDEX_TTL_HOURS):
+        self.cache = JsonCache(path or cache_file('page_fingerprints.json'), ttl_hours)
+        self.lock = threading.Lock()
+        self.templates = {}  # simhash -> label
+        for key, entry in self.cache.entries.items():
+            if key.startswith('template:') and time.time() - entry.get('fetched_at', 0) < self.cache.ttl:
+                self.templates[int(key.split(':', 1)[1], 16)] = entry.get('label', 'template')
+        atexit.register(self.save)
+
+    def save(self):
+        with self.lock:
+            self.cache.save()
+
+    def nearest_template(self, value):
+        for template, label in self.templates.items():
+            if hamming(template, value) <= NEAR_DUPLICATE_BITS:
+                return label
+        return None
+
+    def check(self, url, html):
+        """Fingerprint a downloaded page and look it up; call before parsing it"""
+        words = page_words(html, url)
+        if len(words) < MIN_TEMPLATE_WORDS:
+            return PageMatch()
+
+        text = ' '.join(words)
+        match = PageMatch(exact=hashlib.sha1(text.encode('utf-8')).hexdigest(), simhash=simhash(words),
+                          parked=any(phrase in text for phrase in PARKED_PHRASES))
+        host = site_of(url)
+
+        with self.lock:
+            if match.parked:
+                self.add_template(match.simhash, 'parked', url)
+            match.template = self.nearest_template(match.simhash)
+
+            # Results are only reused on the site they came from; the hash itself ignores the host name
+            entry = self.cache.get(f"page:{match.exact}")
+            if entry is not None and match.template is None and host in entry.get('results', {}):
+                match.duplicate = True
+                match.result = entry['results'][host]
+
+        if match.template:
+            metrics.inc('fingerprint_matches_total', kind='template')
+        elif match.duplicate:
+            metrics.inc('fingerprint_matches_total', kind='duplicate')
+        return match
+
+    def add_template(self, value, label, url):
+        """Remember a template fingerprint; call with the lock held"""
+        key = f"template:{value:016x}"
+        entry = self.cache.entries.get(key) or {'label': label, 'example': url, 'matches': 0}
+        entry['matches'] += 1
+        self.cache.put(key, entry)
+        self.templates[value] = entry['label']
+
+    def record(self, match, url, result):
+        """Store the extraction result of a fingerprinted page; empty pages repeated across hosts become templates"""
+        if not match.fingerprinted or match.template:
+            return
+
+        host = site_of(url)
+        key = f"page:{match.exact}"
+        with self.lock:
+            entry = self.cache.entries.get(key) or {'hosts': []}
+            entry.pop('result', None)  # Older entries kept one result for every host
+            if host not in entry['hosts']:
+                entry['hosts'] = (entry['hosts'] + [host])[-10:]
+            results = {h: r for h, r in entry.get('results', {}).items() if h in entry['hosts']}
+            results[host] = result or None
+            entry['results'] = results
+            self.cache.put(key, entry)
+
+            if not result and len(entry['hosts']) >= MIN_TEMPLATE_HOSTS:
+                self.add_template(match.simhash, 'shared empty page', url)
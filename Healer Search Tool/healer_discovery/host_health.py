@@ -0,0 +1,240 @@
+"""
+PER-HOST ADAPTIVE TIMEOUTS & CIRCUIT BREAKER
+Learn how fast each host answers and stop waiting on the ones that never do.
+
+Every session from create_session() is instrumented, but nothing changes until
+the tracker is enabled (usually from a --adaptive-hosts flag):
+
+    host_health.enable()                     # loads/saves Discovery Results/cache/host_health.json
+
+Once enabled:
+  * each host's time to first byte (connect + server wait, i.e. response.elapsed)
+    is smoothed like a TCP retransmit timer (srtt + 4 * rttvar), and after a few
+    samples requests to that host use that bound instead of the script's fixed
+    timeout (never longer than what the script asked for)
+  * consecutive connection errors, timeouts and 5xx answers open a circuit for
+    the host; requests to an open host fail instantly with CircuitOpenError and
+    schedulers can skip its URLs with host_health.available(url)
+  * the circuit is retried with a single probe after a cooldown that doubles
+    each time it trips, and the state is kept across runs
+"""
+
+import atexit
+import logging
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from urllib3.exceptions import NameResolutionError
+
+from .metrics import metrics
+from .paths import cache_file
+from .sitemaps import JsonCache
+
+logger = logging.getLogger(__name__)
+
+MIN_SAMPLES = 3              # observations before a host's timeout is adapted
+MIN_CONNECT_TIMEOUT = 2.0
+MIN_READ_TIMEOUT = 3.0
+TIMEOUT_MARGIN = 2.0         # headroom on top of srtt + 4 * rttvar
+
+FAILURE_THRESHOLD = 3        # consecutive failures that open the circuit
+BASE_COOLDOWN = 15 * 60      # first open period, doubled on every re-trip
+MAX_COOLDOWN = 24 * 3600
+STATE_TTL_HOURS = 7 * 24     # forget hosts not seen for a week
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of contacting a host whose circuit is open"""
+
+
+def host_of(url):
+    return urlparse(url).netloc.lower()
+
+
+def split_timeout(timeout):
+    """(connect, read) from a requests timeout value; None stays None"""
+    if isinstance(timeout, (tuple, list)):
+        return timeout[0], timeout[1]
+    return timeout, timeout
+
+
+def is_permanent_failure(error):
+    """DNS failures will not fix themselves between retries, so they open the circuit at once"""
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, NameResolutionError)
+
+
+class HostHealthTracker:
+    """Process-wide per-host latency and failure state; a pass-through until enable() is called"""
+
+    def __init__(self):
+        self.enabled = False
+        self.lock = threading.Lock()
+        self.cache = None
+        self.probing = {}            # host -> thread sending its probe request
+
+    def enable(self, path=None, ttl_hours=STATE_TTL_HOURS):
+        """Start adapting timeouts and breaking circuits; state is saved at exit"""
+        self.cache = JsonCache(path or cache_file('host_health.json'), ttl_hours)
+        if not self.enabled:
+            atexit.register(self.save)
+        self.enabled = True
+
+        now = time.time()
+        open_hosts = sum(1 for entry in self.cache.entries.values() if entry.get('open_until', 0) > now)
+        if open_hosts:
+            logger.info(f"Host health: {open_hosts} hosts still have an open circuit from earlier runs")
+        return self
+
+    def save(self):
+        if self.cache:
+            with self.lock:
+                self.cache.save()
+
+    # -- state ----------------------------------------------------------------
+
+    def state(self, host):
+        """Current entry for a host (created on first use); call with the lock held"""
+        entry = self.cache.get(host)
+        if entry is None:
+            entry = {'srtt': None, 'rttvar': None, 'samples': 0, 'failures': 0, 'trips': 0, 'open_until': 0}
+            self.cache.put(host, entry)
+        return entry
+
+    def allow(self, url):
+        """False while the host's circuit is open; after the cooldown one probe request is let through
+
+        The probe slot belongs to the calling thread, so asking again from that thread (the
+        session hook after a scheduler check) keeps it instead of rejecting the probe itself.
+        """
+        if not self.enabled:
+            return True
+        host = host_of(url)
+        with self.lock:
+            entry = self.cache.entries.get(host)
+            if not entry or entry.get('failures', 0) < FAILURE_THRESHOLD:
+                return True
+            if self.probing.get(host) == threading.get_ident():
+                return True
+            if time.time() < entry.get('open_until', 0) or host in self.probing:
+                return False
+            self.probing[host] = threading.get_ident()
+            return True
+
+    def available(self, url):
+        """Scheduler check: False while the circuit is open or another probe is out; claims nothing"""
+        if not self.enabled:
+            return True
+        host = host_of(url)
+        with self.lock:
+            entry = self.cache.entries.get(host)
+            if not entry or entry.get('failures', 0) < FAILURE_THRESHOLD:
+                return True
+            if host in self.probing:
+                return self.probing[host] == threading.get_ident()
+            return time.time() >= entry.get('open_until', 0)
+
+    def timeout_for(self, url, requested):
+        """The smaller of the requested timeout and the one learned for the host"""
+        if not self.enabled or requested is None:
+            return requested
+        with self.lock:
+            entry = self.cache.entries.get(host_of(url))
+            if not entry or entry.get('samples', 0) < MIN_SAMPLES:
+                return requested
+            learned = (entry['srtt'] + 4 * entry['rttvar']) * TIMEOUT_MARGIN
+
+        connect, read = split_timeout(requested)
+        return (
+            min(connect, max(MIN_CONNECT_TIMEOUT, learned)) if connect is not None else None,
+            min(read, max(MIN_READ_TIMEOUT, learned)) if read is not None else None
+        )
+
+    # -- outcomes -------------------------------------------------------------
+
+    def record_success(self, url, seconds):
+        host = host_of(url)
+        with self.lock:
+            self.probing.pop(host, None)
+            entry = self.state(host)
+            if entry['srtt'] is None:
+                entry['srtt'], entry['rttvar'] = seconds, seconds / 2
+            else:
+                entry['rttvar'] = 0.75 * entry['rttvar'] + 0.25 * abs(entry['srtt'] - seconds)
+                entry['srtt'] = 0.875 * entry['srtt'] + 0.125 * seconds
+            entry['samples'] += 1
+            if entry['failures'] >= FAILURE_THRESHOLD:
+                logger.info(f"Circuit closed for {host}")
+            entry['failures'] = 0
+            entry['trips'] = 0
+            entry['open_until'] = 0
+            self.cache.put(host, entry)
+
+    def record_failure(self, url, reason, permanent=False, timed_out=False):
+        host = host_of(url)
+        with self.lock:
+            self.probing.pop(host, None)
+            entry = self.state(host)
+            entry['failures'] += 1
+            if permanent:
+                entry['failures'] = max(entry['failures'], FAILURE_THRESHOLD)
+            if timed_out and entry['rttvar'] is not None:
+                entry['rttvar'] *= 2  # Back off like a TCP retransmit timer so a tight bound can recover
+            if entry['failures'] >= FAILURE_THRESHOLD:
+                cooldown = min(MAX_COOLDOWN, BASE_COOLDOWN * 2 ** entry['trips'])
+                entry['trips'] += 1
+                entry['open_until'] = time.time() + cooldown
+                entry['last_error'] = reason
+                logger.info(f"Circuit open for {host} for {cooldown // 60:.0f} min ({reason})")
+                metrics.inc('circuit_trips_total', host=host)
+            self.cache.put(host, entry)
+
+    def release(self, url):
+        """End a probe that finished without a verdict on the host (e.g. too many redirects)"""
+        with self.lock:
+            self.probing.pop(host_of(url), None)
+
+    # -- session hook ---------------------------------------------------------
+
+    def instrument_session(self, session, default_timeout=None):
+        """Apply adaptive timeouts and the circuit breaker to every request sent by the session"""
+        if getattr(session, '_healer_host_health', False):
+            return session
+
+        original_send = session.send
+        tracker = self
+
+        def send(request, **kwargs):
+            if not tracker.enabled:
+                return original_send(request, **kwargs)
+
+            url = request.url
+            if not tracker.allow(url):
+                metrics.inc('circuit_rejections_total', host=host_of(url))
+                raise CircuitOpenError(f"Circuit open for {host_of(url)}", request=request)
+
+            kwargs['timeout'] = tracker.timeout_for(url, kwargs.get('timeout') or default_timeout)
+            try:
+                response = original_send(request, **kwargs)
+            except requests.exceptions.RequestException as e:
+                if isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+                    tracker.record_failure(url, type(e).__name__, permanent=is_permanent_failure(e),
+                                           timed_out=isinstance(e, requests.exceptions.Timeout))
+                else:
+                    tracker.release(url)
+                raise
+
+            if response.status_code >= 500:
+                tracker.record_failure(url, f"HTTP {response.status_code}")
+            else:
+                tracker.record_success(url, response.elapsed.total_seconds())
+            return response
+
+        session.send = send
+        session._healer_host_health = True
+        return session
+
+
+host_health = HostHealthTracker()
@@ -0,0 +1,197 @@
+"""
+HOSTING CLUSTERS
+Skip guessed domains that are parked before sending them a single HTTP request.
+
+Most names from the URL generators (generate_massive_url_list,
+generate_new_healer_urls) are either unregistered or sit with a parking
+provider, and parking providers answer from a small set of IP addresses and
+nameservers. Candidates are resolved up front (in parallel, DNS only) and
+grouped by IP address and nameserver domain. Each fetch reports how the page
+turned out, and clusters that have only ever served parked or irrelevant pages
+are dropped from later candidate lists:
+
+    hosting = HostingClusters()
+    urls = hosting.plan(urls)                     # unregistered + parked clusters removed
+    ...
+    hosting.record(url, 'parked')                 # or 'irrelevant' / 'relevant'
+
+Shared hosting (Squarespace, Wix, ...) also serves real practices from one IP,
+so a cluster is only written off after several pages and no relevant one.
+Nameservers are shared even more widely (registrar defaults, Cloudflare), so a
+host is only skipped when its IP cluster is dead, and when it also has
+nameservers, when one of those agrees.
+Nameservers are read when dnspython is installed; otherwise IP addresses alone
+are used. DNS answers are kept for a week (cache/dns_answers.json) and cluster
+outcomes for two months (cache/hosting_clusters.json).
+"""
+
+import atexit
+import logging
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+try:
+    import dns.resolver
+except ImportError:
+    dns = None
+
+from .metrics import metrics
+from .paths import cache_file
+from .sitemaps import JsonCache
+
+logger = logging.getLogger(__name__)
+
+RESOLVE_WORKERS = 32
+HOST_TTL_HOURS = 7 * 24
+CLUSTER_TTL_HOURS = 60 * 24
+MIN_OBSERVATIONS = 5             # pages seen from a cluster before it can be written off
+OUTCOMES = ('parked', 'irrelevant', 'relevant')
+
+
+def hostname(url):
+    return urlparse(url).netloc.lower().split(':')[0]
+
+
+def registered_domain(host):
+    """Last two labels of a host name (good enough for .com/.org/.net candidates)"""
+    return '.'.join(host.replace('www.', '', 1).split('.')[-2:])
+
+
+def lookup(host):
+    """{'ips': [...], 'ns': [...]} for a host, {'missing': True} if it does not exist, None if DNS failed"""
+    try:
+        ips = sorted({info[4][0] for info in socket.getaddrinfo(host, 443, proto=socket.IPPROTO_TCP)})
+    except socket.gaierror as e:
+        if e.errno in (socket.EAI_NONAME, getattr(socket, 'EAI_NODATA', socket.EAI_NONAME)):
+            return {'missing': True}
+        return None
+    except (OSError, UnicodeError):
+        return None
+
+    nameservers = []
+    if dns is not None:
+        try:
+            answer = dns.resolver.resolve(registered_domain(host), 'NS', lifetime=5)
+            nameservers = sorted({registered_domain(str(record.target).rstrip('.').lower()) for record in answer})
+        except Exception:
+            pass
+    return {'ips': ips, 'ns': nameservers}
+
+
+class HostingClusters:
+    """Per-host DNS answers and per-cluster page outcomes, saved at exit"""
+
+    def __init__(self, dns_path=None, clusters_path=None):
+        self.hosts = JsonCache(dns_path or cache_file('dns_answers.json'), HOST_TTL_HOURS)
+        self.outcomes = JsonCache(clusters_path or cache_file('hosting_clusters.json'), CLUSTER_TTL_HOURS)
+        self.lock = threading.Lock()
+        atexit.register(self.save)
+
+    def save(self):
+        with self.lock:
+            self.hosts.save()
+            self.outcomes.save()
+
+    # -- resolution -----------------------------------------------------------
+
+    def resolve(self, hosts):
+        """DNS answers for the hosts, looked up in parallel and cached"""
+        answers = {}
+        pending = []
+        for host in set(hosts):
+            entry = self.hosts.get(host)
+            if entry is not None:
+                answers[host] = entry
+            else:
+                pending.append(host)
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=RESOLVE_WORKERS) as pool:
+                fresh = {host: answer for host, answer in zip(pending, pool.map(lookup, pending))
+                         if answer is not None}  # None is resolver trouble, not an answer
+            answers.update(fresh)
+
+            # A batch where nothing resolved says more about the network than the domains
+            if any(not answer.get('missing') for answer in fresh.values()):
+                with self.lock:
+                    for host, answer in fresh.items():
+                        self.hosts.put(host, answer)
+        return answers
+
+    def clusters(self, answer):
+        return self.ip_clusters(answer) + self.ns_clusters(answer)
+
+    def ip_clusters(self, answer):
+        return [f"ip:{ip}" for ip in answer.get('ips', [])]
+
+    def ns_clusters(self, answer):
+        return [f"ns:{ns}" for ns in answer.get('ns', [])]
+
+    # -- outcomes -------------------------------------------------------------
+
+    def cluster_stats(self, cluster):
+        return self.outcomes.get(cluster) or dict.fromkeys(OUTCOMES, 0)
+
+    def record(self, url, outcome):
+        """Count how a fetched page turned out against every cluster its host belongs to"""
+        answer = self.hosts.entries.get(hostname(url))
+        if not answer or answer.get('missing'):
+            return
+        with self.lock:
+            for cluster in self.clusters(answer):
+                stats = self.outcomes.entries.get(cluster) or dict.fromkeys(OUTCOMES, 0)
+                stats[outcome] = stats.get(outcome, 0) + 1
+                self.outcomes.put(cluster, stats)
+
+    def is_dead(self, cluster):
+        """A cluster that has served enough pages, none of them relevant"""
+        stats = self.cluster_stats(cluster)
+        return stats.get('relevant', 0) == 0 and stats.get('parked', 0) + stats.get('irrelevant', 0) >= MIN_OBSERVATIONS
+
+    def is_parked_host(self, answer):
+        """A dead IP cluster, confirmed by a dead nameserver cluster when nameservers are known"""
+        if not any(self.is_dead(cluster) for cluster in self.ip_clusters(answer)):
+            return False
+        ns_clusters = self.ns_clusters(answer)
+        return not ns_clusters or any(self.is_dead(cluster) for cluster in ns_clusters)
+
+    def relevance(self, answer):
+        """Share of relevant pages across the host's clusters (0.5 when nothing is known yet)"""
+        seen = relevant = 0
+        for cluster in self.clusters(answer):
+            stats = self.cluster_stats(cluster)
+            seen += sum(stats.get(outcome, 0) for outcome in OUTCOMES)
+            relevant += stats.get('relevant', 0)
+        return (relevant + 1) / (seen + 2)
+
+    # -- scheduling -----------------------------------------------------------
+
+    def plan(self, urls):
+        """Drop candidates whose domain does not exist or sits in a parked cluster; best clusters first"""
+        urls = list(urls)
+        answers = self.resolve(hostname(url) for url in urls)
+        if urls and not any(not answer.get('missing') for answer in answers.values()):
+            logger.warning("Hosting clusters: no candidate resolved (offline?), keeping the list unchanged")
+            return urls
+
+        kept = []
+        skipped = {'missing': 0, 'parked_cluster': 0}
+        for url in urls:
+            answer = answers.get(hostname(url))
+            if answer and answer.get('missing'):
+                skipped['missing'] += 1
+            elif answer and self.is_parked_host(answer):
+                skipped['parked_cluster'] += 1
+            else:
+                kept.append(url)
+
+        for reason, count in skipped.items():
+            if count:
+                metrics.inc('hosting_skips_total', count, reason=reason)
+        logger.info(f"Hosting clusters: {len(kept)} of {len(urls)} candidates kept "
+                    f"({skipped['missing']} unregistered, {skipped['parked_cluster']} in parked clusters)")
+
+        # Stable sort, so the caller's own ordering decides within equally promising clusters
+        return sorted(kept, key=lambda url: -self.relevance(answers.get(hostname(url), {})))
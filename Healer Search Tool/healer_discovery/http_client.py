@@ -0,0 +1,132 @@
+"""
+SHARED HTTP CLIENT FACTORY
+One place to build the requests.Session every scraper and tester uses: pooled
+keep-alive connections, retries with exponential backoff (honouring
+Retry-After), gzip/deflate plus brotli when a decoder is installed, and a
+default timeout for calls that do not pass one.
+
+    self.session = create_session()                       # scraper defaults
+    session = create_session(retries=0, pool_size=32)     # load testing: report failures as-is
+
+Sessions also pick up per-host adaptive timeouts and circuit breaking once
+host_health.enable() has been called (see host_health.py), and the daily fetch
+budget once budget.enable() has been called (see budget.py). They record the
+redirects they follow and, once redirects.enable() has been called, go straight
+to the known target of an alias URL (see canonical.py).
+
+Module-level helpers replace bare requests.get/post so one-off calls share a
+pooled session as well:
+
+    response = http_client.get(url, headers=headers, timeout=10)
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+
+from .budget import budget
+from .canonical import redirects
+from .host_health import host_health
+
+DEFAULT_TIMEOUT = (5, 20)  # (connect, read) seconds
+DEFAULT_POOL_SIZE = 20
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+DEFAULT_USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                      '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+
+# "gzip,deflate" plus ",br" only when brotli/brotlicffi is importable, since
+# urllib3 can decode a brotli body only if one of them is installed
+ACCEPT_ENCODING = make_headers(accept_encoding=True)['accept-encoding']
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default timeout to requests made without one"""
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT, **kwargs):
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def build_retry(retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF):
+    """Retry idempotent requests on connection errors and 429/5xx, backing off 0.5s, 1s, 2s..."""
+    return Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(['GET', 'HEAD', 'OPTIONS']),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+
+
+def create_session(headers=None, user_agent=DEFAULT_USER_AGENT, pool_size=DEFAULT_POOL_SIZE,
+                   retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF, timeout=DEFAULT_TIMEOUT):
+    """requests.Session with pooled keep-alive connections, retries, compression and a default timeout"""
+    session = requests.Session()
+
+    session.headers.update({
+        'Accept-Encoding': ACCEPT_ENCODING,
+        'Connection': 'keep-alive'
+    })
+    if user_agent:
+        session.headers['User-Agent'] = user_agent
+    if headers:
+        session.headers.update(headers)
+
+    adapter = TimeoutHTTPAdapter(
+        timeout=timeout,
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=build_retry(retries, backoff) if retries else 0
+    )
+    for prefix in ('http://', 'https://'):
+        # Keep adapters mounted by the record/replay harness (HTTPAdapter subclasses)
+        if type(session.get_adapter(prefix)) is HTTPAdapter:
+            session.mount(prefix, adapter)
+
+    # Known redirects are applied first, so circuits and budgets see the host actually contacted,
+    # and open circuits are checked before the budget is charged
+    budget.instrument_session(session)
+    host_health.instrument_session(session, default_timeout=timeout)
+    return redirects.instrument_session(session)
+
+
+_shared = threading.local()
+
+
+def shared_session():
+    """Per-thread default session behind the module-level get/post/head helpers"""
+    session = getattr(_shared, 'session', None)
+    if session is None:
+        session = _shared.session = create_session()
+    return session
+
+
+def request(method, url, **kwargs):
+    return shared_session().request(method, url, **kwargs)
+
+
+def get(url, **kwargs):
+    return request('GET', url, **kwargs)
+
+
+def post(url, **kwargs):
+    return request('POST', url, **kwargs)
+
+
+def head(url, **kwargs):
+    kwargs.setdefault('allow_redirects', False)
+    return request('HEAD', url, **kwargs)
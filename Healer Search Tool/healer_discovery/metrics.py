@@ -0,0 +1,270 @@
+"""
+SCRAPER RUN METRICS
+Lightweight counters, gauges, histograms and timers for discovery runs, exported
+as a Prometheus text file or a JSON snapshot.
+
+Enable in one line (everything below is a no-op until then):
+
+    metrics.enable('prom')            # or 'json'; written at exit
+
+Typical hot-path calls:
+
+    metrics.instrument_session(self.session)         # requests by status/host, bytes, latency
+    with metrics.timer('parse_seconds', parser='html.parser'):
+        soup = BeautifulSoup(content, 'html.parser')
+    metrics.inc('url_yield_total', pattern=url_pattern(url), outcome='contact')
+    metrics.set_gauge('queue_depth', len(urls) - i, queue='candidate_urls')
+"""
+
+import atexit
+import bisect
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from urllib.parse import urlparse
+
+from .paths import RESULTS_DIR
+
+PREFIX = 'healer_'
+
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+BYTES_BUCKETS = (1024, 10 * 1024, 100 * 1024, 512 * 1024, 1024 * 1024, 5 * 1024 * 1024, 20 * 1024 * 1024)
+
+
+def url_pattern(url):
+    """Coarse shape of a URL for yield accounting, e.g. 'www/plain/.com' or 'bare/hyphen/.org/path'"""
+    parsed = urlparse(url)
+    host = parsed.netloc.lower()
+    prefix = 'www' if host.startswith('www.') else 'bare'
+    name, _, tld = host.replace('www.', '', 1).rpartition('.')
+    shape = 'hyphen' if '-' in name else 'plain'
+    pattern = f"{prefix}/{shape}/.{tld}"
+    return pattern + '/path' if parsed.path.strip('/') else pattern
+
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    def __init__(self, registry, name, labels):
+        self.registry = registry
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.registry.observe(self.name, time.perf_counter() - self.start, **self.labels)
+        return False
+
+
+class MetricsRegistry:
+    """Process-wide metric store; disabled (and nearly free) until enable() is called"""
+
+    def __init__(self):
+        self.enabled = False
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.gauges = {}
+        self.histograms = {}
+        self.buckets = {}
+        self.started_at = None
+
+    # -- enabling / exporting -------------------------------------------------
+
+    def enable(self, export='prom', path=None):
+        """Start collecting; write a snapshot in the given format ('prom' or 'json') at exit"""
+        self.enabled = True
+        self.started_at = time.time()
+
+        if export:
+            if path is None:
+                script = os.path.splitext(os.path.basename(sys.argv[0] or 'run'))[0] or 'run'
+                stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                metrics_dir = os.path.join(RESULTS_DIR, 'metrics')
+                os.makedirs(metrics_dir, exist_ok=True)
+                path = os.path.join(metrics_dir, f"{script}_{stamp}.{export}")
+            atexit.register(self.write, path, export)
+
+        return self
+
+    def write(self, path, export='prom'):
+        """Write the current metrics to path as Prometheus text ('prom') or JSON"""
+        content = self.to_prometheus() if export == 'prom' else json.dumps(self.snapshot(), indent=2)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def reset(self):
+        with self.lock:
+            self.counters.clear()
+            self.gauges.clear()
+            self.histograms.clear()
+            self.buckets.clear()
+
+    # -- recording ------------------------------------------------------------
+
+    def inc(self, name, value=1, **labels):
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def set_gauge(self, name, value, **labels):
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.gauges[key] = value
+
+    def observe(self, name, value, buckets=None, **labels):
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            bounds = self.buckets.setdefault(name, tuple(buckets or SECONDS_BUCKETS))
+            hist = self.histograms.get(key)
+            if hist is None:
+                hist = self.histograms[key] = {'counts': [0] * (len(bounds) + 1), 'sum': 0.0, 'count': 0}
+            hist['counts'][bisect.bisect_left(bounds, value)] += 1
+            hist['sum'] += value
+            hist['count'] += 1
+
+    def timer(self, name, **labels):
+        """Context manager observing elapsed seconds into histogram `name`"""
+        if not self.enabled:
+            return NULL_TIMER
+        return _Timer(self, name, labels)
+
+    def instrument_session(self, session):
+        """Count requests by host/status, bytes downloaded and request latency for a requests.Session"""
+        if not self.enabled or getattr(session, '_healer_metrics', False):
+            return session
+
+        original_send = session.send
+        registry = self
+
+        def send(request, **kwargs):
+            host = urlparse(request.url).netloc.lower()
+            start = time.perf_counter()
+            try:
+                response = original_send(request, **kwargs)
+            except Exception as e:
+                registry.inc('http_requests_total', host=host, status='error', error=type(e).__name__)
+                registry.observe('http_request_seconds', time.perf_counter() - start, host=host)
+                raise
+
+            if kwargs.get('stream'):
+                size = int(response.headers.get('Content-Length') or 0)
+            else:
+                size = len(response.content)
+
+            registry.inc('http_requests_total', host=host, status=str(response.status_code))
+            registry.inc('http_bytes_downloaded_total', size, host=host)
+            registry.observe('http_response_bytes', size, buckets=BYTES_BUCKETS)
+            registry.observe('http_request_seconds', time.perf_counter() - start, host=host)
+            return response
+
+        session.send = send
+        session._healer_metrics = True
+        return session
+
+    # -- snapshots ------------------------------------------------------------
+
+    def merge(self, snapshot):
+        """Add another process's snapshot() into this registry (counters and histograms summed, gauges replaced)"""
+        with self.lock:
+            for item in snapshot.get('counters', []):
+                key = (item['name'], tuple(sorted(item['labels'].items())))
+                self.counters[key] = self.counters.get(key, 0) + item['value']
+            for item in snapshot.get('gauges', []):
+                self.gauges[(item['name'], tuple(sorted(item['labels'].items())))] = item['value']
+            for item in snapshot.get('histograms', []):
+                key = (item['name'], tuple(sorted(item['labels'].items())))
+                bounds = self.buckets.setdefault(item['name'], tuple(item['buckets']))
+                if tuple(item['buckets']) != bounds:
+                    continue  # Different bucket layout; cannot be summed
+                hist = self.histograms.setdefault(key, {'counts': [0] * (len(bounds) + 1), 'sum': 0.0, 'count': 0})
+                hist['counts'] = [a + b for a, b in zip(hist['counts'], item['counts'])]
+                hist['sum'] += item['sum']
+                hist['count'] += item['count']
+
+    def snapshot(self):
+        """Plain-dict view of every metric, used for the JSON export"""
+        def series(store):
+            return [{'name': name, 'labels': dict(labels), 'value': value}
+                    for (name, labels), value in sorted(store.items())]
+
+        with self.lock:
+            histograms = []
+            for (name, labels), hist in sorted(self.histograms.items()):
+                histograms.append({
+                    'name': name,
+                    'labels': dict(labels),
+                    'buckets': list(self.buckets[name]),
+                    'counts': list(hist['counts']),
+                    'sum': hist['sum'],
+                    'count': hist['count']
+                })
+
+            return {
+                'started_at': self.started_at,
+                'written_at': time.time(),
+                'counters': series(self.counters),
+                'gauges': series(self.gauges),
+                'histograms': histograms
+            }
+
+    def to_prometheus(self):
+        """Render every metric in the Prometheus text exposition format"""
+        lines = []
+
+        def label_text(labels, extra=()):
+            pairs = list(labels) + list(extra)
+            if not pairs:
+                return ''
+            escaped = (str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, v in pairs)
+            return '{' + ','.join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + '}'
+
+        def emit(store, kind):
+            declared = set()
+            for (name, labels), value in sorted(store.items()):
+                if name not in declared:
+                    lines.append(f"# TYPE {PREFIX}{name} {kind}")
+                    declared.add(name)
+                lines.append(f"{PREFIX}{name}{label_text(labels)} {value}")
+
+        with self.lock:
+            emit(self.counters, 'counter')
+            emit(self.gauges, 'gauge')
+
+            declared = set()
+            for (name, labels), hist in sorted(self.histograms.items()):
+                if name not in declared:
+                    lines.append(f"# TYPE {PREFIX}{name} histogram")
+                    declared.add(name)
+                cumulative = 0
+                for bound, count in zip(list(self.buckets[name]) + ['+Inf'], hist['counts']):
+                    cumulative += count
+                    lines.append(f"{PREFIX}{name}_bucket{label_text(labels, [('le', bound)])} {cumulative}")
+                lines.append(f"{PREFIX}{name}_sum{label_text(labels)} {hist['sum']}")
+                lines.append(f"{PREFIX}{name}_count{label_text(labels)} {hist['count']}")
+
+        return '\n'.join(lines) + '\n'
+
+
+metrics = MetricsRegistry()
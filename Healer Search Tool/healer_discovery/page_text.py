@@ -0,0 +1,135 @@
+"""
+VISIBLE PAGE TEXT
+The text a visitor actually sees, for the email/phone regexes and relevance
+checks, instead of soup.get_text() or the raw response.text with its inline
+JS bundles, CSS, SVG paths and asset URLs (logo@2x.png, @sentry, wixpress).
+Those produced most of the junk "emails" and were most of the bytes scanned
+on every page. Asset-shaped addresses that still turn up (image names in
+alt text, tracker addresses in a mailto:) are caught by is_asset_email().
+
+    text = visible_text(content)                 # scripts, styles, noscript, svg and tags removed
+    emails = re.findall(email_pattern, contact_text(content, text))
+
+contact_text() puts the likeliest contact details first: mailto:/tel: link
+targets (often the only place the address appears), then the footer,
+<address> and contact blocks, then the rest of the visible text. Callers that
+keep the first one or two matches therefore keep the practice's own address.
+
+Raw HTML is handled with regexes (no parse needed); a BeautifulSoup tree can
+be passed instead where the caller already has one.
+"""
+
+import html as html_lib
+import re
+from urllib.parse import unquote
+
+from bs4 import Comment
+
+from .metrics import metrics
+
+HIDDEN_TAGS = ('script', 'style', 'noscript', 'svg', 'template')
+HIDDEN_BLOCKS = re.compile(r'<(script|style|noscript|svg|template)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+UNCLOSED_BLOCK = re.compile(r'<(?:script|style)\b.*\Z', re.IGNORECASE | re.DOTALL)   # truncated page
+COMMENTS = re.compile(r'<!--.*?-->', re.DOTALL)
+TAGS = re.compile(r'<[^>]+>')
+SPACES = re.compile(r'\s+')
+
+MAILTO = re.compile(r'href\s*=\s*["\']?\s*mailto:([^"\'>\s?]+)', re.IGNORECASE)
+TEL = re.compile(r'href\s*=\s*["\']?\s*tel:([^"\'>\s]+)', re.IGNORECASE)
+REGIONS = re.compile(r'<(footer|address)\b[^>]*>(.*?)</\1\s*>', re.IGNORECASE | re.DOTALL)
+CONTACT_BLOCK = re.compile(r'<(?:div|section|aside|ul)\b[^>]*\b(?:id|class)\s*=\s*["\'][^"\']*contact[^"\']*["\'][^>]*>',
+                           re.IGNORECASE)
+CONTACT_BLOCK_CHARS = 4000       # a regex cannot find the matching </div>; this much markup covers a contact block
+CONTACT_ATTR = re.compile('contact', re.IGNORECASE)
+
+# Addresses that are really asset names, error trackers or site-builder internals
+ASSET_EMAIL_PATTERNS = ['@sentry', 'sentry.io', 'wixpress.com', '@wixpress', '@2x.', '@3x.',
+                        '.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp']
+
+
+def is_asset_email(email):
+    email = email.lower()
+    return any(pattern in email for pattern in ASSET_EMAIL_PATTERNS)
+
+
+def is_soup(page):
+    return not isinstance(page, str)
+
+
+def drop_hidden(markup):
+    """Markup without script/style/noscript/svg/template blocks and comments (an unclosed script runs to the end)"""
+    return UNCLOSED_BLOCK.sub(' ', COMMENTS.sub(' ', HIDDEN_BLOCKS.sub(' ', markup)))
+
+
+def strip_markup(markup):
+    """Text of markup that has already been through drop_hidden()"""
+    return SPACES.sub(' ', html_lib.unescape(TAGS.sub(' ', markup))).strip()
+
+
+def count_bytes(html, text):
+    metrics.inc('page_text_bytes_total', len(html), kind='html')
+    metrics.inc('page_text_bytes_total', len(text), kind='visible')
+
+
+def visible_text(page):
+    """Text of a page (HTML string or soup) without script/style/noscript/svg content, tags or comments"""
+    if is_soup(page):
+        strings = (s for s in page.find_all(string=True)
+                   if not isinstance(s, Comment) and s.find_parent(HIDDEN_TAGS) is None)
+        return SPACES.sub(' ', ' '.join(strings)).strip()
+
+    text = strip_markup(drop_hidden(page))
+    count_bytes(page, text)
+    return text
+
+
+def link_contacts(page):
+    """(emails, phones) from mailto: and tel: link targets"""
+    if is_soup(page):
+        hrefs = [a['href'].strip() for a in page.find_all('a', href=re.compile(r'^\s*(mailto|tel):', re.IGNORECASE))]
+        emails = [href.split(':', 1)[1].split('?')[0] for href in hrefs if href.lower().startswith('mailto:')]
+        phones = [href.split(':', 1)[1] for href in hrefs if href.lower().startswith('tel:')]
+        return clean_link_targets(emails, phones)
+    return markup_links(drop_hidden(page))  # mailto: strings inside scripts are not links
+
+
+def contact_regions(page):
+    """Visible text of the footer, <address> elements and blocks whose id/class mentions contact"""
+    if is_soup(page):
+        regions = page.find_all(['footer', 'address']) + page.find_all(id=CONTACT_ATTR) + \
+            page.find_all(class_=CONTACT_ATTR)
+        return ' '.join(visible_text(region) for region in regions)
+    # Hidden blocks go first: a fixed-size slice could cut a <script> off before its closing tag
+    return markup_regions(drop_hidden(page))
+
+
+def contact_text(page, text=None):
+    """Link targets, then contact regions, then the visible text: what the contact regexes should scan"""
+    if is_soup(page):
+        emails, phones = link_contacts(page)
+        regions = contact_regions(page)
+        text = visible_text(page) if text is None else text
+    else:
+        markup = drop_hidden(page)  # once, for the links, the regions and the text
+        emails, phones = markup_links(markup)
+        regions = markup_regions(markup)
+        if text is None:
+            text = strip_markup(markup)
+            count_bytes(page, text)
+    return ' '.join(emails + phones + [regions, text])
+
+
+# -- markup already through drop_hidden() ----------------------------------------
+
+def clean_link_targets(emails, phones):
+    return [unquote(email).strip().lower() for email in emails], [unquote(phone).strip() for phone in phones]
+
+
+def markup_links(markup):
+    return clean_link_targets(MAILTO.findall(markup), TEL.findall(markup))
+
+
+def markup_regions(markup):
+    parts = [body for _, body in REGIONS.findall(markup)]
+    parts += [markup[match.start():match.start() + CONTACT_BLOCK_CHARS] for match in CONTACT_BLOCK.finditer(markup)]
+    return ' '.join(strip_markup(part) for part in parts)
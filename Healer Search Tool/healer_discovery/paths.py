@@ -0,0 +1,19 @@
+"""
+SHARED PATHS
+Locations of the Discovery Results folders used by every discovery script.
+"""
+
+import os
+
+TOOL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(TOOL_DIR, 'Discovery Results')
+EXPORTS_DIR = os.path.join(RESULTS_DIR, 'exports')
+DATABASES_DIR = os.path.join(RESULTS_DIR, 'databases')
+CACHE_DIR = os.path.join(RESULTS_DIR, 'cache')
+DISCOVERY_DB = os.path.join(DATABASES_DIR, 'healers_discovery.db')
+
+
+def cache_file(name):
+    """Return the path of a cache file, creating the cache folder if needed"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    return os.path.join(CACHE_DIR, name)
@@ -0,0 +1,154 @@
+"""
+CANDIDATE PROBES
+Check low-prior candidates (guessed domains, directory profile links) with a
+HEAD request, or the first 16 KB of a ranged GET where HEAD is refused,
+before spending a full download and parse on them.
+
+    prober = CandidateProber(self.session)
+    for result in prober.promising(urls):      # probed concurrently, in input order
+        response = self.session.get(result.final_url, timeout=8)
+        ...
+
+A probe learns whether the host answers, the status, content type and size,
+and where redirects end. Candidates that are dead, not HTML, tiny, huge,
+redirected to a domain marketplace or showing a parking notice in their first
+bytes are dropped. The rest are promoted to a full fetch. Stopping the loop
+early cancels the probes not yet started.
+"""
+
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from .fingerprints import PARKED_PHRASES
+from .metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+PROBE_TIMEOUT = (3, 5)
+PROBE_BYTES = 16 * 1024
+MIN_PAGE_BYTES = 512
+MAX_PAGE_BYTES = 5 * 1024 * 1024
+DEFAULT_WORKERS = 8
+
+# Domain marketplaces and parking services that unsold names redirect to
+PARKING_HOSTS = (
+    'sedo.com', 'dan.com', 'afternic.com', 'hugedomains.com', 'parkingcrew.net', 'bodis.com', 'above.com',
+    'sav.com', 'undeveloped.com', 'domainmarket.com', 'buydomains.com', 'squadhelp.com', 'atom.com',
+    'brandbucket.com', 'domainnamesales.com', 'parklogic.com'
+)
+
+
+class ProbeResult:
+    """What one probe learned about a candidate URL"""
+
+    def __init__(self, url, final_url=None, status=None, content_type='', length=None, snippet='', reason=None):
+        self.url = url
+        self.final_url = final_url or url
+        self.status = status
+        self.content_type = content_type
+        self.length = length
+        self.snippet = snippet
+        self.reason = reason        # why the candidate was dropped; None when it is promoted
+
+    @property
+    def promising(self):
+        return self.reason is None
+
+
+def content_length(response):
+    """Full body size from Content-Range (ranged GET) or Content-Length, None when unknown"""
+    content_range = response.headers.get('Content-Range', '')
+    if '/' in content_range and content_range.rsplit('/', 1)[1].isdigit():
+        return int(content_range.rsplit('/', 1)[1])
+    length = response.headers.get('Content-Length', '')
+    return int(length) if length.isdigit() else None
+
+
+def verdict(result):
+    """Reason to drop a probed candidate, or None if it deserves a full fetch"""
+    host = urlparse(result.final_url).netloc.lower()
+    if result.status is None:
+        return 'dead'
+    if not 200 <= result.status < 300:
+        return 'status'
+    if any(host == parking or host.endswith('.' + parking) for parking in PARKING_HOSTS):
+        return 'parked'
+    if result.content_type and 'html' not in result.content_type:
+        return 'not_html'
+    if result.length is not None and result.snippet and result.length < MIN_PAGE_BYTES:
+        return 'too_small'  # Only trusted from a GET; some servers send Content-Length: 0 for HEAD
+    if result.length is not None and result.length > MAX_PAGE_BYTES:
+        return 'too_large'
+    if result.snippet and any(phrase in result.snippet for phrase in PARKED_PHRASES):
+        return 'parked'
+    return None
+
+
+class CandidateProber:
+    """HEAD / partial-GET probes over a shared session, run a few at a time"""
+
+    def __init__(self, session, workers=DEFAULT_WORKERS, timeout=PROBE_TIMEOUT):
+        self.session = session
+        self.workers = workers
+        self.timeout = timeout
+
+    def head(self, url):
+        response = self.session.head(url, timeout=self.timeout, allow_redirects=True)
+        response.close()
+        return response
+
+    def partial_get(self, url):
+        response = self.session.get(url, timeout=self.timeout, stream=True,
+                                    headers={'Range': f"bytes=0-{PROBE_BYTES - 1}"})
+        try:
+            body = response.raw.read(PROBE_BYTES, decode_content=True)
+        finally:
+            response.close()
+        return response, body
+
+    def probe(self, url):
+        """Probe one URL; never raises"""
+        result = ProbeResult(url)
+        try:
+            response = self.head(url)
+            body = b''
+            if response.status_code in (403, 405, 501):
+                # HEAD refused; the first bytes of the page settle it instead
+                response, body = self.partial_get(url)
+
+            result.final_url = response.url
+            result.status = response.status_code
+            result.content_type = response.headers.get('Content-Type', '').lower()
+            result.length = content_length(response)
+            if body:
+                result.snippet = body.decode('utf-8', 'ignore').lower()
+                if result.length is None:
+                    result.length = len(body) if len(body) < PROBE_BYTES else None
+        except Exception as e:
+            logger.debug(f"Probe failed for {url}: {e}")
+
+        result.reason = verdict(result)
+        metrics.inc('probe_results_total', verdict=result.reason or 'promoted')
+        return result
+
+    def probe_all(self, urls):
+        """Probe results in input order, a few requests in flight at a time"""
+        pool = ThreadPoolExecutor(max_workers=self.workers)
+        pending = deque()
+        try:
+            for url in urls:
+                pending.append(pool.submit(self.probe, url))
+                if len(pending) >= self.workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def promising(self, urls):
+        """Only the candidates worth a full fetch"""
+        for result in self.probe_all(urls):
+            if result.promising:
+                yield result
@@ -0,0 +1,345 @@
+"""
+DISCOVERY RUN PROFILING
+Opt-in profiling for scraper entry points. Wraps a run in cProfile or a
+built-in sampling profiler and records a per-URL timing breakdown (DNS,
+connect, TLS, TTFB, download, parse, extract), then writes a report to
+Discovery Results/profiles when the run ends.
+
+Enable in one line at the top of main():
+
+    start_profiling('cprofile')       # or 'sample'
+
+and mark script stages per URL:
+
+    with url_timings.stage(url, 'parse'):
+        soup = BeautifulSoup(content, 'html.parser')
+
+Any script can also be profiled without edits:
+
+    python -m healer_discovery.profiling --mode sample reach-100-contacts.py
+"""
+
+import argparse
+import atexit
+import cProfile
+import io
+import json
+import os
+import pstats
+import socket
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+from .paths import RESULTS_DIR
+
+URL_FIELDS = ['dns', 'connect', 'tls', 'ttfb', 'download', 'parse', 'extract']
+
+
+class _NullStage:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    def __init__(self, timings, url, name):
+        self.timings = timings
+        self.url = url
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.timings.add(self.url, self.name, time.perf_counter() - self.start)
+        return False
+
+
+class URLTimings:
+    """Per-URL breakdown of where request and processing time goes"""
+
+    def __init__(self):
+        self.enabled = False
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.records = {}
+
+    @staticmethod
+    def key(url):
+        return url.rstrip('/')
+
+    def add(self, url, field, seconds):
+        with self.lock:
+            record = self.records.setdefault(self.key(url), {})
+            record[field] = record.get(field, 0.0) + seconds
+
+    def stage(self, url, name):
+        """Context manager adding elapsed seconds to `name` for this URL"""
+        if not self.enabled:
+            return NULL_STAGE
+        return _Stage(self, url, name)
+
+    def _connection_times(self):
+        return getattr(self.local, 'connection', None)
+
+    def enable(self):
+        """Patch socket/urllib3 connection setup so DNS, connect and TLS can be split out"""
+        if self.enabled:
+            return
+        self.enabled = True
+
+        import urllib3.connection
+
+        timings = self
+        original_getaddrinfo = socket.getaddrinfo
+        original_new_conn = urllib3.connection.HTTPConnection._new_conn
+        original_https_connect = urllib3.connection.HTTPSConnection.connect
+
+        def getaddrinfo(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original_getaddrinfo(*args, **kwargs)
+            finally:
+                acc = timings._connection_times()
+                if acc is not None:
+                    acc['dns'] += time.perf_counter() - start
+
+        def new_conn(conn, *args, **kwargs):
+            start = time.perf_counter()
+            dns_before = (timings._connection_times() or {}).get('dns', 0.0)
+            try:
+                return original_new_conn(conn, *args, **kwargs)
+            finally:
+                acc = timings._connection_times()
+                if acc is not None:
+                    elapsed = time.perf_counter() - start
+                    acc['connect'] += elapsed - (acc['dns'] - dns_before)
+                    acc['_tcp_total'] += elapsed
+
+        def https_connect(conn, *args, **kwargs):
+            start = time.perf_counter()
+            acc = timings._connection_times()
+            tcp_before = acc['_tcp_total'] if acc is not None else 0.0
+            try:
+                return original_https_connect(conn, *args, **kwargs)
+            finally:
+                if acc is not None:
+                    acc['tls'] += (time.perf_counter() - start) - (acc['_tcp_total'] - tcp_before)
+
+        socket.getaddrinfo = getaddrinfo
+        urllib3.connection.HTTPConnection._new_conn = new_conn
+        urllib3.connection.HTTPSConnection.connect = https_connect
+
+        import requests
+        original_init = requests.Session.__init__
+
+        def session_init(session, *args, **kwargs):
+            original_init(session, *args, **kwargs)
+            timings.instrument_session(session)
+
+        requests.Session.__init__ = session_init
+
+    def instrument_session(self, session):
+        """Wrap session.send to time TTFB and download separately for every URL"""
+        original_send = session.send
+        timings = self
+
+        def send(request, **kwargs):
+            acc = timings.local.connection = {'dns': 0.0, 'connect': 0.0, 'tls': 0.0, '_tcp_total': 0.0}
+            caller_streams = kwargs.get('stream', False)
+            kwargs['stream'] = True
+
+            start = time.perf_counter()
+            try:
+                response = original_send(request, **kwargs)
+            except Exception as e:
+                timings.add(request.url, 'error', time.perf_counter() - start)
+                with timings.lock:
+                    timings.records[timings.key(request.url)]['status'] = type(e).__name__
+                raise
+            finally:
+                timings.local.connection = None
+
+            headers_at = time.perf_counter()
+            if not caller_streams:
+                response.content  # Read the body here so download time is measured
+            done = time.perf_counter()
+
+            setup = acc['dns'] + acc['connect'] + acc['tls']
+            for field in ('dns', 'connect', 'tls'):
+                timings.add(request.url, field, acc[field])
+            timings.add(request.url, 'ttfb', max(0.0, headers_at - start - setup))
+            timings.add(request.url, 'download', done - headers_at)
+            with timings.lock:
+                timings.records[timings.key(request.url)]['status'] = response.status_code
+            return response
+
+        session.send = send
+        return session
+
+    def report_lines(self, top=50):
+        rows = []
+        for url, record in self.records.items():
+            total = sum(record.get(field, 0.0) for field in URL_FIELDS)
+            rows.append((total, url, record))
+        rows.sort(key=lambda row: row[0], reverse=True)
+
+        header = f"{'total':>8} " + ' '.join(f"{field:>8}" for field in URL_FIELDS) + "  status  url"
+        lines = [header, '-' * len(header)]
+        for total, url, record in rows[:top]:
+            cells = ' '.join(f"{record.get(field, 0.0) * 1000:8.1f}" for field in URL_FIELDS)
+            lines.append(f"{total * 1000:8.1f} {cells}  {str(record.get('status', '')):>6}  {url}")
+
+        totals = {field: sum(r.get(field, 0.0) for r in self.records.values()) for field in URL_FIELDS}
+        lines.append('')
+        lines.append('Totals (s): ' + ', '.join(f"{field} {seconds:.2f}" for field, seconds in totals.items()))
+        return lines
+
+
+class SamplingProfiler:
+    """Stack-sampling profiler built on sys._current_frames(); no dependencies, low overhead"""
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.self_counts = Counter()
+        self.total_counts = Counter()
+        self.samples = 0
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, name='healer-sampler', daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread:
+            self.thread.join()
+
+    def run(self):
+        own_ident = threading.get_ident()
+        while not self.stopped.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+
+                seen = set()
+                leaf = True
+                while frame is not None:
+                    code = frame.f_code
+                    func = (code.co_filename, code.co_firstlineno, code.co_name)
+                    if leaf:
+                        self.self_counts[func] += 1
+                        leaf = False
+                    if func not in seen:
+                        self.total_counts[func] += 1
+                        seen.add(func)
+                    frame = frame.f_back
+
+                self.samples += 1
+
+    def report_lines(self, top=40):
+        if not self.samples:
+            return ['No samples collected']
+
+        lines = [f"{self.samples} samples every {self.interval * 1000:.0f} ms",
+                 f"{'self%':>7} {'total%':>7}  function"]
+        for func, count in self.self_counts.most_common(top):
+            filename, lineno, name = func
+            lines.append(f"{count / self.samples:7.1%} {self.total_counts[func] / self.samples:7.1%}  "
+                         f"{name} ({os.path.basename(filename)}:{lineno})")
+
+        lines.append('')
+        lines.append('Top cumulative:')
+        for func, count in self.total_counts.most_common(top):
+            filename, lineno, name = func
+            lines.append(f"{count / self.samples:7.1%}  {name} ({os.path.basename(filename)}:{lineno})")
+        return lines
+
+
+url_timings = URLTimings()
+
+
+def default_report_base(script):
+    """Discovery Results/profiles/<script>_<timestamp>, without extension"""
+    name = os.path.splitext(os.path.basename(script or 'run'))[0] or 'run'
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    profiles_dir = os.path.join(RESULTS_DIR, 'profiles')
+    os.makedirs(profiles_dir, exist_ok=True)
+    return os.path.join(profiles_dir, f"{name}_{stamp}")
+
+
+def start_profiling(mode='cprofile', report_base=None, interval=0.005):
+    """Profile the rest of the run and write the report at exit; returns the report base path"""
+    if report_base is None:
+        report_base = default_report_base(sys.argv[0])
+
+    url_timings.enable()
+    started = time.perf_counter()
+
+    if mode == 'sample':
+        profiler = SamplingProfiler(interval)
+        profiler.start()
+    else:
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    def finish():
+        if mode == 'sample':
+            profiler.stop()
+            function_lines = profiler.report_lines()
+        else:
+            profiler.disable()
+            profiler.dump_stats(report_base + '.prof')
+            buffer = io.StringIO()
+            pstats.Stats(profiler, stream=buffer).sort_stats('cumulative').print_stats(40)
+            function_lines = buffer.getvalue().splitlines()
+
+        lines = [
+            f"PROFILE REPORT - {os.path.basename(report_base)}",
+            f"Mode: {mode}   Wall time: {time.perf_counter() - started:.2f}s",
+            '=' * 80,
+            'PER-FUNCTION STATS',
+            *function_lines,
+            '',
+            '=' * 80,
+            'PER-URL TIMINGS (ms)',
+            *url_timings.report_lines()
+        ]
+
+        with open(report_base + '.txt', 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+        with open(report_base + '_urls.json', 'w', encoding='utf-8') as f:
+            json.dump(url_timings.records, f, indent=2)
+
+        print(f"Profile report saved: {report_base}.txt", file=sys.stderr)
+
+    atexit.register(finish)
+    return report_base
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile any discovery script")
+    parser.add_argument('--mode', choices=['cprofile', 'sample'], default='cprofile')
+    parser.add_argument('--interval', type=float, default=0.005, help="sampling interval in seconds")
+    parser.add_argument('script')
+    parser.add_argument('script_args', nargs=argparse.REMAINDER)
+    args = parser.parse_args()
+
+    from .replay import run_script
+
+    start_profiling(args.mode, default_report_base(args.script), interval=args.interval)
+    run_script(args.script, args.script_args)
+
+
+if __name__ == "__main__":
+    main()
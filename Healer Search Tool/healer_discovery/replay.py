@@ -0,0 +1,205 @@
+"""
+HTTP RECORD / REPLAY HARNESS
+Capture HTTP exchanges once into a fixture folder, then serve them back through
+a requests transport adapter so scrapers run offline, deterministically and at
+full speed.
+
+Any discovery script can be run unmodified:
+
+    python -m healer_discovery.replay record fixtures/linkedin linkedin-healer-scraper.py
+    python -m healer_discovery.replay replay fixtures/linkedin linkedin-healer-scraper.py
+
+Every requests.Session created by the script (including the ones behind
+module-level requests.get) gets the recording or replaying adapter mounted.
+Replay also turns time.sleep into a no-op, and both modes seed random so the
+request sequence is identical between the recorded and replayed runs.
+"""
+
+import argparse
+import base64
+import hashlib
+import io
+import json
+import logging
+import os
+import random
+import runpy
+import sys
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+logger = logging.getLogger(__name__)
+
+# Headers describing the wire encoding; recorded bodies are already decoded
+WIRE_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding'}
+
+
+def canonical_url(url):
+    """Lower-case scheme/host and sort query parameters so equivalent URLs share a fixture"""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', query, ''))
+
+
+class FixtureStore:
+    """Folder of recorded exchanges, one JSON file per request"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(method, url, body=None):
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        digest = hashlib.sha1(f"{method.upper()} {canonical_url(url)}\n".encode('utf-8'))
+        digest.update(body or b'')
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def load(self, key):
+        try:
+            with open(self.path(key), 'r', encoding='utf-8') as f:
+                exchange = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if exchange.get('body_encoding') == 'base64':
+            exchange['body'] = base64.b64decode(exchange['body'])
+        else:
+            exchange['body'] = exchange['body'].encode('utf-8')
+        return exchange
+
+    def save(self, key, exchange, body):
+        try:
+            exchange['body'] = body.decode('utf-8')
+            exchange['body_encoding'] = 'utf-8'
+        except UnicodeDecodeError:
+            exchange['body'] = base64.b64encode(body).decode('ascii')
+            exchange['body_encoding'] = 'base64'
+
+        with open(self.path(key), 'w', encoding='utf-8') as f:
+            json.dump(exchange, f, indent=2)
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Transport adapter that performs real requests and stores every response"""
+
+    def __init__(self, store, **kwargs):
+        super().__init__(**kwargs)
+        self.store = store
+        self.recorded = 0
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        body = response.content  # Read once; requests serves iter_content from it afterwards
+
+        self.store.save(self.store.key(request.method, request.url, request.body), {
+            'method': request.method,
+            'url': request.url,
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': {k: v for k, v in response.headers.items() if k.lower() not in WIRE_HEADERS},
+            'recorded_at': time.strftime('%Y-%m-%dT%H:%M:%S')
+        }, body)
+        self.recorded += 1
+
+        return response
+
+
+class ReplayAdapter(HTTPAdapter):
+    """Transport adapter that answers requests from a fixture store, never the network"""
+
+    def __init__(self, store, **kwargs):
+        super().__init__(**kwargs)
+        self.store = store
+        self.replayed = 0
+        self.missing = []
+
+    def send(self, request, **kwargs):
+        exchange = self.store.load(self.store.key(request.method, request.url, request.body))
+
+        if exchange is None:
+            self.missing.append(f"{request.method} {request.url}")
+            raise requests.exceptions.ConnectionError(
+                f"No recorded response for {request.method} {request.url}", request=request)
+
+        raw = HTTPResponse(
+            body=io.BytesIO(exchange['body']),
+            headers=exchange['headers'],
+            status=exchange['status'],
+            reason=exchange.get('reason'),
+            preload_content=False,
+            decode_content=False
+        )
+        self.replayed += 1
+
+        return self.build_response(request, raw)
+
+
+def install(mode, directory, real_sleeps=False, seed=0):
+    """Mount the record/replay adapter on every requests.Session created from now on"""
+    store = FixtureStore(directory)
+    adapter = RecordingAdapter(store) if mode == 'record' else ReplayAdapter(store)
+
+    original_init = requests.Session.__init__
+
+    def session_init(session, *args, **kwargs):
+        original_init(session, *args, **kwargs)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+    requests.Session.__init__ = session_init
+
+    random.seed(seed)
+    if mode == 'replay' and not real_sleeps:
+        time.sleep = lambda seconds: None
+
+    return adapter
+
+
+def run_script(script, script_args=()):
+    """Run a discovery script as __main__, the same way `python script.py` would"""
+    script = os.path.abspath(script)
+    sys.argv = [script] + list(script_args)
+    sys.path.insert(0, os.path.dirname(script))
+    runpy.run_path(script, run_name='__main__')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record or replay the HTTP traffic of a discovery script")
+    parser.add_argument('mode', choices=['record', 'replay'])
+    parser.add_argument('fixtures', help="fixture folder to write to or read from")
+    parser.add_argument('script', help="discovery script to run")
+    parser.add_argument('script_args', nargs=argparse.REMAINDER)
+    parser.add_argument('--real-sleeps', action='store_true',
+                        help="keep time.sleep delays during replay")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    adapter = install(args.mode, args.fixtures, real_sleeps=args.real_sleeps, seed=args.seed)
+    started = time.perf_counter()
+
+    try:
+        run_script(args.script, args.script_args)
+    finally:
+        elapsed = time.perf_counter() - started
+        if args.mode == 'record':
+            logger.info(f"REPLAY HARNESS: recorded {adapter.recorded} responses into {args.fixtures} in {elapsed:.2f}s")
+        else:
+            logger.info(f"REPLAY HARNESS: replayed {adapter.replayed} responses in {elapsed:.2f}s "
+                        f"({len(adapter.missing)} not in fixtures)")
+            for missing in adapter.missing[:20]:
+                logger.info(f"  missing: {missing}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""
+SCRIPT LOADER
+Import the hyphen-named discovery scripts (e.g. healer-network-crawler.py) as
+modules so their classes can be reused without running their main().
+"""
+
+import importlib.util
+import os
+import sys
+
+from .paths import TOOL_DIR
+
+_loaded = {}
+
+
+def load_script(filename):
+    """Import a discovery script from the tool folder and return it as a module"""
+    if filename in _loaded:
+        return _loaded[filename]
+
+    path = os.path.join(TOOL_DIR, filename)
+    module_name = os.path.splitext(filename)[0].replace('-', '_')
+
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    if TOOL_DIR not in sys.path:
+        sys.path.insert(0, TOOL_DIR)
+    spec.loader.exec_module(module)
+
+    _loaded[filename] = module
+    return module
@@ -0,0 +1,173 @@
+"""
+SEARCH RESULT CACHE & QUERY PLANNER
+Search-engine queries are the slowest, most rate-limited step of discovery
+(every one is followed by a 3-15 second sleep) and the scripts re-issue the
+same ones on every run.
+
+SearchResultCache keeps the parsed result URLs (never the HTML) per engine and
+normalized query, with a time-to-live:
+
+    urls = self.search_cache.get('google', query)
+    if urls is None:
+        urls = parse_results(self.session.get(search_url))
+        self.search_cache.put('google', query, urls)
+
+When several scripts run the same queries but keep different results, they
+share an entry of the page's unfiltered links (result_links(), engine
+'duckduckgo_links') and each applies its own filter after reading it, so
+whichever script runs first cannot decide what the others see.
+
+plan_queries() turns query templates and search terms into the smallest query
+set that still covers them: spelling variants of a term (energyhealing /
+energyhealer) and terms that contain another term (Licensed Acupuncturist /
+Acupuncturist) share one query, and templates that differ only by one keyword
+are merged with OR. A merged query returns one result list where the separate
+queries returned one each, so callers page it (the start argument of get/put)
+when they want more than a page. dedupe_queries() drops free-form queries that
+normalize to one already issued (same words in the same order).
+"""
+
+import re
+
+from .paths import cache_file
+from .sitemaps import JsonCache
+
+TOKEN = re.compile(r'"[^"]*"|\S+')
+OPERATORS = ('OR', 'AND')       # upper case only; a lower-case "or" is an ordinary keyword
+VARIANT_SUFFIXES = ('ists', 'ist', 'ers', 'er', 'ing', 'ic', 'al', 'ies', 'y', 'es', 's', 'e')
+
+
+def normalize_query(query):
+    """Lower-case keywords and collapse whitespace; token order is kept, since OR and parentheses group by position"""
+    tokens = TOKEN.findall(query)
+    return ' '.join(token if token in OPERATORS else ' '.join(token.lower().split()) for token in tokens)
+
+
+class SearchResultCache:
+    """Parsed result URLs per (engine, normalized query) in Discovery Results/cache"""
+
+    def __init__(self, ttl_hours=72, path=None):
+        self.cache = JsonCache(path or cache_file('search_results.json'), ttl_hours)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(engine, query, start=0):
+        key = f"{engine}|{normalize_query(query)}"
+        return f"{key}|{start}" if start else key
+
+    def get(self, engine, query, start=0):
+        """Cached result URLs (of the page beginning at result start), or None when the query has to be run"""
+        entry = self.cache.get(self.key(engine, query, start))
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return list(entry['urls'])
+
+    def put(self, engine, query, urls, start=0):
+        """Store a query's result URLs; empty results are not kept since they are often a block page"""
+        if not urls:
+            return
+        self.cache.put(self.key(engine, query, start), {'query': query, 'engine': engine, 'urls': list(urls)})
+        self.cache.save()  # Searches are seconds apart, so saving each one costs nothing
+
+
+def result_links(soup):
+    """Every distinct link href on a result page, unfiltered, in page order"""
+    links = []
+    for link in soup.find_all('a', href=True):
+        if link['href'] not in links:
+            links.append(link['href'])
+    return links
+
+
+# -- query planning -------------------------------------------------------------
+
+def term_stem(term):
+    """Crude stem for spotting spelling variants of a search term (healer/healing, therapy/therapist)"""
+    stem = re.sub(r'[^a-z0-9 ]', '', term.lower()).strip()
+    for suffix in VARIANT_SUFFIXES:
+        if stem.endswith(suffix) and len(stem) - len(suffix) >= 4:
+            return stem[:-len(suffix)]
+    return stem
+
+
+def group_variants(terms):
+    """Group terms one query can cover: same stem, or containing another term as whole words"""
+    groups = []
+    for term in terms:
+        stem = term_stem(term)
+        words = f" {' '.join(term.lower().split())} "
+        for group in groups:
+            head = group[0]
+            if term_stem(head) == stem or f" {' '.join(head.lower().split())} " in words:
+                group.append(term)
+                break
+        else:
+            groups.append([term])
+    return groups
+
+
+def merge_templates(templates):
+    """Merge templates that differ only in one free keyword into a single OR template"""
+    merged = []
+    index = {}
+    for template in templates:
+        tokens = TOKEN.findall(template)
+        free = [t for t in tokens if '{' not in t and ':' not in t and not t.startswith('"')]
+        if len(free) != 1:
+            merged.append([template, None, []])
+            continue
+        fixed = tuple(t for t in tokens if t not in free)
+        if fixed in index:
+            index[fixed][2].append(free[0])
+        else:
+            index[fixed] = [' '.join(fixed), fixed, free]
+            merged.append(index[fixed])
+
+    result = []
+    for template, fixed, words in merged:
+        if fixed is None:
+            result.append(template)
+        elif len(words) == 1:
+            result.append(f"{template} {words[0]}")
+        else:
+            result.append(f"{template} ({' OR '.join(words)})")
+    return result
+
+
+def dedupe_queries(queries):
+    """Free-form queries without the ones that normalize to an earlier query"""
+    seen = set()
+    unique = []
+    for query in queries:
+        normalized = normalize_query(query)
+        if normalized not in seen:
+            seen.add(normalized)
+            unique.append(query)
+    return unique
+
+
+def plan_queries(templates, terms, placeholder):
+    """Minimal query list covering every template x term combination"""
+    if isinstance(terms, str):
+        terms = [terms]
+    field = '{' + placeholder + '}'
+
+    queries = []
+    seen = set()
+    for template in merge_templates(templates):
+        for group in group_variants(terms):
+            if len(group) == 1:
+                query = template.replace(field, group[0])
+            elif f'"{field}"' in template:
+                query = template.replace(f'"{field}"', '(' + ' OR '.join(f'"{t}"' for t in group) + ')')
+            else:
+                query = template.replace(field, '(' + ' OR '.join(group) + ')')
+
+            normalized = normalize_query(query)
+            if normalized not in seen:
+                seen.add(normalized)
+                queries.append(query)
+    return queries
@@ -0,0 +1,271 @@
+"""
+SITEMAP & ROBOTS.TXT PAGE SELECTION
+Pick contact/about/team pages straight from each host's sitemap instead of
+guessing them from homepage anchor text. robots.txt is fetched once per host
+and cached on disk so every fetch can honor it without re-downloading.
+"""
+
+import json
+import logging
+import os
+import time
+import zlib
+import xml.etree.ElementTree as ET
+from collections import deque
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+from .metrics import metrics
+from .paths import cache_file
+
+logger = logging.getLogger(__name__)
+
+# Weight of each keyword when it appears in the last path segment of a sitemap URL
+PAGE_KEYWORDS = {
+    'contact': 5,
+    'connect': 3,
+    'about': 4,
+    'team': 3,
+    'staff': 3,
+    'practitioners': 3,
+    'meet': 2,
+    'bio': 2
+}
+
+# Child sitemaps that rarely hold contact pages are read last (usually never)
+LOW_VALUE_SITEMAPS = ['post', 'product', 'image', 'video', 'tag', 'category', 'author', 'event']
+
+
+def host_key(url):
+    """Return scheme://host for a URL, used as the cache key"""
+    parsed = urlparse(url)
+    return f"{parsed.scheme or 'https'}://{parsed.netloc.lower()}"
+
+
+def bare_host(url):
+    """Return the host of a URL without a leading www."""
+    return urlparse(url).netloc.lower().replace('www.', '', 1)
+
+
+class JsonCache:
+    """Small JSON file keyed by host with a time-to-live per entry"""
+
+    def __init__(self, path, ttl_hours):
+        self.path = path
+        self.name = os.path.splitext(os.path.basename(path))[0]
+        self.ttl = ttl_hours * 3600
+        self.dirty = False
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry and time.time() - entry.get('fetched_at', 0) < self.ttl:
+            metrics.inc('cache_lookups_total', cache=self.name, result='hit')
+            return entry
+        metrics.inc('cache_lookups_total', cache=self.name, result='miss')
+        return None
+
+    def put(self, key, entry):
+        entry['fetched_at'] = time.time()
+        self.entries[key] = entry
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2)
+        self.dirty = False
+
+
+class RobotsCache:
+    """Per-host robots.txt cache shared by the fetch layer"""
+
+    def __init__(self, session, user_agent='*', ttl_hours=24, path=None):
+        self.session = session
+        self.user_agent = user_agent
+        self.cache = JsonCache(path or cache_file('robots_cache.json'), ttl_hours)
+        self.parsers = {}
+
+    def entry(self, url):
+        """Return the cached robots.txt entry for the URL's host, fetching it if stale"""
+        key = host_key(url)
+        entry = self.cache.get(key)
+        if entry is None:
+            entry = self.fetch(key)
+            self.cache.put(key, entry)
+            self.parsers.pop(key, None)
+        return entry
+
+    def fetch(self, key):
+        status = None
+        lines = []
+
+        try:
+            response = self.session.get(f"{key}/robots.txt", timeout=10)
+            status = response.status_code
+            if status == 200:
+                lines = response.text.splitlines()[:2000]
+        except Exception as e:
+            logger.debug(f"robots.txt unavailable for {key}: {e}")
+
+        sitemaps = [line.split(':', 1)[1].strip() for line in lines
+                    if line.lower().startswith('sitemap:')]
+
+        return {'status': status, 'lines': lines, 'sitemaps': sitemaps}
+
+    def parser(self, url):
+        key = host_key(url)
+        parser = self.parsers.get(key)
+        if parser is None:
+            entry = self.entry(url)
+            parser = RobotFileParser()
+            # Same semantics as RobotFileParser.read(): auth errors block everything
+            if entry['status'] in (401, 403):
+                parser.disallow_all = True
+            else:
+                parser.parse(entry['lines'])
+            self.parsers[key] = parser
+        return parser
+
+    def can_fetch(self, url):
+        """Check whether robots.txt allows fetching this URL"""
+        return self.parser(url).can_fetch(self.user_agent, url)
+
+    def sitemaps(self, url):
+        """Sitemap URLs declared in the host's robots.txt"""
+        return self.entry(url)['sitemaps']
+
+    def save(self):
+        self.cache.save()
+
+
+class SitemapPageSelector:
+    """Select contact/about/team URLs for a site from its robots.txt and sitemaps"""
+
+    def __init__(self, session, robots=None, ttl_hours=72, max_sitemaps=8,
+                 max_urls_per_sitemap=50000, path=None):
+        self.session = session
+        self.robots = robots or RobotsCache(session)
+        self.cache = JsonCache(path or cache_file('sitemap_pages.json'), ttl_hours)
+        self.max_sitemaps = max_sitemaps
+        self.max_urls_per_sitemap = max_urls_per_sitemap
+
+    def iter_sitemap(self, sitemap_url):
+        """Yield (kind, loc) pairs from one sitemap, parsing the XML as it streams in.
+
+        kind is 'sitemap' for entries of a sitemap index and 'url' for pages.
+        Gzipped sitemaps are decompressed on the fly.
+        """
+        try:
+            response = self.session.get(sitemap_url, timeout=15, stream=True)
+        except Exception as e:
+            logger.debug(f"Sitemap unavailable {sitemap_url}: {e}")
+            return
+
+        if response.status_code != 200:
+            response.close()
+            return
+
+        parser = ET.XMLPullParser(events=('end',))
+        decompressor = None
+        first_chunk = True
+        yielded = 0
+
+        try:
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                if first_chunk:
+                    first_chunk = False
+                    if chunk[:2] == b'\x1f\x8b':
+                        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                if decompressor:
+                    chunk = decompressor.decompress(chunk)
+
+                parser.feed(chunk)
+
+                for _, elem in parser.read_events():
+                    kind = elem.tag.rsplit('}', 1)[-1]
+                    if kind not in ('url', 'sitemap'):
+                        continue
+
+                    for child in elem:
+                        if child.tag.rsplit('}', 1)[-1] == 'loc' and child.text:
+                            yield kind, child.text.strip()
+                            yielded += 1
+                            break
+                    elem.clear()
+
+                if yielded >= self.max_urls_per_sitemap:
+                    break
+
+        except ET.ParseError as e:
+            logger.debug(f"Malformed sitemap {sitemap_url}: {e}")
+        finally:
+            response.close()
+
+    def score_page(self, url, site_host):
+        """Score a sitemap URL as a contact page candidate (0 = not a candidate)"""
+        parsed = urlparse(url)
+        if bare_host(url) != site_host:
+            return 0
+
+        segments = [s for s in parsed.path.lower().split('/') if s]
+        if not segments or len(segments) > 2:
+            return 0
+
+        last = segments[-1].rsplit('.', 1)[0]
+        score = max((weight for keyword, weight in PAGE_KEYWORDS.items() if keyword in last), default=0)
+
+        # Prefer /contact over /blog/contact-me-for-a-reading
+        return score - (len(segments) - 1) if score else 0
+
+    def select_pages(self, site_url, limit=3):
+        """Return up to `limit` contact/about/team URLs for a site, best first"""
+        key = host_key(site_url)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached['pages'][:limit]
+
+        site_host = bare_host(site_url)
+        queue = deque(self.robots.sitemaps(site_url) or [f"{key}/sitemap.xml"])
+        seen = set()
+        candidates = {}
+
+        while queue and len(seen) < self.max_sitemaps:
+            sitemap_url = queue.popleft()
+            if sitemap_url in seen:
+                continue
+            seen.add(sitemap_url)
+
+            for kind, loc in self.iter_sitemap(sitemap_url):
+                if kind == 'sitemap':
+                    name = loc.lower().rsplit('/', 1)[-1]
+                    if any(term in name for term in LOW_VALUE_SITEMAPS):
+                        queue.append(loc)
+                    else:
+                        queue.appendleft(loc)
+                    continue
+
+                score = self.score_page(loc, site_host)
+                if score:
+                    candidates[loc] = score
+
+            # Page sitemaps come first, so stop before walking blog/product sitemaps
+            if len(candidates) >= limit:
+                break
+
+        ranked = sorted(candidates.items(), key=lambda item: (-item[1], len(item[0])))
+        pages = [url for url, _ in ranked if self.robots.can_fetch(url)]
+
+        self.cache.put(key, {'pages': pages[:10], 'sitemaps_read': len(seen)})
+        return pages[:limit]
+
+    def save(self):
+        """Persist robots.txt and page selections for the next run"""
+        self.robots.save()
+        self.cache.save()
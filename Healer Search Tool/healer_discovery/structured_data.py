@@ -0,0 +1,204 @@
+"""
+STRUCTURED DATA FAST PATH
+Read a practice's own Schema.org markup (JSON-LD, or microdata when there is
+no JSON-LD) before falling back to regexes over the page text and guessing the
+business name from <title> (which gives names like "Home"):
+
+    contact = structured_contact(content)        # None when the page has no business/person markup
+    if contact and contact.complete:
+        emails, business_name = contact.emails, contact.name   # no soup, no full-text scan
+    else:
+        ...                                       # existing extraction, with contact.name when present
+
+JSON-LD blocks are cut out of the raw HTML with one regex and decoded with
+orjson when it is installed (the standard json module otherwise), so a page
+with complete markup never needs a BeautifulSoup parse at all. Microdata is
+only read from pages that carry itemscope attributes, parsing just those
+subtrees. LocalBusiness and its subtypes, Organization and Person items are
+kept, including ones nested under @graph, publisher, provider or contactPoint.
+"""
+
+import json
+import re
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .metrics import metrics
+
+LD_JSON_BLOCK = re.compile(
+    r'<script[^>]+type\s*=\s*["\']?application/ld\+json["\']?[^>]*>(.*?)</script\s*>',
+    re.IGNORECASE | re.DOTALL)
+EMAIL = re.compile(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$')
+
+CONTACT_TYPES = {
+    'LocalBusiness', 'HealthAndBeautyBusiness', 'MedicalBusiness', 'MedicalClinic', 'MedicalOrganization',
+    'Physician', 'DaySpa', 'HealthClub', 'ProfessionalService', 'SportsActivityLocation', 'Store',
+    'Organization', 'Person'
+}
+GENERIC_TYPES = ('Organization', 'Person')     # ranked below the specific business types for the name
+ADDRESS_PARTS = ('streetAddress', 'addressLocality', 'addressRegion', 'postalCode')
+
+
+def load_json(text):
+    """Decode one JSON-LD block, tolerating comment/CDATA wrappers and raw control characters"""
+    text = text.strip()
+    for wrapper in ('<!--', '-->', '//<![CDATA[', '//]]>', '<![CDATA[', ']]>'):
+        text = text.replace(wrapper, '')
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    try:
+        return json.loads(text, strict=False)
+    except ValueError:
+        return None
+
+
+def item_types(item):
+    types = item.get('@type') or []
+    types = types if isinstance(types, list) else [types]
+    return [str(t).rsplit('/', 1)[-1] for t in types]
+
+
+def is_contact_item(item):
+    return any(t in CONTACT_TYPES or t.endswith('Business') for t in item_types(item))
+
+
+NESTED_KEYS = ('@graph', 'publisher', 'provider')   # contactPoint is merged by StructuredContact.add()
+
+
+def walk(data):
+    """Top-level items of a decoded JSON-LD document plus those under @graph, publisher and provider
+
+    Other nested objects (a Review's author, an Offer's seller) describe someone else and are not followed.
+    """
+    if isinstance(data, list):
+        for value in data:
+            yield from walk(value)
+    elif isinstance(data, dict):
+        yield data
+        for key in NESTED_KEYS:
+            if isinstance(data.get(key), (dict, list)):
+                yield from walk(data[key])
+
+
+def text_values(value):
+    """Strings from a property that may be a string, a list or an object with a name/@id"""
+    values = value if isinstance(value, list) else [value]
+    for value in values:
+        if isinstance(value, dict):
+            value = value.get('name') or value.get('@id') or ''
+        if isinstance(value, (str, int)) and str(value).strip():
+            yield str(value).strip()
+
+
+def format_address(value):
+    if isinstance(value, list):
+        value = value[0] if value else ''
+    if isinstance(value, dict):
+        return ', '.join(str(value[part]).strip() for part in ADDRESS_PARTS if value.get(part))
+    return str(value or '').strip()
+
+
+class StructuredContact:
+    """Contact fields gathered from the markup items of one page"""
+
+    def __init__(self):
+        self.name = None
+        self.name_rank = 0
+        self.emails = []
+        self.phones = []
+        self.address = ''
+        self.website = ''
+        self.types = []
+
+    @property
+    def complete(self):
+        """Enough to skip the full-text scan: a name and at least one email"""
+        return bool(self.name and self.emails)
+
+    def add(self, item):
+        """Merge one Schema.org item (as a dict of property -> value)"""
+        types = item_types(item)
+        self.types.extend(t for t in types if t not in self.types)
+
+        rank = 1 if all(t in GENERIC_TYPES for t in types) else 2
+        for name in text_values(item.get('name')):
+            if rank > self.name_rank and len(name) < 100:
+                self.name, self.name_rank = name, rank
+            break
+
+        for email in text_values(item.get('email')):
+            email = re.sub(r'^mailto:', '', email, flags=re.IGNORECASE).split('?')[0].strip().lower()
+            if EMAIL.match(email) and email not in self.emails:
+                self.emails.append(email)
+        for phone in text_values(item.get('telephone')):
+            phone = re.sub(r'^tel:', '', phone, flags=re.IGNORECASE)
+            if phone not in self.phones:
+                self.phones.append(phone)
+
+        if not self.address and item.get('address'):
+            self.address = format_address(item['address'])
+        if not self.website:
+            self.website = next(text_values(item.get('url')), '')
+
+        # contactPoint objects carry email/telephone without a business type of their own
+        points = item.get('contactPoint') or []
+        for point in points if isinstance(points, list) else [points]:
+            if isinstance(point, dict):
+                self.add({key: point.get(key) for key in ('email', 'telephone')})
+
+
+def json_ld_items(html):
+    """Business/person items from every JSON-LD block of the raw page"""
+    for block in LD_JSON_BLOCK.findall(html):
+        data = load_json(block)
+        if data is None:
+            continue
+        for item in walk(data):
+            if is_contact_item(item):
+                yield item
+
+
+def microdata_items(html, soup=None):
+    """Business/person itemscopes as property dicts; only the itemscope subtrees are parsed"""
+    if 'itemscope' not in html:
+        return
+    if soup is None:
+        soup = BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer(attrs={'itemscope': True}))
+    for scope in soup.find_all(attrs={'itemscope': True, 'itemtype': True}):
+        item = {'@type': scope['itemtype'].split()}
+        if not is_contact_item(item):
+            continue
+        for prop in scope.find_all(attrs={'itemprop': True}):
+            key = prop['itemprop']
+            if key in item:
+                continue
+            if key == 'address' and prop.has_attr('itemscope'):
+                item[key] = {part.get('itemprop'): part.get_text(' ', strip=True)
+                             for part in prop.find_all(attrs={'itemprop': True})}
+            else:
+                item[key] = prop.get('content') or prop.get('href') or prop.get_text(' ', strip=True)
+        yield item
+
+
+def structured_contact(html, soup=None):
+    """Contact from the page's Schema.org markup, or None when it has no business/person items"""
+    contact = StructuredContact()
+    found = False
+    for item in json_ld_items(html):
+        contact.add(item)
+        found = True
+    if not found:
+        for item in microdata_items(html, soup):
+            contact.add(item)
+            found = True
+
+    metrics.inc('structured_data_total', outcome='complete' if contact.complete else 'partial' if found else 'none')
+    return contact if found else None
@@ -0,0 +1,254 @@
+"""
+SHARED CRAWL WORK QUEUE
+A URL queue in healers_discovery.db that several worker processes, on this
+machine or on others mounting the same folder, can pull from safely. SQLite's
+file lock serialises the writers; every claim runs in one IMMEDIATE
+transaction, so two workers never lease the same URL.
+
+    queue = WorkQueue(job='network')
+    queue.enqueue(urls, platform='website', action_type='extraction')
+    batch = queue.claim(worker_id, batch_size=10)
+    queue.complete(url, worker_id, result)          # or queue.fail(url, worker_id, error)
+
+Leases expire unless the worker's heartbeat renews them, so URLs held by a
+crashed worker go back to the queue. Results are keyed by (job, url) and the
+first one written wins, so a URL finished twice is stored once.
+
+Each URL a worker completes or fails is charged once to today's row in the
+rate_limits table (platform, action_type, action_count, date), which makes the
+per-platform daily limits from SAFE_LIMITS_ANALYSIS.md hold across all workers
+together. A claim counts live leases as already spent, so a lease that expires
+or is released costs nothing, and one that is claimed again is charged once.
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import time
+
+from .budget import DAILY_LIMITS, RATE_LIMITS_SCHEMA, charge, used_today
+from .paths import DISCOVERY_DB
+
+SCHEMA = RATE_LIMITS_SCHEMA + """
+CREATE TABLE IF NOT EXISTS crawl_queue (
+    job TEXT NOT NULL,
+    url TEXT NOT NULL,
+    platform TEXT DEFAULT 'website',
+    action_type TEXT DEFAULT 'extraction',
+    priority REAL DEFAULT 0,
+    status TEXT DEFAULT 'queued', -- queued, leased, done, failed
+    worker_id TEXT,
+    lease_until REAL,
+    attempts INTEGER DEFAULT 0,
+    last_error TEXT,
+    enqueued_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    finished_at DATETIME,
+    PRIMARY KEY (job, url)
+);
+CREATE INDEX IF NOT EXISTS idx_crawl_queue_claim ON crawl_queue (job, status, priority DESC);
+CREATE TABLE IF NOT EXISTS crawl_results (
+    job TEXT NOT NULL,
+    url TEXT NOT NULL,
+    worker_id TEXT,
+    result TEXT, -- JSON
+    finished_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (job, url)
+);
+CREATE TABLE IF NOT EXISTS crawl_workers (
+    worker_id TEXT PRIMARY KEY,
+    job TEXT,
+    host TEXT,
+    pid INTEGER,
+    status TEXT, -- running, finished, crashed
+    started_at REAL,
+    heartbeat_at REAL,
+    processed INTEGER DEFAULT 0,
+    metrics TEXT -- JSON metrics snapshot
+);
+"""
+
+
+def new_worker_id():
+    return f"{socket.gethostname()}-{os.getpid()}-{int(time.time())}"
+
+
+def connect(path=None):
+    """Open the discovery database with a busy timeout long enough for a shared filesystem"""
+    conn = sqlite3.connect(path or DISCOVERY_DB, timeout=60, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    return conn
+
+
+class WorkQueue:
+    """Leased URL queue for one crawl job, shared through the discovery database"""
+
+    def __init__(self, job, path=None, lease_seconds=180, max_attempts=3, limits=None):
+        self.job = job
+        self.path = path or DISCOVERY_DB
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.limits = DAILY_LIMITS if limits is None else limits
+        self.conn = connect(self.path)
+
+    def transaction(self):
+        """BEGIN IMMEDIATE takes the write lock up front so concurrent claims queue instead of deadlocking"""
+        return _Transaction(self.conn)
+
+    # -- producer side --------------------------------------------------------
+
+    def enqueue(self, urls, platform='website', action_type='extraction', priority=0):
+        """Add URLs (or (url, priority) pairs); URLs already in the job are left untouched"""
+        rows = []
+        for item in urls:
+            url, url_priority = item if isinstance(item, (tuple, list)) else (item, priority)
+            rows.append((self.job, url, platform, action_type, url_priority))
+        with self.transaction():
+            before = self.conn.total_changes
+            self.conn.executemany(
+                'INSERT OR IGNORE INTO crawl_queue (job, url, platform, action_type, priority) VALUES (?, ?, ?, ?, ?)',
+                rows)
+            return self.conn.total_changes - before
+
+    # -- worker side ----------------------------------------------------------
+
+    def claim(self, worker_id, batch_size=10):
+        """Lease up to batch_size URLs, highest priority first, within today's platform limits"""
+        now = time.time()
+        claimed = []
+
+        with self.transaction():
+            self.conn.execute(
+                "UPDATE crawl_queue SET status = 'queued', worker_id = NULL "
+                "WHERE job = ? AND status = 'leased' AND lease_until < ?", (self.job, now))
+
+            rows = self.conn.execute(
+                "SELECT url, platform, action_type FROM crawl_queue WHERE job = ? AND status = 'queued' "
+                "ORDER BY priority DESC, enqueued_at", (self.job,))
+
+            remaining = {}
+            for row in rows:  # Read lazily; URLs of platforms over their limit are passed over
+                key = (row['platform'], row['action_type'])
+                if key in self.limits:
+                    if key not in remaining:
+                        remaining[key] = self.limits[key] - used_today(self.conn, *key) - self.leased(key, now)
+                    if remaining[key] <= 0:
+                        continue
+                    remaining[key] -= 1
+                claimed.append(row['url'])
+                if len(claimed) >= batch_size:
+                    break
+
+            if claimed:
+                self.conn.executemany(
+                    "UPDATE crawl_queue SET status = 'leased', worker_id = ?, lease_until = ?, "
+                    "attempts = attempts + 1 WHERE job = ? AND url = ?",
+                    [(worker_id, now + self.lease_seconds, self.job, url) for url in claimed])
+
+        return claimed
+
+    def leased(self, key, now):
+        """Live leases of a (platform, action_type) in every job: fetches that will be charged when they finish"""
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM crawl_queue WHERE platform = ? AND action_type = ? AND status = 'leased' "
+            "AND lease_until >= ?", (*key, now)).fetchone()[0]
+
+    def charge_fetch(self, url):
+        """Charge one fetch of a URL to its platform's budget; call inside a write transaction"""
+        row = self.conn.execute(
+            'SELECT platform, action_type FROM crawl_queue WHERE job = ? AND url = ?', (self.job, url)).fetchone()
+        if row:
+            charge(self.conn, row['platform'], row['action_type'], 1)
+
+    def renew(self, worker_id):
+        """Extend the leases held by a worker (called from its heartbeat)"""
+        with self.transaction():
+            return self.conn.execute(
+                "UPDATE crawl_queue SET lease_until = ? WHERE job = ? AND status = 'leased' AND worker_id = ?",
+                (time.time() + self.lease_seconds, self.job, worker_id)).rowcount
+
+    def complete(self, url, worker_id, result):
+        """Store a URL's result (first write wins), charge its fetch and mark it done"""
+        with self.transaction():
+            self.charge_fetch(url)
+            self.conn.execute(
+                'INSERT OR IGNORE INTO crawl_results (job, url, worker_id, result) VALUES (?, ?, ?, ?)',
+                (self.job, url, worker_id, json.dumps(result, default=str)))
+            self.conn.execute(
+                "UPDATE crawl_queue SET status = 'done', finished_at = CURRENT_TIMESTAMP, lease_until = NULL "
+                "WHERE job = ? AND url = ?", (self.job, url))
+
+    def fail(self, url, worker_id, error):
+        """Charge the attempt, then give the URL back to the queue, or mark it failed after max_attempts"""
+        with self.transaction():
+            self.charge_fetch(url)
+            self.conn.execute(
+                "UPDATE crawl_queue SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'queued' END, "
+                "worker_id = NULL, lease_until = NULL, last_error = ? "
+                "WHERE job = ? AND url = ? AND status = 'leased' AND worker_id = ?",
+                (self.max_attempts, str(error)[:500], self.job, url, worker_id))
+
+    def release(self, worker_id):
+        """Return every URL still leased by a worker (on shutdown) without counting an attempt"""
+        with self.transaction():
+            return self.conn.execute(
+                "UPDATE crawl_queue SET status = 'queued', worker_id = NULL, lease_until = NULL, "
+                "attempts = MAX(attempts - 1, 0) WHERE job = ? AND status = 'leased' AND worker_id = ?",
+                (self.job, worker_id)).rowcount
+
+    # -- workers --------------------------------------------------------------
+
+    def register_worker(self, worker_id):
+        with self.transaction():
+            self.conn.execute(
+                "INSERT OR REPLACE INTO crawl_workers (worker_id, job, host, pid, status, started_at, heartbeat_at) "
+                "VALUES (?, ?, ?, ?, 'running', ?, ?)",
+                (worker_id, self.job, socket.gethostname(), os.getpid(), time.time(), time.time()))
+
+    def heartbeat(self, worker_id, processed, metrics_snapshot=None, status='running'):
+        with self.transaction():
+            self.conn.execute(
+                'UPDATE crawl_workers SET heartbeat_at = ?, processed = ?, status = ?, '
+                'metrics = COALESCE(?, metrics) WHERE worker_id = ?',
+                (time.time(), processed, status,
+                 json.dumps(metrics_snapshot) if metrics_snapshot else None, worker_id))
+        if status == 'running':
+            self.renew(worker_id)
+
+    def workers(self):
+        return [dict(row) for row in self.conn.execute(
+            'SELECT * FROM crawl_workers WHERE job = ? ORDER BY started_at', (self.job,))]
+
+    # -- reporting ------------------------------------------------------------
+
+    def counts(self):
+        """Number of URLs per status for this job"""
+        return {row['status']: row['n'] for row in self.conn.execute(
+            'SELECT status, COUNT(*) AS n FROM crawl_queue WHERE job = ? GROUP BY status', (self.job,))}
+
+    def has_work(self):
+        """True while anything is queued or leased (leased URLs may come back if a worker dies)"""
+        counts = self.counts()
+        return bool(counts.get('queued') or counts.get('leased'))
+
+    def results(self):
+        for row in self.conn.execute(
+                'SELECT url, worker_id, result FROM crawl_results WHERE job = ? ORDER BY finished_at', (self.job,)):
+            yield row['url'], row['worker_id'], json.loads(row['result'])
+
+    def close(self):
+        self.conn.close()
+
+
+class _Transaction:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute('BEGIN IMMEDIATE')
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute('ROLLBACK' if exc_type else 'COMMIT')
+        return False
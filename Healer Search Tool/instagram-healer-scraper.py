@@ -15,12 +15,10 @@ Based on research of GitHub tools:
 - drawrowfly/instagram-scraper
 """
 
-import requests
 from bs4 import BeautifulSoup
 import re
 import csv
 import time
-import json
 from datetime import datetime
 import os
 import logging
@@ -28,6 +26,11 @@ from urllib.parse import urljoin, urlparse, quote
 import random
 from typing import Dict, List, Set, Tuple, Optional
 
+from healer_discovery.http_client import create_session
+from healer_discovery.contacts import FINAL_CONTACTS_CSV, load_contacts
+from healer_discovery.search_cache import SearchResultCache, group_variants, plan_queries
+from healer_discovery.structured_data import load_json
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -37,12 +40,11 @@ logger = logging.getLogger(__name__)
 
 class InstagramHealerScraper:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
             'Connection': 'keep-alive'
         })
 
@@ -73,38 +75,39 @@ class InstagramHealerScraper:
             'site:instagram.com/p/ "{hashtag}" website',
             '"instagram.com" "{hashtag}" healer email'
         ]
+        self.search_cache = SearchResultCache()
 
         self.load_existing_contacts()
 
     def load_existing_contacts(self):
         """Load existing healer contacts to prevent duplicates"""
-        file_path = os.path.join(os.path.dirname(__file__), 'Discovery Results', 'exports', 'HEALER_CONTACTS_FINAL_100.csv')
+        if not os.path.exists(FINAL_CONTACTS_CSV):
+            logger.warning("Existing contacts file not found, starting fresh")
+            return
 
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    email = row['Email'].lower().strip()
-                    name = row['Business_Name'].lower().strip()
+        for contact in load_contacts(csv_files=[FINAL_CONTACTS_CSV]):
+            self.existing_emails.add(contact['email'])
+            self.existing_names.add(contact['business_name'].lower())
 
-                    self.existing_emails.add(email)
-                    self.existing_names.add(name)
+        logger.info(f"Loaded {len(self.existing_emails)} existing contacts for duplicate prevention")
 
-            logger.info(f"Loaded {len(self.existing_emails)} existing contacts for duplicate prevention")
-        except FileNotFoundError:
-            logger.warning("Existing contacts file not found, starting fresh")
-        except Exception as e:
-            logger.error(f"Error loading existing contacts: {e}")
-
-    def search_google_for_instagram_profiles(self, hashtag: str, max_results: int = 15) -> List[str]:
-        """Use Google search to find Instagram profiles related to healing hashtags"""
+    def search_google_for_instagram_profiles(self, hashtag, max_results: int = 15) -> List[str]:
+        """Use Google search to find Instagram profiles related to a healing hashtag (or its spelling variants)"""
         profile_urls = []
 
-        for template in self.search_templates[:2]:  # Limit templates to avoid too many requests
-            query = template.format(hashtag=hashtag)
+        # Limit templates to avoid too many requests
+        for query in plan_queries(self.search_templates[:2], hashtag, 'hashtag'):
             search_url = f"https://www.google.com/search?q={quote(query)}&num=10"
 
             try:
+                cached = self.search_cache.get('google', query)
+                if cached is not None:
+                    logger.info(f"Google search (cached): {query}")
+                    profile_urls.extend(url for url in cached if url not in profile_urls)
+                    if len(profile_urls) >= max_results:
+                        break
+                    continue
+
                 logger.info(f"Google search: {query}")
 
                 response = self.session.get(search_url, timeout=15)
@@ -113,6 +116,7 @@ class InstagramHealerScraper:
                     continue
 
                 soup = BeautifulSoup(response.content, 'html.parser')
+                query_urls = []
 
                 # Extract Instagram profile URLs from search results
                 for link in soup.find_all('a', href=True):
@@ -128,10 +132,14 @@ class InstagramHealerScraper:
                             '/reel/' not in href and
                             '/tv/' not in href):
 
+                            if href not in query_urls:
+                                query_urls.append(href)
                             if href not in profile_urls:
                                 profile_urls.append(href)
                                 logger.info(f"Found Instagram profile: {href}")
 
+                self.search_cache.put('google', query, query_urls)
+
                 # Rate limiting for Google
                 time.sleep(random.uniform(4, 7))
 
@@ -139,7 +147,7 @@ class InstagramHealerScraper:
                     break
 
             except Exception as e:
-                logger.error(f"Error searching Google for #{hashtag}: {e}")
+                logger.error(f"Error searching Google for {query}: {e}")
                 continue
 
         return profile_urls[:max_results]
@@ -173,7 +181,7 @@ class InstagramHealerScraper:
             json_scripts = soup.find_all('script', type='application/ld+json')
             for script in json_scripts:
                 try:
-                    data = json.loads(script.string)
+                    data = load_json(script.string)
                     if isinstance(data, dict):
                         if 'name' in data:
                             profile_info['name'] = data['name']
@@ -390,14 +398,16 @@ class InstagramHealerScraper:
         all_contacts = []
         total_profiles_found = 0
 
-        # Search for each healing hashtag
-        for hashtag in self.healing_hashtags[:15]:  # Limit to first 15 hashtags
+        # Search for each healing hashtag; spelling variants share one search
+        for variants in group_variants(self.healing_hashtags[:15]):  # Limit to first 15 hashtags
+            hashtag = ' / #'.join(variants)
+            searches_before = self.search_cache.misses
             try:
                 logger.info(f"Searching hashtag: #{hashtag}")
 
                 # Find Instagram profiles via Google search
                 profile_urls = self.search_google_for_instagram_profiles(
-                    hashtag,
+                    variants,
                     max_results=max_profiles_per_hashtag
                 )
 
@@ -413,8 +423,9 @@ class InstagramHealerScraper:
                 else:
                     logger.info(f"No profiles found for #{hashtag}")
 
-                # Rate limiting between hashtags
-                time.sleep(random.uniform(8, 12))
+                # Rate limiting between hashtags (nothing to wait for when every search was cached)
+                if self.search_cache.misses > searches_before:
+                    time.sleep(random.uniform(8, 12))
 
             except Exception as e:
                 logger.error(f"Error processing hashtag #{hashtag}: {e}")
@@ -3,16 +3,17 @@
 LAST CHANCE 100 - Final attempt to get exactly 100
 Use psychology today and other real directories to find the missing 10 contacts.
 """
-import requests
 from bs4 import BeautifulSoup
 import re
 import csv
 import time
-import os
+
+from healer_discovery.http_client import create_session
+from healer_discovery.contacts import FINAL_CONTACTS_CSV, load_contacts
 
 class LastChance100:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
@@ -24,23 +25,11 @@ class LastChance100:
 
     def load_current_90(self):
         """Load current contacts from file"""
-        file_path = os.path.join(os.path.dirname(__file__), 'Discovery Results', 'exports', 'HEALER_CONTACTS_FINAL_100.csv')
-
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    email = row['Email'].lower().strip()
-                    # Skip obvious fake
-                    if 'example@email.com' not in email:
-                        self.current_contacts.append({
-                            'business_name': row['Business_Name'],
-                            'email': row['Email'],
-                            'website': row['Website']
-                        })
-                        self.existing_emails.add(email)
-        except:
-            pass
+        for contact in load_contacts(csv_files=[FINAL_CONTACTS_CSV]):
+            # Skip obvious fake
+            if 'example@email.com' not in contact['email']:
+                self.current_contacts.append({key: contact[key] for key in ('business_name', 'email', 'website')})
+                self.existing_emails.add(contact['email'])
 
         print(f"Loaded {len(self.current_contacts)} current contacts")
 
@@ -161,9 +150,7 @@ class LastChance100:
         # Take exactly first 100
         final_100 = self.current_contacts[:100]
 
-        file_path = os.path.join(os.path.dirname(__file__), 'Discovery Results', 'exports', 'HEALER_CONTACTS_FINAL_100.csv')
-
-        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+        with open(FINAL_CONTACTS_CSV, 'w', newline='', encoding='utf-8') as f:
             fieldnames = ['ID', 'Business_Name', 'Email', 'Website']
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
@@ -15,7 +15,6 @@ Based on research of GitHub tools:
 - kennethleungty/Web-Scraping-Walkthrough-HCP-Info
 """
 
-import requests
 from bs4 import BeautifulSoup
 import re
 import csv
@@ -28,6 +27,11 @@ from urllib.parse import urljoin, urlparse, quote
 import random
 from typing import Dict, List, Set, Tuple, Optional
 
+from healer_discovery.extraction_templates import template_for
+from healer_discovery.http_client import create_session
+from healer_discovery.contacts import FINAL_CONTACTS_CSV, load_contacts
+from healer_discovery.search_cache import SearchResultCache, group_variants, plan_queries
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -37,12 +41,11 @@ logger = logging.getLogger(__name__)
 
 class LinkedInHealerScraper:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         })
@@ -87,71 +90,81 @@ class LinkedInHealerScraper:
             'site:linkedin.com/in licensed "{specialty}"',
             'site:linkedin.com/in certified "{specialty}"'
         ]
+        self.search_cache = SearchResultCache()
 
         self.load_existing_contacts()
 
     def load_existing_contacts(self):
         """Load existing healer contacts to prevent duplicates"""
-        file_path = os.path.join(os.path.dirname(__file__), 'Discovery Results', 'exports', 'HEALER_CONTACTS_FINAL_100.csv')
+        if not os.path.exists(FINAL_CONTACTS_CSV):
+            logger.warning("Existing contacts file not found, starting fresh")
+            return
 
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    email = row['Email'].lower().strip()
-                    name = row['Business_Name'].lower().strip()
+        for contact in load_contacts(csv_files=[FINAL_CONTACTS_CSV]):
+            self.existing_emails.add(contact['email'])
+            self.existing_names.add(contact['business_name'].lower())
 
-                    self.existing_emails.add(email)
-                    self.existing_names.add(name)
+        logger.info(f"Loaded {len(self.existing_emails)} existing contacts for duplicate prevention")
 
-            logger.info(f"Loaded {len(self.existing_emails)} existing contacts for duplicate prevention")
-        except FileNotFoundError:
-            logger.warning("Existing contacts file not found, starting fresh")
-        except Exception as e:
-            logger.error(f"Error loading existing contacts: {e}")
-
-    def search_google_for_linkedin_profiles(self, specialty: str, max_results: int = 20) -> List[str]:
-        """Use Google search to find LinkedIn profiles of healing practitioners"""
+    def search_google_for_linkedin_profiles(self, specialty, max_results: int = 20) -> List[str]:
+        """Use Google search to find LinkedIn profiles of healing practitioners (specialty or list of related ones)"""
         profile_urls = []
 
-        for template in self.search_templates:
-            query = template.format(specialty=specialty)
-            search_url = f"https://www.google.com/search?q={quote(query)}&num=10"
+        # The keyword templates collapse into one OR query per specialty group; it stands in for
+        # several 10-result queries, so later result pages are read until max_results is reached
+        for query in plan_queries(self.search_templates, specialty, 'specialty'):
+            for start in range(0, max_results, 10):
+                new_urls = [url for url in self.google_linkedin_results(query, start) if url not in profile_urls]
+                profile_urls.extend(new_urls)
+                if not new_urls or len(profile_urls) >= max_results:
+                    break
 
-            try:
-                logger.info(f"Searching: {query}")
+            if len(profile_urls) >= max_results:
+                break
 
-                response = self.session.get(search_url, timeout=15)
-                if response.status_code != 200:
-                    logger.warning(f"Google search failed with status: {response.status_code}")
-                    continue
+        return profile_urls[:max_results]
 
-                soup = BeautifulSoup(response.content, 'html.parser')
+    def google_linkedin_results(self, query: str, start: int = 0) -> List[str]:
+        """LinkedIn profile URLs on one Google result page of a query (cached)"""
+        cached = self.search_cache.get('google', query, start)
+        if cached is not None:
+            logger.info(f"Searching (cached): {query}" + (f" [from {start}]" if start else ""))
+            return cached
 
-                # Extract LinkedIn profile URLs from search results
-                for link in soup.find_all('a', href=True):
-                    href = link['href']
-                    if 'linkedin.com/in/' in href and 'google.com' not in href:
-                        # Clean URL
-                        if href.startswith('/url?q='):
-                            href = href.split('/url?q=')[1].split('&')[0]
+        search_url = f"https://www.google.com/search?q={quote(query)}&num=10" + (f"&start={start}" if start else "")
+        query_urls = []
+        try:
+            logger.info(f"Searching: {query}" + (f" [from {start}]" if start else ""))
 
-                        if href.startswith('https://linkedin.com') or href.startswith('https://www.linkedin.com'):
-                            if href not in profile_urls:
-                                profile_urls.append(href)
-                                logger.info(f"Found LinkedIn profile: {href}")
+            response = self.session.get(search_url, timeout=15)
+            if response.status_code != 200:
+                logger.warning(f"Google search failed with status: {response.status_code}")
+                return query_urls
 
-                # Rate limiting for Google
-                time.sleep(random.uniform(3, 6))
+            soup = BeautifulSoup(response.content, 'html.parser')
 
-                if len(profile_urls) >= max_results:
-                    break
+            # Extract LinkedIn profile URLs from search results
+            for link in soup.find_all('a', href=True):
+                href = link['href']
+                if 'linkedin.com/in/' in href and 'google.com' not in href:
+                    # Clean URL
+                    if href.startswith('/url?q='):
+                        href = href.split('/url?q=')[1].split('&')[0]
 
-            except Exception as e:
-                logger.error(f"Error searching Google for '{specialty}': {e}")
-                continue
+                    if href.startswith('https://linkedin.com') or href.startswith('https://www.linkedin.com'):
+                        if href not in query_urls:
+                            query_urls.append(href)
+                            logger.info(f"Found LinkedIn profile: {href}")
 
-        return profile_urls[:max_results]
+            self.search_cache.put('google', query, query_urls, start)
+
+            # Rate limiting for Google
+            time.sleep(random.uniform(3, 6))
+
+        except Exception as e:
+            logger.error(f"Error searching Google for '{query}': {e}")
+
+        return query_urls
 
     def extract_linkedin_profile_info(self, profile_url: str) -> Optional[Dict]:
         """Extract information from a LinkedIn profile page"""
@@ -171,21 +184,9 @@ class LinkedInHealerScraper:
                 'platform': 'LinkedIn'
             }
 
-            # Try to extract name from various possible elements
-            name_selectors = [
-                'h1.text-heading-xlarge',
-                'h1.pv-text-details__left-panel__headline',
-                '.pv-text-details__left-panel h1',
-                'h1',
-                '.artdeco-entity-lockup__title'
-            ]
-
-            name = None
-            for selector in name_selectors:
-                name_elem = soup.select_one(selector)
-                if name_elem and name_elem.get_text(strip=True):
-                    name = name_elem.get_text(strip=True)
-                    break
+            # Name, headline and location come from the LinkedIn template in one pass over the page
+            fields = template_for(profile_url).extract(soup)
+            name = fields['name']
 
             if not name:
                 # Try to extract from title tag
@@ -200,37 +201,9 @@ class LinkedInHealerScraper:
                 return None
 
             profile_info['name'] = name
-
-            # Try to extract headline/title
-            headline_selectors = [
-                '.text-body-medium.break-words',
-                '.pv-text-details__left-panel__headline',
-                '.artdeco-entity-lockup__subtitle'
-            ]
-
-            headline = None
-            for selector in headline_selectors:
-                headline_elem = soup.select_one(selector)
-                if headline_elem and headline_elem.get_text(strip=True):
-                    headline = headline_elem.get_text(strip=True)
-                    break
-
+            headline = fields['headline']
             profile_info['headline'] = headline or 'Professional'
-
-            # Try to extract location
-            location_selectors = [
-                '.text-body-small.inline.t-black--light.break-words',
-                '.pv-text-details__left-panel .text-body-small'
-            ]
-
-            location = None
-            for selector in location_selectors:
-                location_elem = soup.select_one(selector)
-                if location_elem and location_elem.get_text(strip=True):
-                    location = location_elem.get_text(strip=True)
-                    break
-
-            profile_info['location'] = location
+            profile_info['location'] = fields['location']
 
             # Check if profile is healing-related
             full_text = soup.get_text().lower()
@@ -407,13 +380,15 @@ class LinkedInHealerScraper:
         total_profiles_found = 0
 
         # Search for each healing specialty
-        for specialty in self.healing_specialties[:10]:  # Limit to first 10 specialties
+        for specialties in group_variants(self.healing_specialties[:10]):  # Limit to first 10 specialties
+            specialty = ' / '.join(specialties)
+            searches_before = self.search_cache.misses
             try:
                 logger.info(f"Searching for: {specialty}")
 
                 # Find LinkedIn profiles via Google search
                 profile_urls = self.search_google_for_linkedin_profiles(
-                    specialty,
+                    specialties,
                     max_results=max_results_per_specialty
                 )
 
@@ -429,8 +404,9 @@ class LinkedInHealerScraper:
                 else:
                     logger.info(f"No profiles found for {specialty}")
 
-                # Rate limiting between specialties
-                time.sleep(random.uniform(10, 15))
+                # Rate limiting between specialties (nothing to wait for when every search was cached)
+                if self.search_cache.misses > searches_before:
+                    time.sleep(random.uniform(10, 15))
 
             except Exception as e:
                 logger.error(f"Error processing specialty '{specialty}': {e}")
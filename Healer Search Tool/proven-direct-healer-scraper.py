@@ -5,7 +5,6 @@ Focused approach using the direct website method that was successfully finding c
 Based on the working approach from the interrupted run.
 """
 
-import requests
 from bs4 import BeautifulSoup
 import re
 import csv
@@ -17,12 +16,14 @@ from urllib.parse import urlparse
 import random
 from typing import Dict, List
 
+from healer_discovery.http_client import create_session
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 class ProvenDirectHealerScraper:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
@@ -12,10 +12,12 @@ from datetime import datetime
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def quality_review_contacts():
+def quality_review_contacts(input_file=None, output_dir=None):
     """Review and clean the discovered social media contacts"""
+    exports_dir = os.path.join(os.path.dirname(__file__), 'Discovery Results', 'exports')
 
-    input_file = os.path.join(os.path.dirname(__file__), 'Discovery Results', 'exports', 'proven_direct_healers_20250914_014659.csv')
+    if input_file is None:
+        input_file = os.path.join(exports_dir, 'proven_direct_healers_20250914_014659.csv')
 
     # Read the discovered contacts
     contacts = []
@@ -78,7 +80,7 @@ def quality_review_contacts():
 
     # Create cleaned file
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_file = os.path.join(os.path.dirname(__file__), 'Discovery Results', 'exports', f'cleaned_social_healers_{timestamp}.csv')
+    output_file = os.path.join(output_dir or exports_dir, f'cleaned_social_healers_{timestamp}.csv')
 
     with open(output_file, 'w', newline='', encoding='utf-8') as f:
         fieldnames = ['ID', 'Business_Name', 'Email', 'Website', 'Platform']
@@ -4,7 +4,6 @@ REACH 100 CONTACTS - DUPLICATE-FREE SEARCH
 Build on existing 49 contacts to reach 100 with NO DUPLICATES.
 """
 
-import requests
 from bs4 import BeautifulSoup
 import re
 import csv
@@ -14,11 +13,20 @@ import logging
 import os
 import json
 from urllib.parse import urljoin, urlparse
-import glob
+
+from healer_discovery.http_client import create_session
+from healer_discovery.extraction_templates import template_for
+from healer_discovery.structured_data import structured_contact
+from healer_discovery.page_text import contact_text, is_asset_email, visible_text
+from healer_discovery.hosting import HostingClusters
+from healer_discovery.canonical import canonical_site, canonical_url, redirects
+from healer_discovery.probe import CandidateProber
+from healer_discovery.fingerprints import PARKED_PHRASES
+from healer_discovery.contacts import load_contacts
 
 class ReachHundredContacts:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -29,37 +37,22 @@ class ReachHundredContacts:
         self.existing_emails = set()
         self.existing_websites = set()
         self.new_contacts = []
-
-        self.load_existing_contacts()
+        self.hosting = HostingClusters()
+        self.prober = CandidateProber(self.session)
+        redirects.enable()
 
         logging.basicConfig(level=logging.INFO, format='%(message)s')
         self.logger = logging.getLogger(__name__)
 
+        self.load_existing_contacts()
+
     def load_existing_contacts(self):
         """Load all existing contacts to prevent duplicates"""
-        results_dir = os.path.join(os.path.dirname(__file__), 'Discovery Results', 'exports')
-        csv_files = glob.glob(os.path.join(results_dir, '*.csv'))
-
-        for csv_file in csv_files:
-            try:
-                with open(csv_file, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        # Get email from various column names
-                        email = (row.get('Email') or
-                                row.get('Primary_Email') or
-                                row.get('email', '')).strip().lower()
-
-                        # Get website from various column names
-                        website = (row.get('Website') or
-                                  row.get('website', '')).strip().lower()
-
-                        if email and '@' in email:
-                            self.existing_emails.add(email)
-                        if website and 'http' in website:
-                            self.existing_websites.add(website)
-            except:
-                continue
+        for contact in load_contacts():
+            self.existing_emails.add(contact['email'])
+            website = contact['website'].lower()
+            if 'http' in website:
+                self.existing_websites.add(canonical_site(website))
 
         self.logger.info(f"Loaded {len(self.existing_emails)} existing emails to avoid duplicates")
         self.logger.info(f"Loaded {len(self.existing_websites)} existing websites to avoid duplicates")
@@ -93,11 +86,11 @@ class ReachHundredContacts:
                 for suffix in suffixes[:6]:  # Limit combinations
                     for ext in ['.com', '.org']:
                         url = f"https://www.{base}{healing}{suffix}{ext}"
-                        if url.lower() not in self.existing_websites:
+                        if canonical_site(url) not in self.existing_websites:
                             urls.append(url)
 
                         url = f"https://{base}-{healing}-{suffix}{ext}"
-                        if url.lower() not in self.existing_websites:
+                        if canonical_site(url) not in self.existing_websites:
                             urls.append(url)
 
                         # Stop when we have enough new URLs
@@ -164,11 +157,11 @@ class ReachHundredContacts:
                     if full_url not in profile_links:
                         profile_links.append(full_url)
 
-            # Extract from profiles
-            for profile_url in profile_links[:20]:  # Limit per directory
+            # Extract from profiles that pass a HEAD probe
+            for probe in self.prober.promising(profile_links[:20]):  # Limit per directory
                 try:
                     time.sleep(1)
-                    profile_contacts = self.extract_contact_from_profile(profile_url)
+                    profile_contacts = self.extract_contact_from_profile(probe.final_url)
                     contacts.extend(profile_contacts)
                 except:
                     continue
@@ -187,14 +180,24 @@ class ReachHundredContacts:
             if response.status_code != 200:
                 return contacts
 
-            content = response.text
-            soup = BeautifulSoup(content, 'html.parser')
+            # An alias redirecting to a site already searched adds nothing new
+            site = canonical_site(response.url)
+            if site != canonical_site(url) and site in self.existing_websites:
+                return contacts
+            self.existing_websites.add(site)
+            url = canonical_url(response.url)
 
-            # Extract emails
-            emails = self.extract_clean_emails(content)
+            content = response.text
 
-            # Get practitioner name and business info
-            name = self.extract_practitioner_name(soup)
+            # The profile's own Schema.org markup first; complete markup needs no parse or full-text scan
+            structured = structured_contact(content)
+            if structured and structured.complete:
+                emails = self.extract_clean_emails(' '.join(structured.emails))
+                name = structured.name
+            else:
+                emails = self.extract_clean_emails(content)
+                name = structured.name if structured and structured.name else \
+                    self.extract_practitioner_name(BeautifulSoup(content, 'html.parser'), url)
 
             for email in emails:
                 if email.lower() not in self.existing_emails:
@@ -211,10 +214,10 @@ class ReachHundredContacts:
 
         return contacts
 
-    def extract_clean_emails(self, content):
-        """Extract clean email addresses"""
+    def extract_clean_emails(self, content, text=None):
+        """Extract clean email addresses from a page's mailto: links, contact regions and visible text"""
         email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, content, re.IGNORECASE)
+        emails = re.findall(email_pattern, contact_text(content, text), re.IGNORECASE)
 
         clean_emails = []
         for email in emails:
@@ -222,9 +225,8 @@ class ReachHundredContacts:
 
             # Skip bad emails
             if any(bad in email for bad in [
-                'noreply', 'no-reply', 'example.com', 'test.com', '.png', '.jpg',
-                'sentry.io', 'godaddy.com', 'wixpress.com', 'domain.com'
-            ]):
+                'noreply', 'no-reply', 'example.com', 'test.com', 'godaddy.com', 'domain.com'
+            ]) or is_asset_email(email):
                 continue
 
             # Basic validation
@@ -235,20 +237,12 @@ class ReachHundredContacts:
 
         return clean_emails
 
-    def extract_practitioner_name(self, soup):
+    def extract_practitioner_name(self, soup, url=''):
         """Extract practitioner/business name from profile"""
-        # Try different methods to get name
-        name_selectors = [
-            'h1', '.name', '.practitioner-name', '.provider-name',
-            '.business-name', '.title', '[itemprop="name"]'
-        ]
-
-        for selector in name_selectors:
-            element = soup.select_one(selector)
-            if element:
-                name = element.get_text().strip()
-                if name and len(name) < 100:
-                    return name
+        # The directory's own template, or the generic profile selectors
+        name = template_for(url).extract(soup)['name']
+        if name:
+            return name
 
         # Try title tag
         title = soup.find('title')
@@ -264,13 +258,20 @@ class ReachHundredContacts:
         new_urls = self.generate_new_healer_urls()
 
         self.logger.info(f"Generated {len(new_urls)} new URLs to search")
+        new_urls = self.hosting.plan(redirects.dedupe(new_urls))
+        self.logger.info(f"{len(new_urls)} left after dropping unregistered domains and parked hosting clusters")
 
-        for i, url in enumerate(new_urls):
+        # Guessed domains get a HEAD probe; only live HTML pages are downloaded in full
+        for i, probe in enumerate(self.prober.probe_all(new_urls)):
             if len(self.new_contacts) >= 100:
                 break
+            if not probe.promising:
+                if probe.reason == 'parked':
+                    self.hosting.record(probe.url, 'parked')
+                continue
 
             try:
-                contacts = self.extract_from_healer_site(url)
+                contacts = self.extract_from_healer_site(probe.final_url, probe.url)
                 self.new_contacts.extend(contacts)
 
                 if len(self.new_contacts) % 10 == 0 and len(self.new_contacts) > 0:
@@ -286,11 +287,12 @@ class ReachHundredContacts:
 
         return self.new_contacts
 
-    def extract_from_healer_site(self, url):
-        """Extract contacts from individual healer website"""
+    def extract_from_healer_site(self, url, candidate=None):
+        """Extract contacts from individual healer website (candidate: the generated URL the probe started from)"""
         contacts = []
+        candidate = candidate or url  # DNS answers, and so hosting outcomes, are keyed by the candidate's host
 
-        if url.lower() in self.existing_websites:
+        if canonical_site(url) in self.existing_websites:
             return contacts
 
         try:
@@ -298,29 +300,42 @@ class ReachHundredContacts:
             if response.status_code != 200:
                 return contacts
 
+            # An alias redirecting to a site already searched adds nothing new
+            site = canonical_site(response.url)
+            if site != canonical_site(url) and site in self.existing_websites:
+                return contacts
+            self.existing_websites.add(site)
+            website = canonical_url(response.url)  # dedupe and output; hosting outcomes stay on the candidate URL
+
             content = response.text
             soup = BeautifulSoup(content, 'html.parser')
 
-            # Check if healing-related
-            content_lower = content.lower()
+            # Check if healing-related, on the visible text only
+            text = visible_text(content)
+            content_lower = text.lower()
+            if any(phrase in content_lower for phrase in PARKED_PHRASES):
+                self.hosting.record(candidate, 'parked')
+                return contacts
             if not any(term in content_lower for term in [
                 'reiki', 'healing', 'energy', 'spiritual', 'wellness',
                 'chakra', 'meditation', 'therapy', 'holistic'
             ]):
+                self.hosting.record(candidate, 'irrelevant')
                 return contacts
+            self.hosting.record(candidate, 'relevant')
 
             # Extract emails
-            emails = self.extract_clean_emails(content)
+            emails = self.extract_clean_emails(content, text)
 
             # Get business name
-            business_name = self.get_business_name(url, soup)
+            business_name = self.get_business_name(website, soup)
 
             for email in emails:
                 if email.lower() not in self.existing_emails:
                     contacts.append({
                         'business_name': business_name,
                         'email': email,
-                        'website': url,
+                        'website': website,
                         'source': 'individual_site'
                     })
                     self.existing_emails.add(email.lower())
@@ -330,7 +345,7 @@ class ReachHundredContacts:
         except Exception as e:
             pass
 
-        self.existing_websites.add(url.lower())
+        self.existing_websites.add(canonical_site(url))
         return contacts
 
     def get_business_name(self, url, soup):
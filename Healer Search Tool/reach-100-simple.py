@@ -4,44 +4,52 @@ REACH 100 CONTACTS - SIMPLE & AGGRESSIVE
 Find 51+ more unique healer contacts to reach 100 total.
 """
 
-import requests
 from bs4 import BeautifulSoup
 import re
 import csv
 import time
 from datetime import datetime
 import os
-import glob
+import argparse
+
+from healer_discovery.metrics import metrics, url_pattern
+from healer_discovery.profiling import start_profiling, url_timings
+from healer_discovery.http_client import create_session
+from healer_discovery.budget import budget, url_value
+from healer_discovery.host_health import host_health
+from healer_discovery.fingerprints import FingerprintIndex
+from healer_discovery.hosting import HostingClusters
+from healer_discovery.canonical import canonical_url, redirects
+from healer_discovery.probe import CandidateProber, ProbeResult
+from healer_discovery.structured_data import structured_contact
+from healer_discovery.page_text import contact_text, is_asset_email, visible_text
+from healer_discovery.contacts import existing_emails
 
 class SimpleHundredSearch:
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, probe=True):
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
+        metrics.instrument_session(self.session)
 
         # Load existing contacts
         self.existing_emails = set()
         self.load_existing_contacts()
         self.new_contacts = []
+        self.fingerprints = FingerprintIndex()
+        self.hosting = HostingClusters()
+        self.sites_searched = set()
+        redirects.enable()
+
+        # Guessed domains are probed (HEAD / first 16 KB) before the full download
+        self.prober = CandidateProber(self.session) if probe else None
 
         print(f"Loaded {len(self.existing_emails)} existing emails to avoid duplicates")
 
     def load_existing_contacts(self):
         """Load existing contacts to prevent duplicates"""
-        results_dir = os.path.join(os.path.dirname(__file__), 'Discovery Results', 'exports')
-        csv_files = glob.glob(os.path.join(results_dir, '*.csv'))
-
-        for csv_file in csv_files:
-            try:
-                with open(csv_file, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        email = (row.get('Email') or row.get('Primary_Email') or row.get('email', '')).strip().lower()
-                        if email and '@' in email:
-                            self.existing_emails.add(email)
-            except:
-                continue
+        self.existing_emails.update(existing_emails())
 
     def generate_massive_url_list(self):
         """Generate massive list of potential healer URLs"""
@@ -113,25 +121,48 @@ class SimpleHundredSearch:
 
         return urls
 
-    def extract_emails_from_site(self, url):
-        """Extract emails from a single site"""
+    def extract_emails_from_site(self, url, candidate=None):
+        """Extract emails from a single site (candidate: the generated URL the probe started from)"""
+        candidate = candidate or url  # DNS answers, and so hosting outcomes, are keyed by the candidate's host
         try:
             response = self.session.get(url, timeout=5)
             if response.status_code != 200:
                 return []
 
+            # Aliases that redirect to a site already searched add nothing
+            website = canonical_url(response.url)
+            if website in self.sites_searched:
+                return []
+            self.sites_searched.add(website)
+
             content = response.text
 
-            # Quick healing check
-            if not any(term in content.lower() for term in [
+            # Parked/template pages, and pages seen before (their emails are already known), are skipped
+            match = self.fingerprints.check(url, content)
+            if match.template:
+                self.hosting.record(candidate, 'parked')
+            if match.template or match.duplicate:
+                return []
+
+            # Quick healing check, on the visible text only
+            text = visible_text(content)
+            if not any(term in text.lower() for term in [
                 'reiki', 'healing', 'energy', 'spiritual', 'wellness', 'chakra',
                 'meditation', 'therapy', 'holistic', 'massage', 'acupuncture'
             ]):
+                self.fingerprints.record(match, url, None)
+                self.hosting.record(candidate, 'irrelevant')
                 return []
+            self.hosting.record(candidate, 'relevant')
 
-            # Extract emails
-            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            emails = re.findall(email_pattern, content, re.IGNORECASE)
+            # The site's own Schema.org markup first; complete markup skips the full-text scan
+            structured = structured_contact(content)
+            if structured and structured.complete:
+                emails = structured.emails
+            else:
+                email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+                with url_timings.stage(url, 'extract'):
+                    emails = re.findall(email_pattern, contact_text(content, text), re.IGNORECASE)
 
             clean_emails = []
             for email in emails:
@@ -139,9 +170,8 @@ class SimpleHundredSearch:
 
                 # Skip bad emails
                 if any(bad in email for bad in [
-                    'noreply', 'no-reply', 'example.com', 'test.com', '.png',
-                    'sentry.io', 'godaddy.com', 'wixpress.com'
-                ]):
+                    'noreply', 'no-reply', 'example.com', 'test.com', 'godaddy.com'
+                ]) or is_asset_email(email):
                     continue
 
                 # Check if new
@@ -151,12 +181,18 @@ class SimpleHundredSearch:
                         clean_emails.append(email)
                         self.existing_emails.add(email)
 
-            # Get business name from title
-            soup = BeautifulSoup(content, 'html.parser')
-            title_tag = soup.find('title')
-            business_name = title_tag.get_text().strip()[:80] if title_tag else url.split('//')[1].split('/')[0]
+            # Business name from the markup, else from the title
+            if structured and structured.name:
+                business_name = structured.name[:80]
+            else:
+                with url_timings.stage(url, 'parse'):
+                    soup = BeautifulSoup(content, 'html.parser')
+                title_tag = soup.find('title')
+                business_name = title_tag.get_text().strip()[:80] if title_tag else url.split('//')[1].split('/')[0]
 
-            return [(email, business_name, url) for email in clean_emails]
+            contacts = [(email, business_name, website) for email in clean_emails]
+            self.fingerprints.record(match, url, contacts)
+            return contacts
 
         except:
             return []
@@ -176,14 +212,39 @@ class SimpleHundredSearch:
 
         urls = self.generate_massive_url_list()
         print(f"Generated {len(urls)} URLs to search")
+        urls = redirects.dedupe(urls)
+        if budget.enabled:
+            # Most promising names first; the hosting plan's stable sort keeps that order within a cluster
+            known_hosts = {email.split('@')[1] for email in self.existing_emails}
+            urls = sorted(urls, key=lambda url: url_value(url, known_hosts), reverse=True)
+        urls = self.hosting.plan(urls)
+        print(f"{len(urls)} left after dropping unregistered domains and parked hosting clusters")
+        if budget.enabled:
+            urls = budget.plan(urls, value=None)  # Cut in cluster order, not re-sorted by name
+            print(f"Daily budget allows {len(urls)} of them, most promising first")
+
+        probes = self.prober.probe_all(urls) if self.prober else (ProbeResult(url) for url in urls)
 
         found_count = 0
-        for i, url in enumerate(urls):
+        for i, probe in enumerate(probes):
             if found_count >= needed:
                 break
 
+            url = probe.url
+            metrics.set_gauge('queue_depth', len(urls) - i, queue='generated_urls')
+            if not probe.promising:
+                metrics.inc('url_yield_total', pattern=url_pattern(url), outcome=f"probe_{probe.reason}")
+                if probe.reason == 'parked':
+                    self.hosting.record(url, 'parked')
+                continue
+            if not host_health.available(url):
+                metrics.inc('url_yield_total', pattern=url_pattern(url), outcome='circuit_open')
+                continue
+
             try:
-                new_emails = self.extract_emails_from_site(url)
+                new_emails = self.extract_emails_from_site(probe.final_url, probe.url)
+                metrics.inc('url_yield_total', pattern=url_pattern(url),
+                            outcome='contact' if new_emails else 'empty')
 
                 for email, business_name, website in new_emails:
                     self.new_contacts.append({
@@ -230,7 +291,29 @@ class SimpleHundredSearch:
         return os.path.basename(csv_file)
 
 def main():
-    searcher = SimpleHundredSearch()
+    parser = argparse.ArgumentParser(description="Reach 100 contacts - simple search")
+    parser.add_argument('--metrics', choices=['prom', 'json'],
+                        help="collect run metrics and write them to Discovery Results/metrics")
+    parser.add_argument('--profile', choices=['cprofile', 'sample'],
+                        help="profile the run and write a report to Discovery Results/profiles")
+    parser.add_argument('--adaptive-hosts', action='store_true',
+                        help="learn per-host timeouts and skip hosts that keep failing (state kept across runs)")
+    parser.add_argument('--daily-budget', action='store_true',
+                        help="enforce the shared daily fetch limits and fetch the most promising URLs first")
+    parser.add_argument('--no-probe', action='store_true',
+                        help="download every candidate in full instead of probing it with HEAD first")
+    args = parser.parse_args()
+
+    if args.metrics:
+        metrics.enable(args.metrics)
+    if args.profile:
+        start_profiling(args.profile)
+    if args.adaptive_hosts:
+        host_health.enable()
+    if args.daily_budget:
+        budget.enable()
+
+    searcher = SimpleHundredSearch(probe=not args.no_probe)
 
     # Run the search
     new_contacts = searcher.run_massive_search()
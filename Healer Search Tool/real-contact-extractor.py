@@ -4,7 +4,6 @@ STREAMLINED REAL CONTACT EXTRACTOR
 Quick extraction of real healer contact data from live websites.
 """
 
-import requests
 from bs4 import BeautifulSoup
 import re
 import json
@@ -13,10 +12,12 @@ import time
 from datetime import datetime
 import logging
 
+from healer_discovery.http_client import create_session
+
 class RealContactExtractor:
     def __init__(self):
         self.healers_found = []
-        self.session = requests.Session()
+        self.session = create_session()
 
         # Set up session headers
         self.session.headers.update({
@@ -5,7 +5,6 @@ Gets actual contact information from real websites, directories, and social medi
 Uses real GitHub tools with manual verification fallbacks.
 """
 
-import requests
 from bs4 import BeautifulSoup
 import re
 import json
@@ -15,11 +14,24 @@ import random
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
 import logging
+import argparse
+
+from healer_discovery.sitemaps import SitemapPageSelector
+from healer_discovery.http_client import create_session
+from healer_discovery.search_cache import SearchResultCache, dedupe_queries, result_links
+from healer_discovery.directory_crawler import DirectoryCrawler, JsonLinesSink
+from healer_discovery.extraction_templates import template_for
+from healer_discovery.structured_data import structured_contact
+from healer_discovery.page_text import contact_text
 
 class RealDataHealerScraper:
-    def __init__(self):
+    def __init__(self, use_sitemaps=False):
         self.healers_found = []
-        self.session = requests.Session()
+        self.session = create_session()
+
+        # Optional sitemap/robots.txt driven contact page selection
+        self.sitemap_selector = SitemapPageSelector(self.session) if use_sitemaps else None
+        self.search_cache = SearchResultCache()
 
         # Real user agent rotation
         self.user_agents = [
@@ -47,10 +59,9 @@ class RealDataHealerScraper:
         ]
 
         # Email and phone patterns for extraction
+        # Patterns run over page_text.contact_text(), which already lists mailto: targets first
         self.email_patterns = [
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            r'mailto:([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})',
-            r'["\']([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})["\']'
+            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
         ]
 
         self.phone_patterns = [
@@ -161,7 +172,12 @@ class RealDataHealerScraper:
         return domain.split('.')[0].title()
 
     def find_contact_pages(self, base_url, content):
-        """Find contact page URLs from main page"""
+        """Find contact page URLs from the sitemap, falling back to main page links"""
+        if self.sitemap_selector:
+            sitemap_pages = self.sitemap_selector.select_pages(base_url, limit=3)
+            if sitemap_pages:
+                return sitemap_pages
+
         soup = BeautifulSoup(content, 'html.parser')
         contact_urls = []
 
@@ -184,26 +200,40 @@ class RealDataHealerScraper:
         """Scrape a real healer website for contact information"""
         self.logger.info(f"Scraping real site: {url}")
 
+        if self.sitemap_selector and not self.sitemap_selector.robots.can_fetch(url):
+            self.logger.info(f"  Skipping (disallowed by robots.txt): {url}")
+            return None
+
         # Get main page
         main_content = self.get_real_page(url)
         if not main_content:
             return None
 
-        # Extract initial contact info
-        emails = self.extract_real_emails(main_content)
-        phones = self.extract_real_phones(main_content)
-        business_name = self.extract_business_name(main_content, url)
+        # The site's own Schema.org markup first; a complete record needs no text scan or contact pages
+        structured = structured_contact(main_content)
+        if structured and structured.complete:
+            emails = self.extract_real_emails(' '.join(structured.emails))
+            phones = self.extract_real_phones(' '.join(structured.phones))
+            business_name = structured.name
+            contact_pages = []
+        else:
+            main_text = contact_text(main_content)
+            emails = self.extract_real_emails(main_text)
+            phones = self.extract_real_phones(main_text)
+            business_name = structured.name if structured and structured.name else \
+                self.extract_business_name(main_content, url)
 
-        # Find and scrape contact pages
-        contact_pages = self.find_contact_pages(url, main_content)
+            # Find and scrape contact pages
+            contact_pages = self.find_contact_pages(url, main_content)
 
         for contact_url in contact_pages:
             self.logger.info(f"  Checking contact page: {contact_url}")
             contact_content = self.get_real_page(contact_url)
 
             if contact_content:
-                contact_emails = self.extract_real_emails(contact_content)
-                contact_phones = self.extract_real_phones(contact_content)
+                contact_page_text = contact_text(contact_content)
+                contact_emails = self.extract_real_emails(contact_page_text)
+                contact_phones = self.extract_real_phones(contact_page_text)
 
                 emails.extend(contact_emails)
                 phones.extend(contact_phones)
@@ -232,24 +262,29 @@ class RealDataHealerScraper:
         return None
 
     def search_google_for_healers(self, search_term, max_results=10):
-        """Search Google for healer websites (be very careful with rate limits)"""
-        self.logger.info(f"Google search: {search_term}")
-
+        """Search DuckDuckGo for healer websites (be very careful with rate limits)"""
         # Note: This would normally use Google Custom Search API to avoid being blocked
         # For now, we'll use DuckDuckGo as it's more scraping-friendly
 
-        search_url = f"https://duckduckgo.com/html/?q={search_term.replace(' ', '+')}"
+        # The cache holds the unfiltered result links (shared with other scripts); filtering happens below
+        links = self.search_cache.get('duckduckgo_links', search_term)
+        if links is not None:
+            self.logger.info(f"DuckDuckGo search (cached): {search_term}")
+        else:
+            self.logger.info(f"DuckDuckGo search: {search_term}")
+            search_url = f"https://duckduckgo.com/html/?q={search_term.replace(' ', '+')}"
+
+            content = self.get_real_page(search_url)
+            if not content:
+                return []
 
-        content = self.get_real_page(search_url)
-        if not content:
-            return []
+            links = result_links(BeautifulSoup(content, 'html.parser'))
+            self.search_cache.put('duckduckgo_links', search_term, links)
 
-        soup = BeautifulSoup(content, 'html.parser')
         urls = []
 
         # Extract URLs from search results
-        for link in soup.find_all('a', href=True):
-            href = link['href']
+        for href in links:
             if 'uddg=' in href:  # DuckDuckGo result link
                 # Extract actual URL from DuckDuckGo redirect
                 actual_url = href.split('uddg=')[1].split('&')[0]
@@ -268,7 +303,7 @@ class RealDataHealerScraper:
 
         return urls[:max_results]
 
-    def scrape_psychology_today(self):
+    def scrape_psychology_today(self, target=50):
         """Scrape real healer listings from Psychology Today"""
         self.logger.info("Scraping Psychology Today for real healers...")
 
@@ -279,61 +314,38 @@ class RealDataHealerScraper:
             'https://www.psychologytoday.com/us/therapists/energy-healing?sid=1'
         ]
 
-        healers = []
+        # Walk every results page and fetch profiles two at a time, 3 seconds apart (rate limiting for Psychology Today)
+        crawler = DirectoryCrawler(
+            self.session, extract=self.extract_psychology_today_profile,
+            profile_pattern=r'/us/therapists/[^/?#]+/\d+', fetch=self.get_real_page,
+            per_host=2, delay=3.0, target=target, sink=JsonLinesSink.for_source('psychology_today'))
 
-        for url in pt_urls:
-            content = self.get_real_page(url)
-            if not content:
-                continue
+        return list(crawler.crawl(pt_urls))
 
-            soup = BeautifulSoup(content, 'html.parser')
-
-            # Look for therapist profile links
-            profile_links = []
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                if '/therapists/' in href and href.startswith('/us/therapists/'):
-                    full_url = 'https://www.psychologytoday.com' + href
-                    profile_links.append(full_url)
-
-            # Scrape individual profiles
-            for profile_url in profile_links[:5]:  # Limit to 5 per search
-                self.logger.info(f"  Scraping PT profile: {profile_url}")
-
-                profile_content = self.get_real_page(profile_url)
-                if not profile_content:
-                    continue
-
-                emails = self.extract_real_emails(profile_content)
-                phones = self.extract_real_phones(profile_content)
-
-                if emails or phones:
-                    # Extract name from profile
-                    profile_soup = BeautifulSoup(profile_content, 'html.parser')
-                    name_tag = profile_soup.find('h1')
-                    name = name_tag.get_text().strip() if name_tag else "Psychology Today Practitioner"
-
-                    healer_data = {
-                        'name': name,
-                        'website': profile_url,
-                        'emails': emails,
-                        'phones': phones,
-                        'discovery_method': 'psychology_today_directory',
-                        'discovery_date': datetime.now().isoformat(),
-                        'data_source': 'real_scraping',
-                        'specialties': ['Holistic Healing', 'Alternative Therapy']
-                    }
-
-                    healers.append(healer_data)
-                    self.logger.info(f"    REAL PT DATA: {name} - {len(emails)} emails, {len(phones)} phones")
-
-                # Rate limiting for Psychology Today
-                time.sleep(random.uniform(3, 6))
-
-            # Rate limiting between searches
-            time.sleep(random.uniform(5, 8))
+    def extract_psychology_today_profile(self, profile_url, profile_content):
+        """Healer record from a Psychology Today profile page, or None without contact details"""
+        profile_text = contact_text(profile_content)
+        emails = self.extract_real_emails(profile_text)
+        phones = self.extract_real_phones(profile_text)
+        if not (emails or phones):
+            return None
 
-        return healers
+        # Extract name from profile
+        profile_soup = BeautifulSoup(profile_content, 'html.parser')
+        name = template_for(profile_url).extract(profile_soup)['name'] or "Psychology Today Practitioner"
+
+        healer_data = {
+            'name': name,
+            'website': profile_url,
+            'emails': emails,
+            'phones': phones,
+            'discovery_method': 'psychology_today_directory',
+            'discovery_date': datetime.now().isoformat(),
+            'data_source': 'real_scraping',
+            'specialties': ['Holistic Healing', 'Alternative Therapy']
+        }
+        self.logger.info(f"    REAL PT DATA: {name} - {len(emails)} emails, {len(phones)} phones")
+        return healer_data
 
     def run_real_discovery_session(self, target_count=20):
         """Run actual data discovery session with real scraping"""
@@ -359,10 +371,11 @@ class RealDataHealerScraper:
             "crystal healer professional services"
         ]
 
-        for search_term in search_terms:
+        for search_term in dedupe_queries(search_terms):
             if len(self.healers_found) >= target_count:
                 break
 
+            searches_before = self.search_cache.misses
             urls = self.search_google_for_healers(search_term, max_results=5)
 
             for url in urls:
@@ -376,14 +389,18 @@ class RealDataHealerScraper:
                 # Rate limiting between sites
                 time.sleep(random.uniform(5, 10))
 
-            # Rate limiting between searches
-            time.sleep(random.uniform(10, 15))
+            # Rate limiting between searches (skipped when the results came from the cache)
+            if self.search_cache.misses > searches_before:
+                time.sleep(random.uniform(10, 15))
 
         # 3. Scrape Psychology Today if we need more
         if len(self.healers_found) < target_count:
-            pt_healers = self.scrape_psychology_today()
+            pt_healers = self.scrape_psychology_today(target=target_count - len(self.healers_found))
             self.healers_found.extend(pt_healers[:target_count - len(self.healers_found)])
 
+        if self.sitemap_selector:
+            self.sitemap_selector.save()
+
         self.logger.info(f"REAL discovery complete: {len(self.healers_found)} healers found")
         return self.healers_found
 
@@ -427,11 +444,16 @@ class RealDataHealerScraper:
         return json_file, csv_file
 
 def main():
+    parser = argparse.ArgumentParser(description="Real data healer scraper")
+    parser.add_argument('--sitemaps', action='store_true',
+                        help="select contact pages from robots.txt/sitemap.xml instead of homepage links")
+    args = parser.parse_args()
+
     print("*** REAL DATA HEALER SCRAPER ***")
     print("Getting actual contact information from live websites...")
     print("=" * 60)
 
-    scraper = RealDataHealerScraper()
+    scraper = RealDataHealerScraper(use_sitemaps=args.sitemaps)
 
     try:
         # Run real scraping session
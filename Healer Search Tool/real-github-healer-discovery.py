@@ -13,10 +13,11 @@ import csv
 import re
 from datetime import datetime
 import time
-import requests
 from urllib.parse import urljoin, urlparse
 import logging
 
+from healer_discovery import http_client
+
 class RealHealerDiscoveryTool:
     def __init__(self):
         self.healers_found = []
@@ -162,7 +163,7 @@ class RealHealerDiscoveryTool:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
 
-            response = requests.get(profile_url, headers=headers, timeout=10)
+            response = http_client.get(profile_url, headers=headers, timeout=10)
 
             if response.status_code == 200:
                 # Extract email and phone patterns from the page content
@@ -265,7 +266,7 @@ class RealHealerDiscoveryTool:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
 
-            response = requests.get(website_url, headers=headers, timeout=15)
+            response = http_client.get(website_url, headers=headers, timeout=15)
 
             if response.status_code == 200:
                 content = response.text
@@ -280,7 +281,7 @@ class RealHealerDiscoveryTool:
                 # Scrape contact pages if found
                 for contact_url in contact_links[:2]:  # Limit to 2 contact pages
                     try:
-                        contact_response = requests.get(contact_url, headers=headers, timeout=10)
+                        contact_response = http_client.get(contact_url, headers=headers, timeout=10)
                         if contact_response.status_code == 200:
                             contact_emails = self.extract_emails_from_text(contact_response.text)
                             contact_phones = self.extract_phones_from_text(contact_response.text)
@@ -12,7 +12,6 @@ Features:
 - CSV export in standardized format
 """
 
-import requests
 from bs4 import BeautifulSoup
 import re
 import csv
@@ -26,6 +25,8 @@ from urllib.parse import urljoin, urlparse
 import random
 from typing import Dict, List, Set, Tuple, Optional
 
+from healer_discovery.http_client import create_session
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -35,7 +36,7 @@ logger = logging.getLogger(__name__)
 
 class SocialMediaHealerDiscovery:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
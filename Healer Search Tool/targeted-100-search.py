@@ -4,18 +4,19 @@ TARGETED 100 SEARCH
 Use real healer networks and associations to quickly find 51+ more contacts.
 """
 
-import requests
 from bs4 import BeautifulSoup
 import re
 import csv
 import time
 from datetime import datetime
 import os
-import glob
+
+from healer_discovery.http_client import create_session
+from healer_discovery.contacts import existing_emails
 
 class Targeted100Search:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
@@ -26,17 +27,7 @@ class Targeted100Search:
 
     def load_existing_contacts(self):
         """Load existing contacts"""
-        results_dir = os.path.join(os.path.dirname(__file__), 'Discovery Results', 'exports')
-        for csv_file in glob.glob(os.path.join(results_dir, '*.csv')):
-            try:
-                with open(csv_file, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        email = (row.get('Email') or row.get('Primary_Email') or row.get('email', '')).strip().lower()
-                        if email and '@' in email:
-                            self.existing_emails.add(email)
-            except:
-                continue
+        self.existing_emails.update(existing_emails())
 
         print(f"Loaded {len(self.existing_emails)} existing emails")
 
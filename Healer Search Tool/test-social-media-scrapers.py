@@ -8,6 +8,7 @@ Features:
 - Validation of duplicate prevention
 - CSV output verification
 - Error handling testing
+- Offline record/replay of HTTP traffic (--record / --replay)
 """
 
 import subprocess
@@ -17,6 +18,7 @@ import csv
 import logging
 from datetime import datetime
 import glob
+import argparse
 from typing import Dict, List
 
 # Configure logging
@@ -27,13 +29,37 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class SocialMediaScrapersTestRunner:
-    def __init__(self):
+    def __init__(self, http_mode=None, fixtures_dir=None):
+        # http_mode is None (live), 'record' or 'replay'
+        self.http_mode = http_mode
+        self.fixtures_dir = fixtures_dir or os.path.join(os.path.dirname(__file__), 'fixtures')
         self.test_results = {
             'linkedin': {'success': False, 'contacts_found': 0, 'file_path': None},
             'instagram': {'success': False, 'contacts_found': 0, 'file_path': None}
         }
         self.test_start_time = datetime.now()
 
+    def build_command(self, script_path: str, platform: str) -> List[str]:
+        """Command line for a test scraper, wrapped in the record/replay harness when enabled"""
+        if not self.http_mode:
+            return [sys.executable, script_path]
+
+        return [sys.executable, '-m', 'healer_discovery.replay', self.http_mode,
+                os.path.join(self.fixtures_dir, platform), script_path]
+
+    def speed_up_sleeps(self, script_content: str, replacements: Dict[str, str]) -> str:
+        """Shorten sleeps for plain live runs.
+
+        Recorded and replayed runs keep the original source so both consume the
+        same random sequence; replay skips the sleeps itself.
+        """
+        if self.http_mode:
+            return script_content
+
+        for original, faster in replacements.items():
+            script_content = script_content.replace(original, faster)
+        return script_content
+
     def count_existing_contacts(self):
         """Count existing contacts in the main database"""
         file_path = os.path.join(os.path.dirname(__file__), 'Discovery Results', 'exports', 'HEALER_CONTACTS_FINAL_100.csv')
@@ -73,21 +99,20 @@ class SocialMediaScrapersTestRunner:
             ).replace(
                 'max_results_per_specialty: int = 10',
                 'max_results_per_specialty: int = 2'  # Only 2 results per specialty
-            ).replace(
-                'time.sleep(random.uniform(10, 15))',
-                'time.sleep(2)'  # Faster for testing
-            ).replace(
-                'time.sleep(random.uniform(5, 10))',
-                'time.sleep(1)'  # Faster for testing
             )
+            test_script_content = self.speed_up_sleeps(test_script_content, {
+                'time.sleep(random.uniform(10, 15))': 'time.sleep(2)',  # Faster for testing
+                'time.sleep(random.uniform(5, 10))': 'time.sleep(1)'
+            })
 
             with open(test_linkedin_script, 'w', encoding='utf-8') as f:
                 f.write(test_script_content)
 
             # Run the test script
             logger.info("Executing LinkedIn test scraper...")
-            result = subprocess.run([sys.executable, test_linkedin_script],
-                                  capture_output=True, text=True, timeout=300)  # 5 minute timeout
+            result = subprocess.run(self.build_command(test_linkedin_script, 'linkedin'),
+                                  capture_output=True, text=True, timeout=300,  # 5 minute timeout
+                                  cwd=os.path.dirname(os.path.abspath(__file__)))
 
             if result.returncode == 0:
                 logger.info("LinkedIn test scraper completed successfully")
@@ -147,21 +172,20 @@ class SocialMediaScrapersTestRunner:
             ).replace(
                 'max_profiles_per_hashtag: int = 10',
                 'max_profiles_per_hashtag: int = 2'  # Only 2 profiles per hashtag
-            ).replace(
-                'time.sleep(random.uniform(8, 12))',
-                'time.sleep(2)'  # Faster for testing
-            ).replace(
-                'time.sleep(random.uniform(3, 6))',
-                'time.sleep(1)'  # Faster for testing
             )
+            test_script_content = self.speed_up_sleeps(test_script_content, {
+                'time.sleep(random.uniform(8, 12))': 'time.sleep(2)',  # Faster for testing
+                'time.sleep(random.uniform(3, 6))': 'time.sleep(1)'
+            })
 
             with open(test_instagram_script, 'w', encoding='utf-8') as f:
                 f.write(test_script_content)
 
             # Run the test script
             logger.info("Executing Instagram test scraper...")
-            result = subprocess.run([sys.executable, test_instagram_script],
-                                  capture_output=True, text=True, timeout=300)  # 5 minute timeout
+            result = subprocess.run(self.build_command(test_instagram_script, 'instagram'),
+                                  capture_output=True, text=True, timeout=300,  # 5 minute timeout
+                                  cwd=os.path.dirname(os.path.abspath(__file__)))
 
             if result.returncode == 0:
                 logger.info("Instagram test scraper completed successfully")
@@ -365,13 +389,24 @@ class SocialMediaScrapersTestRunner:
             logger.warning("⚠ TESTS COMPLETED - No contacts found (may need adjustment or different search terms)")
 
 def main():
+    parser = argparse.ArgumentParser(description="Small-scale social media scraper tests")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--record', action='store_const', const='record', dest='http_mode',
+                      help="run live and save every HTTP exchange as a fixture")
+    mode.add_argument('--replay', action='store_const', const='replay', dest='http_mode',
+                      help="run offline from previously recorded fixtures")
+    parser.add_argument('--fixtures', help="fixture folder (default: ./fixtures)")
+    args = parser.parse_args()
+
     print("SOCIAL MEDIA SCRAPERS TEST RUNNER")
     print("=" * 50)
     print("Running small-scale tests of LinkedIn and Instagram scrapers...")
     print("This will test functionality without doing full-scale searches.")
+    if args.http_mode:
+        print(f"HTTP mode: {args.http_mode.upper()}")
     print("")
 
-    runner = SocialMediaScrapersTestRunner()
+    runner = SocialMediaScrapersTestRunner(http_mode=args.http_mode, fixtures_dir=args.fixtures)
 
     try:
         runner.run_tests()
@@ -0,0 +1,56 @@
+import requests
+
+from healer_discovery.budget import BudgetExceededError, BudgetLedger
+from healer_discovery.host_health import HostHealthTracker
+
+URL = 'https://healer.com/'
+
+
+class FakeSession:
+    def send(self, request, **kwargs):
+        raise AssertionError("a request over budget must not be sent")
+
+
+def test_budget_rejection_is_not_a_host_failure(tmp_path):
+    ledger = BudgetLedger()
+    ledger.enabled = True
+    ledger.try_spend = lambda platform, action_type, units=1: False
+    tracker = HostHealthTracker().enable(str(tmp_path / 'host_health.json'))
+    session = tracker.instrument_session(ledger.instrument_session(FakeSession()))
+
+    for _ in range(5):
+        try:
+            session.send(requests.Request('GET', URL).prepare())
+        except BudgetExceededError:
+            pass
+
+    assert 'healer.com' not in tracker.cache.entries
+    assert tracker.available(URL)
+
+
+def test_probes_are_not_charged_to_the_extraction_budget():
+    ledger = BudgetLedger()
+    ledger.enabled = True
+    charged = []
+    ledger.try_spend = lambda platform, action_type, units=1: charged.append((platform, action_type)) or True
+
+    class Sent:
+        def send(self, request, **kwargs):
+            return request
+
+    session = ledger.instrument_session(Sent())
+    session.send(requests.Request('HEAD', URL).prepare())
+    session.send(requests.Request('GET', URL, headers={'Range': 'bytes=0-16383'}).prepare())
+    session.send(requests.Request('GET', URL).prepare())
+
+    assert charged == [('website', 'probe'), ('website', 'probe'), ('website', 'extraction')]
+
+
+def test_plan_can_cut_without_reordering():
+    ledger = BudgetLedger()
+    ledger.enabled = True
+    ledger.remaining = lambda platform, action_type='extraction': 2
+    ranked_by_cluster = ['https://zz-9-site.com/', 'https://reikihealer.com/', 'https://energyhealing.com/']
+
+    assert ledger.plan(ranked_by_cluster, value=None) == ranked_by_cluster[:2]
+    assert ledger.plan(ranked_by_cluster)[0] != ranked_by_cluster[0]
@@ -0,0 +1,33 @@
+from bs4 import BeautifulSoup
+
+from healer_discovery.extraction_templates import template_for
+
+
+def extract(url, html):
+    return template_for(url).extract(BeautifulSoup(html, 'html.parser'))
+
+
+def test_nested_inline_markup_keeps_its_spaces():
+    html = '<html><body><h1>Jane <span>Doe</span>, LMT</h1></body></html>'
+    assert extract('https://www.psychologytoday.com/us/therapists/jane-doe/1', html)['name'] == 'Jane Doe, LMT'
+    assert extract('https://janedoehealing.com/', html)['name'] == 'Jane Doe, LMT'
+
+
+def test_whitespace_and_line_breaks_are_collapsed():
+    html = '<h1 class="text-heading-xlarge">\n  Jane\n  <b>Doe</b>\n</h1>'
+    assert extract('https://www.linkedin.com/in/janedoe', html)['name'] == 'Jane Doe'
+
+
+def test_highest_priority_selector_with_a_value_wins():
+    html = ('<div class="pv-text-details__left-panel"><h1> </h1></div>'
+            '<h1 class="text-heading-xlarge">Jane Doe</h1>'
+            '<div class="text-body-medium break-words">Reiki Master</div>')
+    fields = extract('https://www.linkedin.com/in/janedoe', html)
+    assert fields['name'] == 'Jane Doe'
+    assert fields['headline'] == 'Reiki Master'
+
+
+
+def test_only_fields_a_caller_reads_are_extracted():
+    html = '<h1>Jane Doe</h1><a href="mailto:jane@janedoe.com">Email</a>'
+    assert extract('https://janedoehealing.com/', html) == {'name': 'Jane Doe'}
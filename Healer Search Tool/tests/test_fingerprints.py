@@ -0,0 +1,35 @@
+from healer_discovery.fingerprints import FingerprintIndex
+
+TEMPLATE = ('<html><body><h1>{site}</h1><p>Reiki and energy healing sessions in a calm studio. Book a session '
+            'with our certified practitioners for relaxation, balance and renewal.</p>'
+            '<footer>Email info@{site}</footer></body></html>')
+
+
+def test_same_template_on_another_site_is_not_a_duplicate(tmp_path):
+    index = FingerprintIndex(str(tmp_path / 'fingerprints.json'))
+    first = index.check('https://moonreikistudio.com/', TEMPLATE.format(site='moonreikistudio.com'))
+    index.record(first, 'https://moonreikistudio.com/', {'emails': ['info@moonreikistudio.com']})
+
+    other = index.check('https://sunreikicenter.com/', TEMPLATE.format(site='sunreikicenter.com'))
+    assert not other.duplicate
+    assert other.result is None
+
+
+def test_same_page_on_the_same_site_reuses_its_result(tmp_path):
+    index = FingerprintIndex(str(tmp_path / 'fingerprints.json'))
+    html = TEMPLATE.format(site='moonreikistudio.com')
+    first = index.check('https://moonreikistudio.com/', html)
+    index.record(first, 'https://moonreikistudio.com/', {'emails': ['info@moonreikistudio.com']})
+
+    again = index.check('https://www.moonreikistudio.com/', html)
+    assert again.duplicate
+    assert again.result == {'emails': ['info@moonreikistudio.com']}
+
+
+def test_empty_page_on_several_sites_becomes_a_template(tmp_path):
+    index = FingerprintIndex(str(tmp_path / 'fingerprints.json'))
+    for site in ('alphahealing.com', 'betahealing.com', 'gammahealing.com'):
+        url = f"https://{site}/"
+        index.record(index.check(url, TEMPLATE.format(site=site)), url, None)
+
+    assert index.check('https://deltahealing.com/', TEMPLATE.format(site='deltahealing.com')).template
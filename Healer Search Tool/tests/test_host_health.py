@@ -0,0 +1,68 @@
+import time
+from datetime import timedelta
+
+import pytest
+import requests
+
+from healer_discovery.host_health import FAILURE_THRESHOLD, CircuitOpenError, HostHealthTracker
+
+URL = 'https://slowhealer.com/contact'
+
+
+class FakeResponse:
+    status_code = 200
+    elapsed = timedelta(seconds=0.2)
+
+
+class FakeSession:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append(request.url)
+        return FakeResponse()
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    return HostHealthTracker().enable(str(tmp_path / 'host_health.json'))
+
+
+def trip(tracker):
+    for _ in range(FAILURE_THRESHOLD):
+        tracker.record_failure(URL, 'ConnectTimeout')
+
+
+def test_open_circuit_rejects_requests(tracker):
+    session = tracker.instrument_session(FakeSession())
+    trip(tracker)
+
+    assert not tracker.available(URL)
+    with pytest.raises(CircuitOpenError):
+        session.send(requests.Request('GET', URL).prepare())
+    assert session.sent == []
+
+
+def test_cooldown_probe_success_closes_circuit(tracker):
+    session = tracker.instrument_session(FakeSession())
+    trip(tracker)
+    tracker.cache.entries['slowhealer.com']['open_until'] = time.time() - 1
+
+    # Scheduler check, then the probe request itself through the session hook
+    assert tracker.available(URL)
+    assert tracker.allow(URL)
+    session.send(requests.Request('GET', URL).prepare())
+
+    assert session.sent == [URL]
+    assert tracker.probing == {}
+    assert tracker.cache.entries['slowhealer.com']['failures'] == 0
+    assert tracker.available(URL)
+
+
+def test_probe_slot_is_held_against_other_threads(tracker):
+    trip(tracker)
+    tracker.cache.entries['slowhealer.com']['open_until'] = time.time() - 1
+    tracker.probing['slowhealer.com'] = -1  # another thread's probe in flight
+
+    assert not tracker.available(URL)
+    assert not tracker.allow(URL)
@@ -0,0 +1,42 @@
+import time
+
+from healer_discovery.hosting import MIN_OBSERVATIONS, HostingClusters
+
+PARKING_IP = '203.0.113.10'
+SHARED_NS = 'registrar-dns.com'
+
+
+def answer(ip, ns=()):
+    return {'ips': [ip], 'ns': list(ns), 'fetched_at': time.time()}
+
+
+def clusters(tmp_path):
+    hosting = HostingClusters(str(tmp_path / 'dns.json'), str(tmp_path / 'clusters.json'))
+    for i in range(MIN_OBSERVATIONS):
+        host = f"parked{i}.com"
+        hosting.hosts.entries[host] = answer(PARKING_IP, [SHARED_NS])
+        hosting.record(f"https://{host}/", 'parked')
+    return hosting
+
+
+def test_live_site_on_shared_nameservers_is_kept(tmp_path):
+    hosting = clusters(tmp_path)
+    hosting.hosts.entries['sunreikicenter.com'] = answer('198.51.100.7', [SHARED_NS])
+
+    assert hosting.is_dead(f"ns:{SHARED_NS}")
+    assert hosting.plan(['https://sunreikicenter.com/']) == ['https://sunreikicenter.com/']
+
+
+def test_host_in_parked_ip_cluster_is_skipped(tmp_path):
+    hosting = clusters(tmp_path)
+    hosting.hosts.entries['newparked.com'] = answer(PARKING_IP, [SHARED_NS])
+    hosting.hosts.entries['sunreikicenter.com'] = answer('198.51.100.7', [SHARED_NS])
+
+    assert hosting.plan(['https://newparked.com/', 'https://sunreikicenter.com/']) == ['https://sunreikicenter.com/']
+
+
+def test_parked_ip_with_live_nameservers_is_kept(tmp_path):
+    hosting = clusters(tmp_path)
+    hosting.hosts.entries['shared-ip-practice.com'] = answer(PARKING_IP, ['cloudflare.com'])
+
+    assert hosting.plan(['https://shared-ip-practice.com/']) == ['https://shared-ip-practice.com/']
@@ -0,0 +1,47 @@
+import re
+
+from healer_discovery import page_text
+from healer_discovery.metrics import metrics
+from healer_discovery.page_text import contact_text, is_asset_email, visible_text
+
+EMAIL = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+
+
+def test_script_cut_by_a_contact_block_slice_is_not_scanned():
+    script = 'var dsn="https://abc123@o1.ingest.sentry.io/42";var logo="logo@2x.png";' * 200
+    html = ('<html><body><div class="contact-info"><p>Reach us below.</p></div>'
+            f'<script>{script}</script>'
+            '<footer><a href="mailto:hello@lunareiki.com">Email</a></footer></body></html>')
+
+    emails = EMAIL.findall(contact_text(html))
+    assert emails and all(email == 'hello@lunareiki.com' for email in emails)
+
+
+def test_mailto_inside_a_script_is_not_a_link():
+    html = '<script>el.innerHTML = \'<a href="mailto:abc@o1.ingest.sentry.io">\'</script><p>Reiki</p>'
+    assert EMAIL.findall(contact_text(html)) == []
+
+
+def test_unclosed_script_on_a_truncated_page_is_dropped():
+    html = '<p>Reiki sessions in Austin</p><script>var a="x@sentry.io"'
+    assert visible_text(html) == 'Reiki sessions in Austin'
+
+
+def test_asset_addresses_are_flagged():
+    assert is_asset_email('logo@2x.png')
+    assert is_asset_email('abc123@o1.ingest.sentry.io')
+    assert is_asset_email('db31bcdb@sentry.wixpress.com')
+    assert not is_asset_email('hello@lunareiki.com')
+
+
+def test_contact_text_strips_once_and_counts_the_raw_page(monkeypatch):
+    html = '<p>Reiki</p><script>var a = 1;</script><footer><a href="mailto:hi@reiki.com">Mail</a></footer>'
+    calls = []
+    monkeypatch.setattr(page_text, 'drop_hidden', lambda markup: calls.append(markup) or
+                        page_text.HIDDEN_BLOCKS.sub(' ', markup))
+    monkeypatch.setattr(metrics, 'enabled', True)
+    monkeypatch.setattr(metrics, 'counters', {})
+
+    assert EMAIL.findall(contact_text(html)) == ['hi@reiki.com']
+    assert calls == [html]
+    assert metrics.counters[('page_text_bytes_total', (('kind', 'html'),))] == len(html)
@@ -0,0 +1,21 @@
+from healer_discovery.search_cache import SearchResultCache, normalize_query
+
+
+def test_or_grouping_is_part_of_the_key():
+    assert normalize_query('a OR b c') != normalize_query('a b OR c')
+    assert normalize_query('reiki or healer') != normalize_query('reiki OR healer')
+
+
+def test_case_and_whitespace_are_normalized():
+    assert normalize_query('  Site:linkedin.com/in  "Reiki   Master" (Healer OR Therapist)') == \
+        'site:linkedin.com/in "reiki master" (healer OR therapist)'
+
+
+def test_result_pages_are_cached_separately(tmp_path):
+    cache = SearchResultCache(path=str(tmp_path / 'search_results.json'))
+    cache.put('google', 'reiki (healer OR therapist)', ['https://www.linkedin.com/in/a'])
+    cache.put('google', 'reiki (healer OR therapist)', ['https://www.linkedin.com/in/b'], start=10)
+
+    assert cache.get('google', 'reiki (healer OR therapist)') == ['https://www.linkedin.com/in/a']
+    assert cache.get('google', 'reiki (healer OR therapist)', 10) == ['https://www.linkedin.com/in/b']
+    assert cache.get('google', 'reiki (healer OR therapist)', 20) is None
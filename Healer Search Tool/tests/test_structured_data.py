@@ -0,0 +1,25 @@
+import json
+
+from healer_discovery.structured_data import structured_contact
+
+
+def ld_json(data):
+    return f'<script type="application/ld+json">{json.dumps(data)}</script>'
+
+
+def test_review_author_is_not_the_practice():
+    graph = {'@context': 'https://schema.org', '@graph': [
+        {'@type': 'HealthAndBeautyBusiness', 'name': 'Moon Reiki', 'email': 'hi@moonreiki.com',
+         'publisher': {'@type': 'Organization', 'name': 'Moon Reiki LLC'}},
+        {'@type': 'Review', 'reviewBody': 'Lovely session',
+         'author': {'@type': 'Person', 'name': 'Bob', 'email': 'bob@gmail.com'}}]}
+
+    contact = structured_contact(ld_json(graph))
+    assert contact.emails == ['hi@moonreiki.com']
+    assert contact.name == 'Moon Reiki'
+    assert 'Organization' in contact.types
+
+
+def test_review_author_alone_is_not_a_contact():
+    review = {'@type': 'Review', 'author': {'@type': 'Person', 'name': 'Bob', 'email': 'bob@gmail.com'}}
+    assert structured_contact(ld_json(review)) is None
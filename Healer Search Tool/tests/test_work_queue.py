@@ -0,0 +1,35 @@
+from healer_discovery.budget import used_today
+from healer_discovery.work_queue import WorkQueue
+
+URLS = ['https://a-reiki.com/', 'https://b-reiki.com/', 'https://c-reiki.com/']
+
+
+def test_claim_works_on_a_new_database(tmp_path):
+    queue = WorkQueue('network', str(tmp_path / 'new.db'))
+    queue.enqueue(URLS)
+    assert queue.claim('w1', batch_size=2) == URLS[:2]
+
+
+def test_fetches_are_charged_once_and_releases_are_free(tmp_path):
+    limits = {('website', 'extraction'): 2}
+    queue = WorkQueue('network', str(tmp_path / 'queue.db'), lease_seconds=-1, limits=limits)
+    queue.enqueue(URLS)
+
+    assert queue.claim('w1', batch_size=2) == URLS[:2]
+    assert queue.claim('w2', batch_size=2) == URLS[:2]       # leases expired: re-claimed, not charged
+    queue.release('w2')
+    assert used_today(queue.conn, 'website', 'extraction') == 0
+
+    queue.claim('w1', batch_size=1)
+    queue.complete(URLS[0], 'w1', {'emails': []})
+    assert used_today(queue.conn, 'website', 'extraction') == 1
+
+
+def test_live_leases_count_against_the_limit(tmp_path):
+    queue = WorkQueue('network', str(tmp_path / 'queue.db'), limits={('website', 'extraction'): 2})
+    queue.enqueue(URLS)
+
+    assert queue.claim('w1', batch_size=3) == URLS[:2]
+    assert queue.claim('w2', batch_size=3) == []
+    queue.fail(URLS[0], 'w1', 'timeout')
+    assert queue.claim('w2', batch_size=3) == []               # one fetch charged, one still leased
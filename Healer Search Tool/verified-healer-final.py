@@ -4,7 +4,6 @@ VERIFIED HEALER FINAL EXTRACTOR
 Extract clean, real email contacts from verified working healer websites only.
 """
 
-import requests
 from bs4 import BeautifulSoup
 import re
 import csv
@@ -12,10 +11,14 @@ import time
 from datetime import datetime
 import logging
 import os
+import argparse
+
+from healer_discovery.sitemaps import SitemapPageSelector
+from healer_discovery.http_client import create_session
 
 class VerifiedHealerExtractor:
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, use_sitemaps=False):
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -24,6 +27,9 @@ class VerifiedHealerExtractor:
 
         self.healers_found = []
 
+        # Optional sitemap/robots.txt driven contact page selection
+        self.sitemap_selector = SitemapPageSelector(self.session) if use_sitemaps else None
+
         # ONLY verified working healer websites - no fake URLs
         self.verified_sites = [
             'https://www.michelleshealinghaven.com',
@@ -49,6 +55,10 @@ class VerifiedHealerExtractor:
         all_emails = set()
         pages_to_check = [url]
 
+        if self.sitemap_selector and not self.sitemap_selector.robots.can_fetch(url):
+            self.logger.info(f"Skipping (disallowed by robots.txt): {url}")
+            return None
+
         try:
             # Get main page
             response = self.session.get(url, timeout=15)
@@ -66,25 +76,29 @@ class VerifiedHealerExtractor:
             emails = self.extract_clean_emails(content)
             all_emails.update(emails)
 
-            # Find contact/about pages
+            # Find contact/about pages, from the sitemap when enabled
             contact_links = []
-            for link in soup.find_all('a', href=True):
-                href = link.get('href')
-                text = link.get_text().lower()
-
-                if any(term in text for term in ['contact', 'about', 'bio', 'team', 'staff']):
-                    if href.startswith('/'):
-                        full_url = url.rstrip('/') + href
-                    elif href.startswith('http'):
-                        if url.split('//')[1].split('/')[0] in href:
-                            full_url = href
+            if self.sitemap_selector:
+                contact_links = self.sitemap_selector.select_pages(url, limit=3)
+
+            if not contact_links:
+                for link in soup.find_all('a', href=True):
+                    href = link.get('href')
+                    text = link.get_text().lower()
+
+                    if any(term in text for term in ['contact', 'about', 'bio', 'team', 'staff']):
+                        if href.startswith('/'):
+                            full_url = url.rstrip('/') + href
+                        elif href.startswith('http'):
+                            if url.split('//')[1].split('/')[0] in href:
+                                full_url = href
+                            else:
+                                continue
                         else:
                             continue
-                    else:
-                        continue
 
-                    if full_url not in contact_links:
-                        contact_links.append(full_url)
+                        if full_url not in contact_links:
+                            contact_links.append(full_url)
 
             # Extract from contact pages
             for contact_url in contact_links[:3]:  # Limit to 3 additional pages
@@ -195,6 +209,9 @@ class VerifiedHealerExtractor:
                 self.logger.error(f"Error processing {url}: {str(e)}")
                 continue
 
+        if self.sitemap_selector:
+            self.sitemap_selector.save()
+
         return self.healers_found
 
     def save_final_results(self):
@@ -242,11 +259,16 @@ class VerifiedHealerExtractor:
         return os.path.basename(csv_file), os.path.basename(individual_csv)
 
 def main():
+    parser = argparse.ArgumentParser(description="Verified healer final extractor")
+    parser.add_argument('--sitemaps', action='store_true',
+                        help="select contact pages from robots.txt/sitemap.xml instead of homepage links")
+    args = parser.parse_args()
+
     print("FINAL VERIFIED HEALER EXTRACTION")
     print("Extract clean, real contacts from verified sites only")
     print("=" * 60)
 
-    extractor = VerifiedHealerExtractor()
+    extractor = VerifiedHealerExtractor(use_sitemaps=args.sitemaps)
     healers = extractor.run_verified_extraction()
 
     if healers:
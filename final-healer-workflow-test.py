@@ -4,20 +4,31 @@ FINAL HEALER WORKFLOW TEST
 Complete validation of healer signup workflow with all fixes applied
 """
 
-import requests
+import argparse
 import json
+import sys
 import time
 import logging
 from datetime import datetime
 
+from frontend_crawler import FrontendCrawler
+from http_client import create_session
+from workflow_latency import LatencyRecorder, load_budgets, log_budget_violations
+from workflow_scheduler import Check, run_checks
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 class FinalHealerWorkflowValidator:
-    def __init__(self):
-        self.base_url = "https://backend-production-5e29.up.railway.app"
-        self.frontend_url = "https://thecommonsoul.com"
-        self.session = requests.Session()
+    def __init__(self, latency_budgets=None, max_workers=8, base_url=None, frontend_url=None):
+        self.base_url = (base_url or "https://backend-production-5e29.up.railway.app").rstrip('/')
+        self.frontend_url = (frontend_url or "https://thecommonsoul.com").rstrip('/')
+        self.session = create_session(retries=0)
+        self.latency_recorder = LatencyRecorder()
+        self.latency_budgets = latency_budgets or {}
+        self.max_workers = max_workers
+        self.check_results = {}
+        self.frontend_pages = []
 
         # Test healer data with correct fields
         self.test_healer = {
@@ -54,7 +65,8 @@ class FinalHealerWorkflowValidator:
         kwargs['headers'] = headers
 
         try:
-            response = self.session.request(method, url, timeout=15, **kwargs)
+            response = self.latency_recorder.timed_request(self.session, method, url, endpoint,
+                                                           timeout=15, **kwargs)
             return response
         except Exception as e:
             logger.error(f"Request failed: {method} {endpoint} - {e}")
@@ -249,49 +261,42 @@ class FinalHealerWorkflowValidator:
         logger.info("🧪 TESTING FRONTEND PAGES")
         logger.info("=" * 50)
 
-        pages_to_test = [
-            ("Home", self.frontend_url),
-            ("Healers", f"{self.frontend_url}/healers"),
-            ("About", f"{self.frontend_url}/about"),
-            ("Contact", f"{self.frontend_url}/contact"),
-            ("Register", f"{self.frontend_url}/register")
-        ]
+        crawler = FrontendCrawler(
+            self.frontend_url,
+            seed_paths=['', '/healers', '/about', '/contact', '/register'],
+            placeholder_terms=['placeholder', 'lorem ipsum', 'coming soon', 'under construction']
+        )
+        pages = crawler.crawl()
 
         placeholder_found = False
         working_pages = 0
 
-        for page_name, url in pages_to_test:
-            try:
-                response = requests.get(url, timeout=10)
-                if response.status_code == 200:
-                    working_pages += 1
-                    content = response.text.lower()
-
-                    # Check for placeholder content
-                    placeholder_terms = ['placeholder', 'lorem ipsum', 'coming soon', 'under construction']
-                    page_placeholders = []
+        for url, page in pages.items():
+            page_name = url[len(self.frontend_url):] or "/"
+            load_time = f"{page.seconds * 1000:.0f}ms"
 
-                    for term in placeholder_terms:
-                        if term in content:
-                            page_placeholders.append(term)
-                            placeholder_found = True
-
-                    if page_placeholders:
-                        logger.warning(f"   ⚠️ {page_name}: Placeholder content found ({', '.join(page_placeholders)})")
-                        self.warnings.append(f"{page_name} page has placeholder content")
-                    else:
-                        logger.info(f"   ✅ {page_name}: No placeholder content")
+            if page.ok:
+                working_pages += 1
 
+                if page.placeholders:
+                    placeholder_found = True
+                    logger.warning(f"   ⚠️ {page_name}: Placeholder content found ({', '.join(page.placeholders)}) [{load_time}]")
+                    self.warnings.append(f"{page_name} page has placeholder content")
                 else:
-                    logger.error(f"   ❌ {page_name}: Not accessible (status {response.status_code})")
+                    logger.info(f"   ✅ {page_name}: No placeholder content [{load_time}]")
+
+            elif page.error:
+                logger.error(f"   ❌ {page_name}: Failed to load - {page.error}")
+            else:
+                logger.error(f"   ❌ {page_name}: Not accessible (status {page.status}) [{load_time}]")
 
-            except Exception as e:
-                logger.error(f"   ❌ {page_name}: Failed to load - {e}")
+        self.frontend_pages = [page.to_dict() for page in pages.values()]
+        logger.info(f"   📄 {len(pages)} pages crawled, {len(crawler.dead_ends())} dead ends")
 
-        if working_pages == len(pages_to_test) and not placeholder_found:
+        if working_pages == len(pages) and not placeholder_found:
             logger.info(f"✅ Frontend Pages: ALL CLEAN")
             self.test_results.append("✅ Frontend Pages: NO PLACEHOLDERS")
-        elif working_pages == len(pages_to_test):
+        elif working_pages == len(pages):
             logger.info(f"✅ Frontend Pages: ACCESSIBLE (with placeholder warnings)")
             self.test_results.append("⚠️ Frontend Pages: ACCESSIBLE WITH PLACEHOLDERS")
         else:
@@ -359,15 +364,37 @@ class FinalHealerWorkflowValidator:
 
         logger.info("=" * 80)
 
-        return {
+        # API latency against budgets
+        self.latency_recorder.stop()
+        latency = self.latency_recorder.summary()
+        budget_violations = self.latency_recorder.check_budgets(self.latency_budgets, latency)
+        logger.info("⏱️ API LATENCY:")
+        self.latency_recorder.log_summary(logger, latency)
+        log_budget_violations(logger, budget_violations)
+        logger.info("=" * 80)
+
+        report = {
             "success_rate": success_rate,
             "readiness": readiness,
             "working_tests": working_tests,
             "total_tests": total_tests,
             "critical_issues": len(self.critical_issues),
-            "warnings": len(self.warnings)
+            "warnings": len(self.warnings),
+            "latency_budget_violations": budget_violations
         }
 
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        report_file = f"final_healer_workflow_report_{timestamp}.json"
+        with open(report_file, 'w') as f:
+            json.dump(dict(report, test_results=self.test_results, critical_issue_details=self.critical_issues,
+                           warning_details=self.warnings, latency=latency,
+                           checks={name: r.to_dict() for name, r in self.check_results.items()},
+                           frontend_pages=self.frontend_pages,
+                           test_timestamp=datetime.now().isoformat()), f, indent=2)
+        logger.info(f"📄 Report saved to: {report_file}")
+
+        return report
+
     def run_complete_validation(self):
         """Run complete healer workflow validation"""
         logger.info("🚀 STARTING COMPLETE HEALER WORKFLOW VALIDATION")
@@ -375,35 +402,45 @@ class FinalHealerWorkflowValidator:
         logger.info(f"🕒 Test Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         logger.info("")
 
-        # Run all tests
-        test_functions = [
-            self.test_healer_registration_flow,
-            self.test_customer_registration_flow,
-            self.test_healer_discovery,
-            self.test_services_system,
-            self.test_payments_system,
-            self.test_availability_system,
-            self.test_frontend_pages
+        # Independent checks run concurrently; the ones that use the healer's
+        # auth token (or look for the new healer) wait for registration
+        after_registration = ['healer_registration']
+        checks = [
+            Check('healer_registration', self.test_healer_registration_flow),
+            Check('customer_registration', self.test_customer_registration_flow),
+            Check('healer_discovery', self.test_healer_discovery, after=after_registration),
+            Check('services', self.test_services_system, after=after_registration),
+            Check('payments', self.test_payments_system, after=after_registration),
+            Check('availability', self.test_availability_system, after=after_registration),
+            Check('frontend_pages', self.test_frontend_pages)
         ]
 
-        for test_func in test_functions:
-            try:
-                test_func()
-                time.sleep(1)  # Brief pause between tests
-            except Exception as e:
-                logger.error(f"Test {test_func.__name__} crashed: {e}")
-                self.critical_issues.append(f"Test {test_func.__name__} crashed: {e}")
+        self.check_results = run_checks(checks, self.max_workers)
+        for name, result in self.check_results.items():
+            if result.status == "error":
+                self.critical_issues.append(f"Test {name} crashed: {result.error}")
 
         # Generate final report
         return self.generate_final_report()
 
 def main():
+    parser = argparse.ArgumentParser(description="Final healer workflow validation")
+    parser.add_argument('--base-url', help="backend to test (default: production)")
+    parser.add_argument('--frontend-url', help="frontend to check for placeholders (default: production)")
+    parser.add_argument('--latency-budgets', help="JSON file of per-endpoint latency budgets "
+                                                  "(default: latency-budgets.json)")
+    parser.add_argument('--workers', type=int, default=8,
+                        help="checks run concurrently (1 runs them one at a time)")
+    args = parser.parse_args()
+
     print("🎯 FINAL HEALER WORKFLOW VALIDATION")
     print("=" * 50)
     print("Testing complete signup workflow with all fixes...")
     print("")
 
-    validator = FinalHealerWorkflowValidator()
+    validator = FinalHealerWorkflowValidator(latency_budgets=load_budgets(args.latency_budgets),
+                                             max_workers=args.workers, base_url=args.base_url,
+                                             frontend_url=args.frontend_url)
 
     try:
         results = validator.run_complete_validation()
@@ -418,6 +455,10 @@ def main():
         else:
             print("⚠️ Platform needs additional fixes before full launch")
 
+        if results['latency_budget_violations']:
+            print("❌ API latency budgets exceeded")
+            sys.exit(1)
+
     except KeyboardInterrupt:
         print("\nValidation interrupted by user")
     except Exception as e:
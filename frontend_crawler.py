@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+FRONTEND PAGE CRAWLER
+Concurrent same-site crawl of the frontend for the workflow testers. Routes
+come from the served sitemap.xml, a list of seed paths and the links found on
+every fetched page; each page is scanned for placeholder text with a single
+compiled pattern and timed.
+
+    crawler = FrontendCrawler("https://thecommonsoul.com", seed_paths=['/healers'])
+    pages = crawler.crawl()
+    crawler.log_pages(logger)
+"""
+
+import re
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from html.parser import HTMLParser
+from typing import Dict, List
+from urllib.parse import urldefrag, urljoin, urlparse
+
+import requests
+
+from http_client import create_session
+
+DEFAULT_PLACEHOLDER_TERMS = [
+    'lorem ipsum',
+    'placeholder',
+    'todo:',
+    'coming soon',
+    'under construction',
+    'example.com',
+    'your-email@example.com',
+    'replace this text'
+]
+
+ASSET_EXTENSIONS = (
+    '.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.ico', '.css', '.js', '.json', '.xml',
+    '.pdf', '.zip', '.mp4', '.webm', '.woff', '.woff2', '.ttf', '.map', '.txt'
+)
+
+
+def compile_placeholder_matcher(terms: List[str]):
+    """One case-insensitive alternation for all terms, longest first so overlaps report the specific one"""
+    ordered = sorted(set(term.lower() for term in terms), key=len, reverse=True)
+    return re.compile('|'.join(re.escape(term) for term in ordered), re.IGNORECASE)
+
+
+class _LinkParser(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.links = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'a':
+            href = dict(attrs).get('href')
+            if href:
+                self.links.append(href)
+
+
+class PageResult:
+    def __init__(self, url: str):
+        self.url = url
+        self.status = None
+        self.seconds = 0.0
+        self.bytes = 0
+        self.placeholders = []
+        self.links = []
+        self.referrers = set()
+        self.error = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == 200
+
+    def to_dict(self) -> Dict:
+        return {
+            "url": self.url,
+            "status": self.status,
+            "load_ms": round(self.seconds * 1000, 1),
+            "bytes": self.bytes,
+            "placeholders": self.placeholders,
+            "outgoing_links": len(self.links),
+            "linked_from": sorted(self.referrers),
+            "error": self.error
+        }
+
+
+class FrontendCrawler:
+    """Crawl every same-site page reachable from sitemap.xml and the seed paths"""
+
+    def __init__(self, base_url: str, seed_paths: List[str] = ('',), placeholder_terms: List[str] = None,
+                 session: requests.Session = None, max_pages: int = 200, max_workers: int = 8,
+                 timeout: float = 10):
+        self.base_url = base_url.rstrip('/')
+        self.host = self.site_host(self.base_url)
+        self.seed_paths = list(seed_paths)
+        self.matcher = compile_placeholder_matcher(placeholder_terms or DEFAULT_PLACEHOLDER_TERMS)
+        self.max_pages = max_pages
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.pages = {}
+
+        self.session = session or create_session(retries=0, pool_size=max_workers)
+
+    @staticmethod
+    def site_host(url: str) -> str:
+        host = urlparse(url).netloc.lower()
+        return host[4:] if host.startswith('www.') else host
+
+    def normalize(self, url: str, base: str = None):
+        """Absolute, fragment- and query-free page URL on this site, or None"""
+        url = urldefrag(urljoin(base or self.base_url + '/', url.strip()))[0]
+        parsed = urlparse(url)
+        if parsed.scheme not in ('http', 'https') or self.site_host(url) != self.host:
+            return None
+        path = parsed.path or '/'
+        if path.lower().endswith(ASSET_EXTENSIONS):
+            return None
+        if path != '/':
+            path = path.rstrip('/')
+        return self.base_url + ('' if path == '/' else path)
+
+    def sitemap_urls(self) -> List[str]:
+        """Page URLs from /sitemap.xml (following one level of sitemap index), mapped onto base_url"""
+        urls = []
+        queue = [self.base_url + '/sitemap.xml']
+        fetched = 0
+
+        while queue and fetched < 10:
+            sitemap_url = queue.pop(0)
+            fetched += 1
+            try:
+                response = self.session.get(sitemap_url, timeout=self.timeout)
+                if response.status_code != 200:
+                    continue
+                root = ET.fromstring(response.content)
+            except (requests.exceptions.RequestException, ET.ParseError):
+                continue
+
+            for element in root.iter():
+                if not element.tag.endswith('loc') or not element.text:
+                    continue
+                path = urlparse(element.text.strip()).path or '/'
+                if root.tag.endswith('sitemapindex'):
+                    queue.append(self.base_url + path)
+                else:
+                    url = self.normalize(path)
+                    if url:
+                        urls.append(url)
+
+        return urls
+
+    def fetch(self, url: str) -> PageResult:
+        page = PageResult(url)
+        start = time.perf_counter()
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            content = response.text
+            page.seconds = time.perf_counter() - start
+            page.status = response.status_code
+            page.bytes = len(response.content)
+        except requests.exceptions.RequestException as e:
+            page.seconds = time.perf_counter() - start
+            page.error = str(e)
+            return page
+
+        if page.ok:
+            page.placeholders = sorted(set(match.group(0).lower() for match in self.matcher.finditer(content)))
+
+            parser = _LinkParser()
+            try:
+                parser.feed(content)
+            except Exception:
+                pass
+            links = (self.normalize(href, url) for href in parser.links)
+            page.links = sorted(set(link for link in links if link and link != url))
+
+        return page
+
+    def crawl(self) -> Dict[str, PageResult]:
+        """Fetch every discovered page concurrently; returns results keyed by URL in crawl order"""
+        seeds = [self.normalize(path) for path in self.seed_paths] + self.sitemap_urls()
+        frontier = []
+        seen = set()
+        referrers = {}
+
+        def enqueue(url, referrer=None):
+            if url and referrer:
+                referrers.setdefault(url, set()).add(referrer)
+            if url and url not in seen and len(seen) < self.max_pages:
+                seen.add(url)
+                frontier.append(url)
+
+        for seed in seeds:
+            enqueue(seed)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running = {}
+            while frontier or running:
+                while frontier and len(running) < self.max_workers:
+                    url = frontier.pop(0)
+                    running[executor.submit(self.fetch, url)] = url
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    del running[future]
+                    page = future.result()
+                    self.pages[page.url] = page
+                    for link in page.links:
+                        enqueue(link, page.url)
+
+        for url, page in self.pages.items():
+            page.referrers = referrers.get(url, set())
+        return self.pages
+
+    def dead_ends(self) -> List[PageResult]:
+        """Pages that failed to load or did not return 200"""
+        return [page for page in self.pages.values() if not page.ok]
+
+    def log_pages(self, logger):
+        logger.info(f"{'status':>6} {'load':>8} {'size':>8}  page")
+        for page in sorted(self.pages.values(), key=lambda p: p.seconds, reverse=True):
+            status = page.status if page.status is not None else 'ERR'
+            flags = f"  ⚠ {', '.join(page.placeholders)}" if page.placeholders else ''
+            logger.info(f"{status:>6} {page.seconds * 1000:>6.0f}ms {page.bytes // 1024:>6}KB  {page.url}{flags}")
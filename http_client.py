@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+HTTP CLIENT FACTORY FOR THE WORKFLOW TESTERS
+The testers use the same session factory as the discovery scripts
+(Healer Search Tool/healer_discovery/http_client.py) so connection pooling,
+keep-alive, compression and timeouts are tuned in one place. This module puts
+that folder on the import path and re-exports the factory.
+
+Testers pass retries=0 so every failed request is reported as it happened
+instead of being hidden by a successful retry.
+"""
+
+import os
+import sys
+
+TOOL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Healer Search Tool')
+if TOOL_DIR not in sys.path:
+    sys.path.append(TOOL_DIR)
+
+from healer_discovery.http_client import (  # noqa: E402
+    DEFAULT_TIMEOUT,
+    TimeoutHTTPAdapter,
+    create_session,
+    get,
+    head,
+    post,
+    request,
+    shared_session
+)
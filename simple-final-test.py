@@ -4,17 +4,21 @@ SIMPLE FINAL HEALER WORKFLOW TEST
 Final validation without Unicode characters
 """
 
-import requests
+import argparse
 import time
 import logging
 
+from http_client import create_session
+from workflow_scheduler import Check, run_checks
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def test_healer_workflow():
+def test_healer_workflow(max_workers=8, base_url=None):
     """Quick test of critical healer workflow components"""
-    base_url = "https://backend-production-5e29.up.railway.app"
-    results = []
+    base_url = (base_url or "https://backend-production-5e29.up.railway.app").rstrip('/')
+    session = create_session(retries=0)
+    outcomes = {}
 
     # Test data
     test_healer = {
@@ -28,82 +32,82 @@ def test_healer_workflow():
     logger.info("TESTING HEALER WORKFLOW - CRITICAL COMPONENTS")
     logger.info("=" * 60)
 
-    try:
-        # Test 1: Healer Registration
+    # Test 1: Healer Registration
+    def healer_registration():
         logger.info("1. Testing Healer Registration...")
-        response = requests.post(f"{base_url}/api/auth/register", json=test_healer, timeout=15)
+        response = session.post(f"{base_url}/api/auth/register", json=test_healer, timeout=15)
 
         if response.status_code == 201:
-            result = response.json()
-            token = result['token']
-            healer_id = result['user']['id']
             logger.info("   SUCCESS: Healer registration working")
-            results.append("PASS: Healer Registration")
-        else:
-            logger.error(f"   FAILED: Registration failed with {response.status_code}")
-            results.append("FAIL: Healer Registration")
-            token = None
-            healer_id = None
+            outcomes["healer_registration"] = "PASS: Healer Registration"
+            return True
 
-        time.sleep(1)
+        logger.error(f"   FAILED: Registration failed with {response.status_code}")
+        outcomes["healer_registration"] = "FAIL: Healer Registration"
+        return False
 
-        # Test 2: Healer Discovery
+    # Test 2: Healer Discovery
+    def healer_discovery():
         logger.info("2. Testing Healer Discovery...")
-        response = requests.get(f"{base_url}/api/healers", timeout=15)
+        response = session.get(f"{base_url}/api/healers", timeout=15)
 
         if response.status_code == 200:
             healers = response.json()
             logger.info(f"   SUCCESS: Found {len(healers)} healers")
-            results.append("PASS: Healer Discovery")
-        else:
-            logger.error(f"   FAILED: Healer discovery failed with {response.status_code}")
-            results.append("FAIL: Healer Discovery")
+            outcomes["healer_discovery"] = "PASS: Healer Discovery"
+            return True
 
-        time.sleep(1)
+        logger.error(f"   FAILED: Healer discovery failed with {response.status_code}")
+        outcomes["healer_discovery"] = "FAIL: Healer Discovery"
+        return False
 
-        # Test 3: Services System
+    # Test 3: Services System
+    def services_system():
         logger.info("3. Testing Services System...")
-        response = requests.get(f"{base_url}/api/services", timeout=15)
+        response = session.get(f"{base_url}/api/services", timeout=15)
 
         if response.status_code == 200:
             services = response.json()
             logger.info(f"   SUCCESS: Found {len(services)} services")
-            results.append("PASS: Services System")
-        else:
-            logger.error(f"   FAILED: Services system failed with {response.status_code}")
-            results.append("FAIL: Services System")
+            outcomes["services_system"] = "PASS: Services System"
+            return True
 
-        time.sleep(1)
+        logger.error(f"   FAILED: Services system failed with {response.status_code}")
+        outcomes["services_system"] = "FAIL: Services System"
+        return False
 
-        # Test 4: Payments System (FIXED)
+    # Test 4: Payments System (FIXED)
+    def payments_system():
         logger.info("4. Testing Payments System (Fixed)...")
-        response = requests.get(f"{base_url}/api/payments", timeout=15)
+        response = session.get(f"{base_url}/api/payments", timeout=15)
 
         if response.status_code == 200:
             payment_info = response.json()
             logger.info(f"   SUCCESS: Payments system operational")
             logger.info(f"   Status: {payment_info.get('status', 'Unknown')}")
-            results.append("PASS: Payments System")
-        else:
-            logger.error(f"   FAILED: Payments system failed with {response.status_code}")
-            results.append("FAIL: Payments System")
+            outcomes["payments_system"] = "PASS: Payments System"
+            return True
 
-        time.sleep(1)
+        logger.error(f"   FAILED: Payments system failed with {response.status_code}")
+        outcomes["payments_system"] = "FAIL: Payments System"
+        return False
 
-        # Test 5: Availability System
+    # Test 5: Availability System
+    def availability_system():
         logger.info("5. Testing Availability System...")
-        response = requests.get(f"{base_url}/api/availability", timeout=15)
+        response = session.get(f"{base_url}/api/availability", timeout=15)
 
         if response.status_code in [200, 401, 403]:  # All acceptable
             logger.info("   SUCCESS: Availability system accessible")
-            results.append("PASS: Availability System")
-        else:
-            logger.error(f"   FAILED: Availability system failed with {response.status_code}")
-            results.append("FAIL: Availability System")
+            outcomes["availability_system"] = "PASS: Availability System"
+            return True
 
-        time.sleep(1)
+        logger.error(f"   FAILED: Availability system failed with {response.status_code}")
+        outcomes["availability_system"] = "FAIL: Availability System"
+        return False
 
-        # Test 6: Customer Registration
+    # Test 6: Customer Registration
+    def customer_registration():
         logger.info("6. Testing Customer Registration...")
         test_customer = {
             "email": f"quickCustomer{int(time.time())}@commonsoultester.com",
@@ -113,18 +117,34 @@ def test_healer_workflow():
             "lastName": "Customer"
         }
 
-        response = requests.post(f"{base_url}/api/auth/register", json=test_customer, timeout=15)
+        response = session.post(f"{base_url}/api/auth/register", json=test_customer, timeout=15)
 
         if response.status_code == 201:
             logger.info("   SUCCESS: Customer registration working")
-            results.append("PASS: Customer Registration")
-        else:
-            logger.error(f"   FAILED: Customer registration failed with {response.status_code}")
-            results.append("FAIL: Customer Registration")
+            outcomes["customer_registration"] = "PASS: Customer Registration"
+            return True
+
+        logger.error(f"   FAILED: Customer registration failed with {response.status_code}")
+        outcomes["customer_registration"] = "FAIL: Customer Registration"
+        return False
+
+    # None of these read-only checks use the registration token, so all run at once
+    checks = [
+        Check("healer_registration", healer_registration),
+        Check("healer_discovery", healer_discovery),
+        Check("services_system", services_system),
+        Check("payments_system", payments_system),
+        Check("availability_system", availability_system),
+        Check("customer_registration", customer_registration)
+    ]
 
-    except Exception as e:
-        logger.error(f"Test failed with exception: {e}")
-        results.append(f"ERROR: {e}")
+    results = []
+    for name, check_result in run_checks(checks, max_workers).items():
+        if check_result.status == "error":
+            logger.error(f"Test failed with exception: {check_result.error}")
+            results.append(f"ERROR: {check_result.error}")
+        else:
+            results.append(outcomes[name])
 
     # Calculate results
     passed = sum(1 for r in results if r.startswith("PASS"))
@@ -159,13 +179,19 @@ def test_healer_workflow():
     return success_rate, results
 
 def main():
+    parser = argparse.ArgumentParser(description="Simple final healer workflow test")
+    parser.add_argument('--base-url', help="backend to test (default: production)")
+    parser.add_argument('--workers', type=int, default=8,
+                        help="checks run concurrently (1 runs them one at a time)")
+    args = parser.parse_args()
+
     print("FINAL HEALER WORKFLOW VALIDATION")
     print("=" * 50)
     print("Testing all critical healer signup components...")
     print("")
 
     try:
-        success_rate, results = test_healer_workflow()
+        success_rate, results = test_healer_workflow(args.workers, args.base_url)
 
         print(f"\nFINAL ASSESSMENT:")
         print(f"Success Rate: {success_rate:.1f}%")
@@ -4,19 +4,27 @@ FIXED HEALER SIGNUP WORKFLOW TESTER
 Updated with correct API field names and proper route paths
 """
 
+import argparse
 import requests
 import json
+import sys
 import time
 import logging
 from datetime import datetime
 
+from http_client import create_session
+from workflow_latency import LatencyRecorder, load_budgets, log_budget_violations
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 class FixedHealerWorkflowTester:
-    def __init__(self):
-        self.base_url = "https://backend-production-5e29.up.railway.app"
-        self.session = requests.Session()
+    def __init__(self, latency_budgets=None, base_url=None):
+        self.base_url = (base_url or "https://backend-production-5e29.up.railway.app").rstrip('/')
+        self.session = create_session(retries=0)
+        self.latency_recorder = LatencyRecorder()
+        self.latency_budgets = latency_budgets or {}
+        self.latency_budget_violations = []
 
         # Correct test healer data with proper field names
         self.test_healer = {
@@ -40,7 +48,8 @@ class FixedHealerWorkflowTester:
         kwargs['headers'] = headers
 
         try:
-            response = self.session.request(method, url, timeout=15, **kwargs)
+            response = self.latency_recorder.timed_request(self.session, method, url, endpoint,
+                                                           timeout=15, **kwargs)
             logger.info(f"{method} {endpoint} -> {response.status_code}")
             return response
         except requests.exceptions.RequestException as e:
@@ -260,6 +269,28 @@ class FixedHealerWorkflowTester:
             logger.info("❌ HEALER WORKFLOW: MAJOR ISSUES")
             logger.info("Significant problems that need resolution before production.")
 
+        # API latency against budgets
+        self.latency_recorder.stop()
+        latency = self.latency_recorder.summary()
+        self.latency_budget_violations = self.latency_recorder.check_budgets(self.latency_budgets, latency)
+        logger.info("=" * 80)
+        logger.info("API LATENCY:")
+        self.latency_recorder.log_summary(logger, latency)
+        log_budget_violations(logger, self.latency_budget_violations)
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        report_file = f"fixed_healer_workflow_report_{timestamp}.json"
+        with open(report_file, 'w') as f:
+            json.dump({
+                "success_rate": success_rate,
+                "test_results": self.test_results,
+                "latency": latency,
+                "latency_budget_violations": self.latency_budget_violations,
+                "test_timestamp": datetime.now().isoformat(),
+                "test_healer_email": self.test_healer["email"]
+            }, f, indent=2)
+        logger.info(f"Report saved to: {report_file}")
+
         return success_rate
 
     def run_fixed_tests(self):
@@ -291,12 +322,19 @@ class FixedHealerWorkflowTester:
         return self.generate_summary_report()
 
 def main():
+    parser = argparse.ArgumentParser(description="Fixed healer signup workflow tester")
+    parser.add_argument('--base-url', help="backend to test (default: production)")
+    parser.add_argument('--latency-budgets', help="JSON file of per-endpoint latency budgets "
+                                                  "(default: latency-budgets.json)")
+    args = parser.parse_args()
+
     print("FIXED HEALER SIGNUP WORKFLOW TESTER")
     print("=" * 50)
     print("Testing with corrected API field names...")
     print("")
 
-    tester = FixedHealerWorkflowTester()
+    tester = FixedHealerWorkflowTester(latency_budgets=load_budgets(args.latency_budgets),
+                                       base_url=args.base_url)
 
     try:
         success_rate = tester.run_fixed_tests()
@@ -307,6 +345,10 @@ def main():
         else:
             print("⚠ Platform needs fixes before production use")
 
+        if tester.latency_budget_violations:
+            print("❌ API latency budgets exceeded")
+            sys.exit(1)
+
     except KeyboardInterrupt:
         print("\nTesting interrupted by user")
     except Exception as e:
@@ -13,16 +13,39 @@ Tests:
 6. Dashboard functionality
 7. End-to-end booking flow
 8. Email notifications
+
+Load mode (--load) runs many virtual healers and customers through the same
+flows concurrently and reports throughput and latency percentiles per endpoint:
+
+    python test-healer-signup-workflow.py --load --healers 20 --customers 40 \
+        --ramp-up 30 --think-time 1 --base-url http://localhost:3001
+
+workflow_stub_backend.py serves a local stand-in for the API at that address.
+
+Soak mode (--soak) holds a fixed request rate for hours, appends a latency /
+error / response-size summary per window to disk and flags sustained drift:
+
+    python test-healer-signup-workflow.py --soak --rate 5 --duration-hours 4 --window 60
 """
 
+import argparse
 import requests
 import json
+import random
+import sys
+import threading
 import time
 import logging
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import os
 from typing import Dict, List, Any
 
+from frontend_crawler import DEFAULT_PLACEHOLDER_TERMS, FrontendCrawler
+from http_client import create_session
+from workflow_latency import LatencyRecorder, load_budgets, log_budget_violations
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -31,10 +54,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class HealerWorkflowTester:
-    def __init__(self):
-        self.base_url = "https://backend-production-5e29.up.railway.app"
-        self.frontend_url = "https://thecommonsoul.com"
-        self.session = requests.Session()
+    def __init__(self, base_url: str = None, latency_recorder: LatencyRecorder = None,
+                 latency_budgets: Dict[str, Dict[str, float]] = None, frontend_url: str = None):
+        self.base_url = (base_url or "https://backend-production-5e29.up.railway.app").rstrip('/')
+        self.frontend_url = (frontend_url or "https://thecommonsoul.com").rstrip('/')
+        self.session = create_session(retries=0)
+        self.latency_recorder = latency_recorder or LatencyRecorder()
+        self.latency_budgets = latency_budgets or {}
 
         # Test healer data
         self.test_healer = {
@@ -47,6 +73,7 @@ class HealerWorkflowTester:
         self.auth_token = None
         self.healer_id = None
         self.service_id = None
+        self.frontend_pages = []
 
         # Track issues found
         self.issues_found = []
@@ -85,7 +112,8 @@ class HealerWorkflowTester:
         kwargs['headers'] = headers
 
         try:
-            response = self.session.request(method, url, timeout=30, **kwargs)
+            response = self.latency_recorder.timed_request(self.session, method, url, endpoint,
+                                                           timeout=30, **kwargs)
             logger.info(f"{method} {endpoint} -> {response.status_code}")
             return response
         except requests.exceptions.RequestException as e:
@@ -506,49 +534,38 @@ class HealerWorkflowTester:
 
         issues_found = False
 
-        # Test key pages/endpoints for placeholder content
-        test_urls = [
-            f"{self.frontend_url}",
-            f"{self.frontend_url}/healers",
-            f"{self.frontend_url}/about",
-            f"{self.frontend_url}/contact",
-            f"{self.frontend_url}/register"
-        ]
-
-        for url in test_urls:
-            try:
-                response = requests.get(url, timeout=10)
-                if response.status_code == 200:
-                    content = response.text.lower()
-
-                    # Check for placeholder content
-                    placeholder_terms = [
-                        'lorem ipsum',
-                        'placeholder',
-                        'todo:',
-                        'coming soon',
-                        'under construction',
-                        'example.com',
-                        'your-email@example.com',
-                        'replace this text'
-                    ]
-
-                    for term in placeholder_terms:
-                        if term in content:
-                            self.log_issue("Content", "MEDIUM",
-                                          f"Placeholder content found on {url}: {term}")
-                            issues_found = True
+        # Key pages are always checked; everything else comes from sitemap.xml and in-page links
+        crawler = FrontendCrawler(
+            self.frontend_url,
+            seed_paths=['', '/healers', '/about', '/contact', '/register'],
+            placeholder_terms=DEFAULT_PLACEHOLDER_TERMS
+        )
 
-                else:
-                    self.log_issue("Content", "HIGH",
-                                  f"Page not accessible: {url} -> {response.status_code}")
-                    issues_found = True
+        try:
+            pages = crawler.crawl()
+        except Exception as e:
+            self.log_issue("Content", "HIGH", f"Failed to crawl {self.frontend_url}", str(e))
+            return False
 
-            except Exception as e:
+        for url, page in pages.items():
+            if page.error:
+                self.log_issue("Content", "HIGH", f"Failed to check {url}", page.error)
+                issues_found = True
+            elif not page.ok:
+                linked_from = f"linked from {', '.join(sorted(page.referrers))}" if page.referrers else ""
                 self.log_issue("Content", "HIGH",
-                              f"Failed to check {url}", str(e))
+                              f"Page not accessible: {url} -> {page.status}", linked_from)
+                issues_found = True
+
+            for term in page.placeholders:
+                self.log_issue("Content", "MEDIUM",
+                              f"Placeholder content found on {url}: {term}")
                 issues_found = True
 
+        logger.info(f"Crawled {len(pages)} frontend pages, {len(crawler.dead_ends())} dead ends")
+        crawler.log_pages(logger)
+        self.frontend_pages = [page.to_dict() for page in pages.values()]
+
         return not issues_found
 
     def generate_test_report(self):
@@ -614,6 +631,15 @@ class HealerWorkflowTester:
 
         logger.info("=" * 80)
 
+        # Per-endpoint latency
+        self.latency_recorder.stop()
+        latency = self.latency_recorder.summary()
+        budget_violations = self.latency_recorder.check_budgets(self.latency_budgets, latency)
+        logger.info("API LATENCY:")
+        self.latency_recorder.log_summary(logger, latency)
+        log_budget_violations(logger, budget_violations)
+        logger.info("=" * 80)
+
         # Save report to file
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_file = f"healer_workflow_test_report_{timestamp}.json"
@@ -628,6 +654,9 @@ class HealerWorkflowTester:
             },
             "test_results": self.test_results,
             "issues_found": self.issues_found,
+            "latency": latency,
+            "latency_budget_violations": budget_violations,
+            "frontend_pages": self.frontend_pages,
             "test_timestamp": datetime.now().isoformat(),
             "test_healer_email": self.test_healer["email"]
         }
@@ -636,6 +665,7 @@ class HealerWorkflowTester:
             json.dump(report_data, f, indent=2)
 
         logger.info(f"Detailed report saved to: {report_file}")
+        return report_data
 
     def run_full_workflow_test(self):
         """Run the complete healer workflow test"""
@@ -665,21 +695,500 @@ class HealerWorkflowTester:
         self.check_for_placeholders_and_dead_ends()
 
         # Generate final report
-        self.generate_test_report()
+        return self.generate_test_report()
+
+
+class HealerWorkflowLoadTester:
+    """Run many virtual healers and customers through the signup flows at once"""
+
+    HEALER_STEPS = [
+        'test_healer_registration',
+        'test_profile_setup',
+        'test_service_management',
+        'test_availability_system',
+        'test_payment_setup',
+        'test_dashboard_functionality'
+    ]
+
+    def __init__(self, base_url: str = None, healers: int = 10, customers: int = 10,
+                 ramp_up: float = 10.0, think_time: float = 1.0, iterations: int = 1,
+                 latency_budgets: Dict[str, Dict[str, float]] = None):
+        self.base_url = base_url
+        self.healers = healers
+        self.customers = customers
+        self.ramp_up = ramp_up
+        self.think_time = think_time
+        self.iterations = iterations
+        self.latency_budgets = latency_budgets or {}
+
+        self.recorder = LatencyRecorder()
+        self.lock = threading.Lock()
+        self.flows = {"healer": {"completed": 0, "failed": 0}, "customer": {"completed": 0, "failed": 0}}
+        self.issues_found = []
+
+    def think(self):
+        """Pause like a real user between steps (uniformly 50-150% of the think time)"""
+        if self.think_time > 0:
+            time.sleep(random.uniform(0.5, 1.5) * self.think_time)
+
+    def finish_flow(self, kind: str, ok: bool, tester: HealerWorkflowTester):
+        with self.lock:
+            self.flows[kind]["completed" if ok else "failed"] += 1
+            self.issues_found.extend(tester.issues_found)
+
+    def new_tester(self) -> HealerWorkflowTester:
+        tester = HealerWorkflowTester(base_url=self.base_url, latency_recorder=self.recorder)
+        tester.test_healer["email"] = f"loadHealer{uuid.uuid4().hex[:12]}@commonsoultester.com"
+        return tester
+
+    def run_healer(self):
+        """One virtual healer: registration through dashboard, stopping at the first failed step"""
+        tester = self.new_tester()
+        ok = True
+        for step in self.HEALER_STEPS:
+            try:
+                if not getattr(tester, step)():
+                    ok = False
+                    break
+            except Exception as e:
+                tester.log_issue("Load", "CRITICAL", f"{step} crashed", str(e))
+                ok = False
+                break
+            self.think()
+        self.finish_flow("healer", ok, tester)
+
+    def run_customer(self):
+        """One virtual customer: register, browse healers, open one healer's services"""
+        tester = self.new_tester()
+        customer = {
+            "email": f"loadCustomer{uuid.uuid4().hex[:12]}@commonsoultester.com",
+            "password": "TestPassword123!",
+            "name": "Load Test Customer",
+            "role": "CUSTOMER"
+        }
+
+        ok = False
+        try:
+            response = tester.make_request('POST', '/api/auth/register', json=customer)
+            if response.status_code == 201:
+                tester.auth_token = response.json()['token']
+                self.think()
+
+                response = tester.make_request('GET', '/api/healers')
+                if response.status_code == 200:
+                    healers = response.json()
+                    self.think()
+
+                    if healers:
+                        healer = random.choice(healers)
+                        response = tester.make_request('GET', f"/api/healers/{healer['id']}/services")
+                    ok = response.status_code == 200
+            if not ok:
+                tester.log_issue("Load", "HIGH", f"Customer flow failed at {response.request.method} "
+                                 f"{response.request.path_url} -> {response.status_code}")
+        except Exception as e:
+            tester.log_issue("Load", "CRITICAL", "Customer flow crashed", str(e))
+        self.finish_flow("customer", ok, tester)
+
+    def run_user(self, kind: str, start_delay: float):
+        time.sleep(start_delay)
+        for _ in range(self.iterations):
+            if kind == "healer":
+                self.run_healer()
+            else:
+                self.run_customer()
+
+    def run_load_test(self) -> Dict[str, Any]:
+        """Ramp up all virtual users, wait for them to finish and report"""
+        users = ["healer"] * self.healers + ["customer"] * self.customers
+        random.shuffle(users)
+        if not users:
+            raise ValueError("Load test needs at least one healer or customer")
+
+        logger.info(f"🚀 Load test: {self.healers} healers + {self.customers} customers, "
+                    f"ramp-up {self.ramp_up}s, think time {self.think_time}s, "
+                    f"{self.iterations} iteration(s) against {self.base_url or 'production'}")
+
+        # Per-request INFO logging would swamp the output under load
+        logger.setLevel(logging.WARNING)
+        step = self.ramp_up / len(users)
+        self.recorder = LatencyRecorder()
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(users)) as executor:
+                futures = [executor.submit(self.run_user, kind, i * step) for i, kind in enumerate(users)]
+                for future in futures:
+                    future.result()
+        finally:
+            self.recorder.stop()
+            logger.setLevel(logging.INFO)
+
+        return self.generate_load_report()
+
+    def generate_load_report(self) -> Dict[str, Any]:
+        summary = self.recorder.summary()
+        budget_violations = self.recorder.check_budgets(self.latency_budgets, summary)
+
+        logger.info("=" * 100)
+        logger.info("HEALER SIGNUP LOAD TEST REPORT")
+        logger.info("=" * 100)
+        logger.info(f"Duration: {summary['duration_seconds']}s   Requests: {summary['total_requests']}   "
+                    f"Errors: {summary['total_errors']}   Throughput: {summary['throughput_rps']} req/s")
+        for kind, counts in self.flows.items():
+            logger.info(f"{kind.capitalize()} flows: {counts['completed']} completed, {counts['failed']} failed")
+        logger.info("")
+
+        logger.info(f"{'endpoint':<52} {'reqs':>6} {'errs':>5} {'rps':>7} {'p50':>8} {'p95':>8} {'p99':>8}")
+        logger.info("-" * 100)
+        for key, stats in summary["endpoints"].items():
+            logger.info(f"{key:<52} {stats['requests']:>6} {stats['errors']:>5} {stats['throughput_rps']:>7} "
+                        f"{stats['p50_ms']:>7.0f}ms {stats['p95_ms']:>6.0f}ms {stats['p99_ms']:>6.0f}ms")
+        logger.info("=" * 100)
+        log_budget_violations(logger, budget_violations)
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        report_file = f"healer_load_test_report_{timestamp}.json"
+
+        report_data = {
+            "load_profile": {
+                "base_url": self.base_url or "https://backend-production-5e29.up.railway.app",
+                "healers": self.healers,
+                "customers": self.customers,
+                "ramp_up_seconds": self.ramp_up,
+                "think_time_seconds": self.think_time,
+                "iterations": self.iterations
+            },
+            "flows": self.flows,
+            "latency": summary,
+            "latency_budget_violations": budget_violations,
+            "issues_found": self.issues_found,
+            "test_timestamp": datetime.now().isoformat()
+        }
+
+        with open(report_file, 'w') as f:
+            json.dump(report_data, f, indent=2)
+
+        logger.info(f"Load test report saved to: {report_file}")
+        return report_data
+
+
+class HealerWorkflowSoakTester:
+    """Hold a fixed request rate for hours and watch for latency, error or size drift"""
+
+    # (weight, method, endpoint pattern); {id} is filled with one of the seeded healers
+    REQUEST_MIX = [
+        (30, 'GET', '/api/healers'),
+        (20, 'GET', '/api/healers/{id}'),
+        (20, 'GET', '/api/healers/{id}/services'),
+        (15, 'GET', '/api/healers/{id}/availability'),
+        (10, 'GET', '/api/services'),
+        (5, 'POST', '/api/auth/register')
+    ]
+
+    def __init__(self, base_url: str = None, rate: float = 5.0, duration: float = 3600.0,
+                 window: float = 60.0, workers: int = 16, seed_healers: int = 5,
+                 baseline_windows: int = 3, degradation_factor: float = 1.5,
+                 consecutive_windows: int = 3, error_rate_increase: float = 0.02):
+        self.base_url = base_url
+        self.rate = rate
+        self.duration = duration
+        self.window = window
+        self.workers = workers
+        self.seed_healers = seed_healers
+        self.baseline_windows = baseline_windows
+        self.degradation_factor = degradation_factor
+        self.consecutive_windows = consecutive_windows
+        self.error_rate_increase = error_rate_increase
+
+        self.client = HealerWorkflowTester(base_url=base_url)
+        self.client.session = create_session(retries=0, pool_size=workers)
+
+        self.healer_ids = []
+        self.windows = []
+        self.degradations = []
+        self.active_degradations = set()
+        self.lag_lock = threading.Lock()
+        self.window_lag = []
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.windows_file = f"healer_soak_windows_{timestamp}.jsonl"
+        self.report_file = f"healer_soak_report_{timestamp}.json"
+
+    def seed(self):
+        """Register the healers (with a service and availability) that the read traffic targets"""
+        for _ in range(self.seed_healers):
+            tester = HealerWorkflowTester(base_url=self.base_url)
+            tester.test_healer["email"] = f"soakHealer{uuid.uuid4().hex[:12]}@commonsoultester.com"
+            if tester.test_healer_registration():
+                tester.test_service_management()
+                tester.test_availability_system()
+                self.healer_ids.append(tester.healer_id)
+
+        if not self.healer_ids:
+            raise RuntimeError("Could not register any soak test healers")
+
+    def send_one(self, scheduled_at: float):
+        with self.lag_lock:
+            self.window_lag.append(time.perf_counter() - scheduled_at)
+
+        _, method, endpoint = random.choices(self.REQUEST_MIX, weights=[m[0] for m in self.REQUEST_MIX])[0]
+        kwargs = {}
+        if '{id}' in endpoint:
+            endpoint = endpoint.replace('{id}', random.choice(self.healer_ids))
+        if endpoint == '/api/auth/register':
+            kwargs['json'] = dict(self.client.test_healer, role="CUSTOMER", name="Soak Test Customer",
+                                  email=f"soakCustomer{uuid.uuid4().hex[:12]}@commonsoultester.com")
+
+        try:
+            self.client.make_request(method, endpoint, **kwargs)
+        except requests.exceptions.RequestException:
+            pass  # Recorded as an error by the latency recorder
+
+    def close_window(self, recorder: LatencyRecorder, index: int) -> Dict[str, Any]:
+        recorder.stop()
+        summary = recorder.summary()
+        with self.lag_lock:
+            lag, self.window_lag = self.window_lag, []
+        self.client.issues_found.clear()
+
+        total = summary["total_requests"]
+        window = {
+            "window": index,
+            "ended_at": datetime.now().isoformat(),
+            "requests": total,
+            "errors": summary["total_errors"],
+            "error_rate": round(summary["total_errors"] / total, 4) if total else 0.0,
+            "throughput_rps": summary["throughput_rps"],
+            "p95_ms": summary["p95_ms"],
+            "max_schedule_lag_ms": round(max(lag) * 1000, 1) if lag else 0.0,
+            "endpoints": {key: {field: stats[field] for field in
+                                ("requests", "errors", "p50_ms", "p95_ms", "p99_ms", "avg_bytes")}
+                          for key, stats in summary["endpoints"].items()}
+        }
+
+        with open(self.windows_file, 'a') as f:
+            f.write(json.dumps(window) + "\n")
+        self.windows.append(window)
+
+        events = self.detect_degradation()
+        flag = f"  ⚠ {'; '.join(e['description'] for e in events)}" if events else ""
+        logger.warning(f"[window {index}] {total} reqs, {window['error_rate']:.1%} errors, "
+                       f"p95 {window['p95_ms']}ms, lag {window['max_schedule_lag_ms']}ms{flag}")
+        return window
+
+    def baseline(self, key: str = None, field: str = "p95_ms"):
+        """Median of `field` over the first baseline windows, overall or for one endpoint"""
+        values = []
+        for window in self.windows[:self.baseline_windows]:
+            source = window if key is None else window["endpoints"].get(key, {})
+            if source.get(field) is not None:
+                values.append(source[field])
+        return sorted(values)[len(values) // 2] if values else None
+
+    def sustained(self, key: str, field: str, limit: float) -> bool:
+        recent = self.windows[-self.consecutive_windows:]
+        if len(recent) < self.consecutive_windows:
+            return False
+        for window in recent:
+            source = window if key is None else window["endpoints"].get(key, {})
+            if source.get(field) is None or source[field] <= limit:
+                return False
+        return True
+
+    def detect_degradation(self) -> List[Dict[str, Any]]:
+        """Flag p95, size or error rate that stays above the baseline for consecutive windows"""
+        if len(self.windows) < self.baseline_windows + self.consecutive_windows:
+            return []
+
+        events = []
+        checks = [(None, "p95_ms", self.degradation_factor), (None, "error_rate", None)]
+        checks += [(key, field, self.degradation_factor)
+                   for key in self.windows[-1]["endpoints"] for field in ("p95_ms", "avg_bytes")]
+
+        for key, field, factor in checks:
+            base = self.baseline(key, field)
+            if base is None:
+                continue
+            limit = base + self.error_rate_increase if factor is None else base * factor
+            if not limit or not self.sustained(key, field, limit):
+                self.active_degradations.discard((key, field))
+                continue
+
+            # Report each drift once when it starts, not again for every window it lasts
+            if (key, field) not in self.active_degradations:
+                self.active_degradations.add((key, field))
+                current = (self.windows[-1] if key is None else self.windows[-1]["endpoints"][key])[field]
+                event = {
+                    "window": self.windows[-1]["window"],
+                    "endpoint": key or "overall",
+                    "metric": field,
+                    "baseline": base,
+                    "current": current,
+                    "description": f"{key or 'overall'} {field} {current} vs baseline {base}"
+                }
+                events.append(event)
+                self.degradations.append(event)
+        return events
+
+    def run_soak_test(self) -> Dict[str, Any]:
+        """Open-loop run: requests are issued on a fixed schedule regardless of how slow replies are"""
+        logger.info(f"🚀 Soak test: {self.rate} req/s for {self.duration / 3600:.2f}h, "
+                    f"{self.window:.0f}s windows against {self.base_url or 'production'}")
+        logger.info(f"Windows are appended to {self.windows_file}")
+
+        self.seed()
+        logger.setLevel(logging.WARNING)
+
+        interval = 1.0 / self.rate
+        started = time.perf_counter()
+        window_index = 1
+        window_ends = started + self.window
+        self.client.latency_recorder = LatencyRecorder()
+        sent = 0
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                while True:
+                    scheduled_at = started + sent * interval
+                    if scheduled_at - started >= self.duration:
+                        break
+
+                    now = time.perf_counter()
+                    if now >= window_ends:
+                        recorder, self.client.latency_recorder = self.client.latency_recorder, LatencyRecorder()
+                        self.close_window(recorder, window_index)
+                        window_index += 1
+                        window_ends += self.window
+
+                    if scheduled_at > now:
+                        time.sleep(min(scheduled_at, window_ends) - now)
+                        continue
+
+                    executor.submit(self.send_one, scheduled_at)
+                    sent += 1
+        except KeyboardInterrupt:
+            logger.warning("Soak test interrupted, writing report for completed windows")
+        finally:
+            self.close_window(self.client.latency_recorder, window_index)
+            logger.setLevel(logging.INFO)
+
+        return self.generate_soak_report(time.perf_counter() - started)
+
+    def generate_soak_report(self, elapsed: float) -> Dict[str, Any]:
+        p95_series = [w["p95_ms"] for w in self.windows if w["p95_ms"] is not None]
+        first, last = (p95_series[0], p95_series[-1]) if p95_series else (None, None)
+
+        logger.info("=" * 80)
+        logger.info("HEALER SIGNUP SOAK TEST REPORT")
+        logger.info("=" * 80)
+        logger.info(f"Duration: {elapsed / 60:.1f} min   Windows: {len(self.windows)}   "
+                    f"Requests: {sum(w['requests'] for w in self.windows)}   "
+                    f"Errors: {sum(w['errors'] for w in self.windows)}")
+        logger.info(f"p95 first window: {first}ms   last window: {last}ms   "
+                    f"baseline: {self.baseline()}ms")
+
+        if self.degradations:
+            logger.error(f"DEGRADATION DETECTED ({len(self.degradations)} events):")
+            for event in self.degradations[:20]:
+                logger.error(f"  • window {event['window']}: {event['description']}")
+        else:
+            logger.info("✓ No sustained degradation detected")
+        logger.info("=" * 80)
+
+        report_data = {
+            "soak_profile": {
+                "base_url": self.base_url or "https://backend-production-5e29.up.railway.app",
+                "rate_rps": self.rate,
+                "duration_seconds": self.duration,
+                "window_seconds": self.window,
+                "seed_healers": len(self.healer_ids),
+                "baseline_windows": self.baseline_windows,
+                "degradation_factor": self.degradation_factor,
+                "consecutive_windows": self.consecutive_windows
+            },
+            "elapsed_seconds": round(elapsed, 1),
+            "windows_file": self.windows_file,
+            "windows": len(self.windows),
+            "p95_ms_by_window": p95_series,
+            "degradations": self.degradations,
+            "test_timestamp": datetime.now().isoformat()
+        }
+
+        with open(self.report_file, 'w') as f:
+            json.dump(report_data, f, indent=2)
+
+        logger.info(f"Soak test report saved to: {self.report_file}")
+        return report_data
+
 
 def main():
+    parser = argparse.ArgumentParser(description="Healer signup workflow tester")
+    parser.add_argument('--base-url', help="backend to test (default: production)")
+    parser.add_argument('--frontend-url', help="frontend to check for placeholders (default: production)")
+    parser.add_argument('--load', action='store_true',
+                        help="run many virtual healers and customers concurrently")
+    parser.add_argument('--healers', type=int, default=10, help="virtual healers in load mode")
+    parser.add_argument('--customers', type=int, default=10, help="virtual customers in load mode")
+    parser.add_argument('--ramp-up', type=float, default=10.0,
+                        help="seconds over which virtual users are started")
+    parser.add_argument('--think-time', type=float, default=1.0,
+                        help="average pause in seconds between a virtual user's steps")
+    parser.add_argument('--iterations', type=int, default=1, help="flows each virtual user runs")
+    parser.add_argument('--soak', action='store_true',
+                        help="hold a fixed request rate for a long time and watch for degradation")
+    parser.add_argument('--rate', type=float, default=5.0, help="requests per second in soak mode")
+    parser.add_argument('--duration-hours', type=float, default=1.0, help="soak test length")
+    parser.add_argument('--window', type=float, default=60.0, help="seconds per soak summary window")
+    parser.add_argument('--latency-budgets', help="JSON file of per-endpoint latency budgets "
+                                                  "(default: latency-budgets.json)")
+    args = parser.parse_args()
+    budgets = load_budgets(args.latency_budgets)
+
+    if args.soak:
+        print("HEALER SIGNUP SOAK TEST")
+        print("=" * 50)
+        soak_tester = HealerWorkflowSoakTester(
+            base_url=args.base_url, rate=args.rate,
+            duration=args.duration_hours * 3600, window=args.window
+        )
+        report = soak_tester.run_soak_test()
+        if report["degradations"]:
+            sys.exit(1)
+        return
+
+    if args.load:
+        print("HEALER SIGNUP LOAD TEST")
+        print("=" * 50)
+        load_tester = HealerWorkflowLoadTester(
+            base_url=args.base_url, healers=args.healers, customers=args.customers,
+            ramp_up=args.ramp_up, think_time=args.think_time, iterations=args.iterations,
+            latency_budgets=budgets
+        )
+        try:
+            report = load_tester.run_load_test()
+        except KeyboardInterrupt:
+            print("\n⚠ Load test interrupted by user")
+            return
+        if report["latency_budget_violations"]:
+            sys.exit(1)
+        return
+
     print("HEALER SIGNUP WORKFLOW TESTER")
     print("=" * 50)
     print("Testing complete healer onboarding process...")
     print("Checking for dead ends, placeholders, and fake information...")
     print("")
 
-    tester = HealerWorkflowTester()
+    tester = HealerWorkflowTester(base_url=args.base_url, latency_budgets=budgets,
+                                  frontend_url=args.frontend_url)
 
     try:
-        tester.run_full_workflow_test()
+        report = tester.run_full_workflow_test()
         print("\n✓ Healer workflow testing completed!")
         print("Check the log output above for detailed results.")
+        if report["latency_budget_violations"]:
+            print("❌ API latency budgets exceeded")
+            sys.exit(1)
 
     except KeyboardInterrupt:
         print("\n⚠ Testing interrupted by user")
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+WORKFLOW LATENCY RECORDING
+Per-endpoint latency histograms for the healer workflow testers, with the
+request split into DNS, connect (TCP + TLS), time to first byte and download
+where the connection was opened by that request, and latency budgets that
+fail a run when exceeded.
+
+    recorder = LatencyRecorder()
+    response = recorder.timed_request(session, 'GET', base_url + '/api/healers', '/api/healers')
+    violations = recorder.check_budgets(load_budgets())
+"""
+
+import bisect
+import json
+import os
+import re
+import socket
+import threading
+import time
+from typing import Any, Dict, List
+
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+PHASES = ['dns', 'connect', 'ttfb', 'download']
+BUDGET_FIELDS = ['p50_ms', 'p95_ms', 'p99_ms', 'max_ms', 'error_rate']
+DEFAULT_BUDGETS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'latency-budgets.json')
+
+ID_SEGMENT = re.compile(r'^(\d+|[0-9a-f]{8}-[0-9a-f-]{27}|(?=[a-z0-9]*\d)[a-z0-9]{20,})$', re.IGNORECASE)
+
+_connection = threading.local()
+_phase_timers_installed = False
+_install_lock = threading.Lock()
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Collapse record IDs so latency is grouped per route, e.g. /api/healers/{id}/services"""
+    path = endpoint.split('?', 1)[0]
+    return '/'.join('{id}' if ID_SEGMENT.match(part) else part for part in path.split('/'))
+
+
+def percentile_ms(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of second values, in milliseconds"""
+    ordered = sorted(values)
+    rank = max(1, int(round(pct / 100 * len(ordered))))
+    return ordered[rank - 1] * 1000
+
+
+def install_phase_timers():
+    """Patch socket/urllib3 connection setup once so new connections report DNS and connect time"""
+    global _phase_timers_installed
+    with _install_lock:
+        if _phase_timers_installed:
+            return
+        _phase_timers_installed = True
+
+    import urllib3.connection
+
+    original_getaddrinfo = socket.getaddrinfo
+    original_new_conn = urllib3.connection.HTTPConnection._new_conn
+    original_https_connect = urllib3.connection.HTTPSConnection.connect
+
+    def timed(key, func):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                acc = getattr(_connection, 'phases', None)
+                if acc is not None:
+                    acc[key] += time.perf_counter() - start
+        return wrapper
+
+    socket.getaddrinfo = timed('dns', original_getaddrinfo)
+    urllib3.connection.HTTPConnection._new_conn = timed('tcp', original_new_conn)
+    urllib3.connection.HTTPSConnection.connect = timed('https', original_https_connect)
+
+
+class LatencyRecorder:
+    """Thread-safe request latencies and phase timings, grouped by method and endpoint template"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples = {}
+        self.phases = {}
+        self.errors = {}
+        self.sizes = {}
+        self.started_at = time.perf_counter()
+        self.finished_at = None
+        install_phase_timers()
+
+    def record(self, method: str, endpoint: str, seconds: float, status=None, phases=None, size=None):
+        key = f"{method} {endpoint_template(endpoint)}"
+        failed = status is None or status >= 500
+        with self.lock:
+            self.samples.setdefault(key, []).append(seconds)
+            if size is not None:
+                self.sizes[key] = self.sizes.get(key, 0) + size
+            if phases:
+                for phase, value in phases.items():
+                    self.phases.setdefault(key, {}).setdefault(phase, []).append(value)
+            if failed:
+                self.errors[key] = self.errors.get(key, 0) + 1
+
+    def timed_request(self, session, method: str, url: str, endpoint: str, **kwargs):
+        """session.request() with the total time and its phases recorded under `endpoint`"""
+        caller_streams = kwargs.get('stream', False)
+        kwargs['stream'] = True
+        acc = _connection.phases = {'dns': 0.0, 'tcp': 0.0, 'https': 0.0}
+
+        start = time.perf_counter()
+        try:
+            response = session.request(method, url, **kwargs)
+            headers_at = time.perf_counter()
+            if not caller_streams:
+                response.content  # Read the body here so download time is measured
+        except Exception:
+            self.record(method, endpoint, time.perf_counter() - start)
+            raise
+        finally:
+            _connection.phases = None
+        done = time.perf_counter()
+
+        # HTTPS connect() wraps the TCP connect; both include the DNS lookup
+        connect = (acc['https'] or acc['tcp']) - acc['dns']
+        phases = {
+            'ttfb': max(0.0, headers_at - start - acc['dns'] - max(0.0, connect)),
+            'download': done - headers_at
+        }
+        if acc['tcp']:
+            phases['dns'] = acc['dns']
+            phases['connect'] = max(0.0, connect)
+
+        size = int(response.headers.get('Content-Length') or 0) if caller_streams else len(response.content)
+        self.record(method, endpoint, done - start, response.status_code, phases, size)
+        return response
+
+    def stop(self):
+        self.finished_at = time.perf_counter()
+
+    @staticmethod
+    def histogram(values: List[float]) -> Dict[str, Any]:
+        counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        for value in values:
+            counts[bisect.bisect_left(LATENCY_BUCKETS_MS, value * 1000)] += 1
+        return {"buckets_ms": list(LATENCY_BUCKETS_MS) + ["+Inf"], "counts": counts}
+
+    def summary(self) -> Dict[str, Any]:
+        elapsed = (self.finished_at or time.perf_counter()) - self.started_at
+        with self.lock:
+            endpoints = {}
+            for key, values in sorted(self.samples.items()):
+                phases = self.phases.get(key, {})
+                endpoints[key] = {
+                    "requests": len(values),
+                    "errors": self.errors.get(key, 0),
+                    "error_rate": round(self.errors.get(key, 0) / len(values), 4),
+                    "throughput_rps": round(len(values) / elapsed, 2) if elapsed else 0.0,
+                    "p50_ms": round(percentile_ms(values, 50), 1),
+                    "p95_ms": round(percentile_ms(values, 95), 1),
+                    "p99_ms": round(percentile_ms(values, 99), 1),
+                    "max_ms": round(max(values) * 1000, 1),
+                    "avg_bytes": round(self.sizes.get(key, 0) / len(values)),
+                    "phases_p50_ms": {phase: round(percentile_ms(phases[phase], 50), 1)
+                                      for phase in PHASES if phases.get(phase)},
+                    "histogram": self.histogram(values)
+                }
+            total = sum(len(values) for values in self.samples.values())
+            all_values = [value for values in self.samples.values() for value in values]
+
+        return {
+            "duration_seconds": round(elapsed, 2),
+            "total_requests": total,
+            "total_errors": sum(e["errors"] for e in endpoints.values()),
+            "throughput_rps": round(total / elapsed, 2) if elapsed else 0.0,
+            "p95_ms": round(percentile_ms(all_values, 95), 1) if all_values else None,
+            "endpoints": endpoints
+        }
+
+    def check_budgets(self, budgets: Dict[str, Dict[str, float]], summary=None) -> List[Dict[str, Any]]:
+        """Compare each endpoint against its budget (or the 'default' one); returns the violations"""
+        summary = summary or self.summary()
+        violations = []
+        for key, stats in summary["endpoints"].items():
+            budget = budgets.get(key, budgets.get("default", {}))
+            for field in BUDGET_FIELDS:
+                if field in budget and stats[field] > budget[field]:
+                    violations.append({
+                        "endpoint": key,
+                        "metric": field,
+                        "budget": budget[field],
+                        "actual": stats[field]
+                    })
+        return violations
+
+    def log_summary(self, logger, summary=None):
+        summary = summary or self.summary()
+        logger.info(f"{'endpoint':<52} {'reqs':>5} {'errs':>5} {'p50':>8} {'p95':>8} {'p99':>8}   "
+                    f"{'dns':>6} {'conn':>6} {'ttfb':>6}")
+        logger.info("-" * 120)
+        for key, stats in summary["endpoints"].items():
+            phases = stats["phases_p50_ms"]
+            phase_cells = ' '.join(f"{phases[p]:>5.0f}ms" if p in phases else f"{'-':>7}"
+                                   for p in ('dns', 'connect', 'ttfb'))
+            logger.info(f"{key:<52} {stats['requests']:>5} {stats['errors']:>5} "
+                        f"{stats['p50_ms']:>6.0f}ms {stats['p95_ms']:>6.0f}ms {stats['p99_ms']:>6.0f}ms  "
+                        f"{phase_cells}")
+
+
+def load_budgets(path: str = None) -> Dict[str, Dict[str, float]]:
+    """Read latency budgets keyed by 'METHOD /endpoint/template' (plus 'default'); {} if absent"""
+    path = path or DEFAULT_BUDGETS_FILE
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def log_budget_violations(logger, violations: List[Dict[str, Any]]):
+    if not violations:
+        logger.info("✓ All endpoints within latency budgets")
+        return
+    logger.error(f"LATENCY BUDGETS EXCEEDED ({len(violations)}):")
+    for v in violations:
+        logger.error(f"  • {v['endpoint']}: {v['metric']} {v['actual']} > budget {v['budget']}")
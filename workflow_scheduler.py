@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+WORKFLOW CHECK SCHEDULER
+Run workflow test checks concurrently while respecting their dependencies, so
+a validation pass takes as long as its longest dependency chain rather than
+the sum of every check.
+
+    checks = [
+        Check('healer_registration', validator.test_healer_registration_flow),
+        Check('healer_discovery', validator.test_healer_discovery, after=['healer_registration']),
+        Check('frontend_pages', validator.test_frontend_pages),
+    ]
+    results = run_checks(checks, max_workers=8)
+
+`needs` lists checks that must have passed (the check is skipped otherwise);
+`after` lists checks that only have to finish first, e.g. because they set an
+auth token the later check uses when it is available.
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class Check:
+    """One schedulable test step"""
+
+    def __init__(self, name: str, func: Callable, needs: List[str] = (), after: List[str] = ()):
+        self.name = name
+        self.func = func
+        self.needs = list(needs)
+        self.after = list(after)
+
+    @property
+    def depends_on(self) -> List[str]:
+        return self.needs + self.after
+
+
+class CheckResult:
+    def __init__(self, name: str, status: str, seconds: float = 0.0, value=None, error: str = None):
+        self.name = name
+        self.status = status  # passed | failed | error | skipped
+        self.seconds = seconds
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "passed"
+
+    def to_dict(self) -> Dict:
+        return {"status": self.status, "seconds": round(self.seconds, 3), "error": self.error}
+
+
+def validate_checks(checks: List[Check]):
+    """Reject unknown dependencies and cycles before anything runs"""
+    names = {check.name for check in checks}
+    if len(names) != len(checks):
+        raise ValueError("Check names must be unique")
+    for check in checks:
+        unknown = set(check.depends_on) - names
+        if unknown:
+            raise ValueError(f"Check '{check.name}' depends on unknown checks: {', '.join(sorted(unknown))}")
+
+    remaining = {check.name: set(check.depends_on) for check in checks}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"Dependency cycle between checks: {', '.join(sorted(remaining))}")
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+
+def _run_one(check: Check) -> CheckResult:
+    start = time.perf_counter()
+    try:
+        value = check.func()
+    except Exception as e:
+        return CheckResult(check.name, "error", time.perf_counter() - start, error=str(e))
+    status = "failed" if value is False else "passed"
+    return CheckResult(check.name, status, time.perf_counter() - start, value=value)
+
+
+def run_checks(checks: List[Check], max_workers: int = 8) -> Dict[str, CheckResult]:
+    """Run every check as soon as its dependencies are done; results keep the declared order"""
+    validate_checks(checks)
+
+    results = {}
+    pending = {check.name: check for check in checks}
+    running = {}
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        while pending or running:
+            for name, check in list(pending.items()):
+                if not all(dep in results for dep in check.depends_on):
+                    continue
+                del pending[name]
+
+                failed_needs = [dep for dep in check.needs if not results[dep].ok]
+                if failed_needs:
+                    results[name] = CheckResult(name, "skipped", error=f"needs {', '.join(failed_needs)}")
+                    logger.warning(f"Skipping {name}: {results[name].error}")
+                    continue
+                running[executor.submit(_run_one, check)] = name
+
+            if not running:
+                continue  # Skips above may have unblocked more checks
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                results[running.pop(future)] = result
+                if result.status == "error":
+                    logger.error(f"Check {result.name} crashed: {result.error}")
+
+    elapsed = time.perf_counter() - started
+    serial = sum(result.seconds for result in results.values())
+    logger.info(f"⏱️ {len(checks)} checks finished in {elapsed:.2f}s "
+                f"(serial would be ~{serial:.2f}s, {max_workers} workers)")
+
+    return {check.name: results[check.name] for check in checks}
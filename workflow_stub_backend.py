@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+LOCAL WORKFLOW STUB BACKEND
+In-memory stand-in for the Common Soul API so the workflow testers can run
+load and latency tests on one machine instead of against production. It
+mimics the contracts the testers rely on (auth/register, healers, services,
+payments, availability) and can inject latency and errors.
+
+    python workflow_stub_backend.py --port 3001 --latency-ms 40 --jitter-ms 20 --error-rate 0.01
+    python test-healer-signup-workflow.py --load --base-url http://localhost:3001 \\
+        --frontend-url http://localhost:3001
+
+Any non-API GET is answered with a small SPA-style HTML shell (and /sitemap.xml
+with frontend/public/sitemap.xml) so the frontend page checks have a target.
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+SITEMAP_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'frontend', 'public', 'sitemap.xml')
+
+FRONTEND_SHELL = """<!doctype html>
+<html lang="en">
+<head><meta charset="utf-8"><title>The Common Soul (local stub)</title></head>
+<body>
+<nav><a href="/">Home</a> <a href="/healers">Healers</a> <a href="/about">About</a>
+<a href="/contact">Contact</a> <a href="/register">Register</a></nav>
+<div id="root"></div>
+</body>
+</html>
+"""
+
+WEEK_DAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+
+
+class StubError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class StubStore:
+    """Thread-safe in-memory users, healer profiles, services and availability"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.users = {}
+        self.emails = set()
+        self.tokens = {}
+        self.services = {}
+        self.availability = {}
+
+    @staticmethod
+    def new_id():
+        return 'c' + uuid.uuid4().hex[:24]
+
+    def register(self, data):
+        email = str(data.get('email', '')).strip().lower()
+        password = str(data.get('password', ''))
+        user_type = data.get('userType') or data.get('role')
+        first_name = data.get('firstName') or str(data.get('name', '')).split(' ')[0]
+        last_name = data.get('lastName') or ' '.join(str(data.get('name', '')).split(' ')[1:])
+
+        errors = []
+        if not re.match(r'^[^@\s]+@[^@\s]+\.[^@\s]+$', email):
+            errors.append({"msg": "Valid email required", "path": "email"})
+        if len(password) < 6:
+            errors.append({"msg": "Password must be at least 6 characters", "path": "password"})
+        if user_type not in ('HEALER', 'CUSTOMER'):
+            errors.append({"msg": "User type must be HEALER or CUSTOMER", "path": "userType"})
+        if not first_name:
+            errors.append({"msg": "First name is required", "path": "firstName"})
+        if errors:
+            raise StubError(400, {"errors": errors})
+
+        with self.lock:
+            if email in self.emails:
+                raise StubError(400, {"error": "Email already registered"})
+
+            user = {
+                "id": self.new_id(),
+                "email": email,
+                "userType": user_type,
+                "role": user_type,
+                "name": f"{first_name} {last_name}".strip(),
+                "firstName": first_name,
+                "lastName": last_name,
+                "createdAt": datetime.now().isoformat()
+            }
+            token = uuid.uuid4().hex
+            self.users[user["id"]] = user
+            self.emails.add(email)
+            self.tokens[token] = user["id"]
+            if user_type == 'HEALER':
+                self.services[user["id"]] = []
+                self.availability[user["id"]] = {day: {"available": False} for day in WEEK_DAYS}
+
+        return {"message": "User registered successfully", "user": user, "token": token}
+
+    def user_for_token(self, token):
+        with self.lock:
+            user_id = self.tokens.get(token)
+            return self.users.get(user_id) if user_id else None
+
+    def healer(self, healer_id):
+        with self.lock:
+            user = self.users.get(healer_id)
+        if not user or user["userType"] != 'HEALER':
+            raise StubError(404, {"error": "Healer not found"})
+        return user
+
+    def healers(self):
+        with self.lock:
+            return [user for user in self.users.values() if user["userType"] == 'HEALER']
+
+    def update_healer(self, healer_id, data):
+        user = self.healer(healer_id)
+        with self.lock:
+            for key, value in data.items():
+                if key not in ('id', 'email', 'userType', 'role'):
+                    user[key] = value
+            return dict(user)
+
+    def create_service(self, healer_id, data):
+        self.healer(healer_id)
+        service = dict(data, id=self.new_id(), healerId=healer_id)
+        with self.lock:
+            self.services[healer_id].append(service)
+        return service
+
+    def update_service(self, healer_id, service_id, data):
+        self.healer(healer_id)
+        with self.lock:
+            for service in self.services[healer_id]:
+                if service["id"] == service_id:
+                    service.update({k: v for k, v in data.items() if k not in ('id', 'healerId')})
+                    return dict(service)
+        raise StubError(404, {"error": "Service not found"})
+
+    def all_services(self):
+        with self.lock:
+            return [dict(service) for services in self.services.values() for service in services]
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server_version = 'CommonSoulStub/1.0'
+    # Headers and body go out as two small writes on a kept-alive connection; with Nagle on, the
+    # body waits for the client's delayed ACK (~40 ms) and swamps the latency being measured
+    disable_nagle_algorithm = True
+
+    # -- plumbing -------------------------------------------------------------
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def send_body(self, status, body, content_type='application/json'):
+        payload = body if isinstance(body, bytes) else json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(payload)
+
+    def read_json(self):
+        if not self.body:
+            return {}
+        try:
+            return json.loads(self.body)
+        except ValueError:
+            raise StubError(400, {"error": "Invalid JSON body"})
+
+    def current_user(self, required=True):
+        header = self.headers.get('Authorization', '')
+        user = self.server.store.user_for_token(header[7:]) if header.startswith('Bearer ') else None
+        if required and not user:
+            raise StubError(401, {"error": "Access token required"})
+        return user
+
+    def inject_faults(self):
+        """Sleep for the configured latency; returns True when this request should fail"""
+        latency = self.server.latency_ms + random.uniform(-self.server.jitter_ms, self.server.jitter_ms)
+        if latency > 0:
+            time.sleep(latency / 1000)
+        return random.random() < self.server.error_rate
+
+    def handle_method(self):
+        path = urlparse(self.path).path.rstrip('/') or '/'
+
+        # Always drain the body so an injected failure cannot desync a kept-alive connection
+        length = int(self.headers.get('Content-Length') or 0)
+        self.body = self.rfile.read(length) if length else b''
+
+        if path.startswith('/api/') and self.inject_faults():
+            self.send_body(500, {"error": "Injected failure"})
+            return
+
+        try:
+            status, body = self.route(self.command, path)
+        except StubError as e:
+            status, body = e.status, e.message
+        except Exception as e:
+            status, body = 500, {"error": "Internal server error", "details": str(e)}
+
+        if isinstance(body, str):
+            self.send_body(status, body.encode('utf-8'),
+                           'application/xml' if path.endswith('.xml') else 'text/html; charset=utf-8')
+        else:
+            self.send_body(status, body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = handle_method
+
+    # -- routes ---------------------------------------------------------------
+
+    def route(self, method, path):
+        store = self.server.store
+        parts = path.strip('/').split('/')
+
+        if not path.startswith('/api/'):
+            if method not in ('GET', 'HEAD'):
+                raise StubError(404, {"error": "Route not found"})
+            if path == '/sitemap.xml' and os.path.exists(SITEMAP_FILE):
+                with open(SITEMAP_FILE, 'r', encoding='utf-8') as f:
+                    return 200, f.read()
+            return 200, FRONTEND_SHELL
+
+        if path == '/api/auth/register' and method == 'POST':
+            return 201, store.register(self.read_json())
+
+        if path == '/api/healers' and method == 'GET':
+            return 200, store.healers()
+
+        if path == '/api/services' and method == 'GET':
+            return 200, store.all_services()
+
+        if path == '/api/payments' and method == 'GET':
+            return 200, {
+                "status": "Payment service operational",
+                "stripe": "not configured",
+                "timestamp": datetime.now().isoformat(),
+                "server": "Local stub"
+            }
+
+        if path == '/api/availability' and method == 'GET':
+            user = self.current_user()
+            if user["userType"] != 'HEALER':
+                raise StubError(403, {"error": "Only healers can access their availability"})
+            with store.lock:
+                return 200, {"healerId": user["id"], "availability": store.availability[user["id"]]}
+
+        if len(parts) >= 3 and parts[:2] == ['api', 'healers']:
+            return self.route_healer(method, parts[2], parts[3:])
+
+        raise StubError(404, {"error": "Route not found"})
+
+    def route_healer(self, method, healer_id, rest):
+        store = self.server.store
+        healer = store.healer(healer_id)
+
+        if not rest:
+            if method == 'GET':
+                return 200, healer
+            if method == 'PUT':
+                self.current_user()
+                return 200, store.update_healer(healer_id, self.read_json())
+
+        elif rest == ['services']:
+            if method == 'GET':
+                with store.lock:
+                    return 200, list(store.services[healer_id])
+            if method == 'POST':
+                self.current_user()
+                return 201, store.create_service(healer_id, self.read_json())
+
+        elif len(rest) == 2 and rest[0] == 'services' and method == 'PUT':
+            self.current_user()
+            return 200, store.update_service(healer_id, rest[1], self.read_json())
+
+        elif rest == ['availability']:
+            if method == 'GET':
+                with store.lock:
+                    return 200, dict(store.availability[healer_id])
+            if method == 'PUT':
+                self.current_user()
+                with store.lock:
+                    store.availability[healer_id].update(self.read_json())
+                    return 200, dict(store.availability[healer_id])
+
+        elif rest == ['payment-setup'] and method == 'GET':
+            return 200, {"stripeAccountId": None, "onboardingUrl": f"/stub/stripe/onboard/{healer_id}"}
+
+        elif rest == ['setup-payments'] and method == 'POST':
+            self.current_user()
+            return 201, {"accountLinkUrl": f"/stub/stripe/account-link/{healer_id}"}
+
+        elif len(rest) == 1 and rest[0] in ('dashboard', 'bookings', 'earnings', 'reviews') and method == 'GET':
+            empty = {"dashboard": {"upcomingSessions": 0, "totalEarnings": 0, "averageRating": None},
+                     "bookings": [], "earnings": {"total": 0, "pending": 0}, "reviews": []}
+            return 200, empty[rest[0]]
+
+        raise StubError(404, {"error": "Route not found"})
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0, verbose=False):
+        super().__init__(address, StubRequestHandler)
+        self.store = StubStore()
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.verbose = verbose
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in backend for the workflow testers")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=3001)
+    parser.add_argument('--latency-ms', type=float, default=0.0, help="added to every API response")
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help="random +/- spread around --latency-ms")
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help="fraction of API requests answered with HTTP 500")
+    parser.add_argument('--verbose', action='store_true', help="log every request")
+    args = parser.parse_args()
+
+    server = StubServer((args.host, args.port), args.latency_ms, args.jitter_ms, args.error_rate, args.verbose)
+
+    print("LOCAL WORKFLOW STUB BACKEND")
+    print("=" * 50)
+    print(f"Listening on http://{args.host}:{args.port}")
+    print(f"Latency: {args.latency_ms}ms +/- {args.jitter_ms}ms   Error rate: {args.error_rate:.1%}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStub backend stopped")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()